@@ -3,6 +3,10 @@ ASGI config for HireChain project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Run under an ASGI server (for example ``uvicorn HireChain.asgi:application``)
+so the notification event stream and long-poll views wait on the event loop
+instead of holding a worker thread each.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
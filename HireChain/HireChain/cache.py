@@ -0,0 +1,68 @@
+"""
+Cache profiles for HireChain.
+
+``cache_settings`` builds the ``default`` entry of CACHES from environment
+variables (or a ``.env`` file, read by python-decouple):
+
+    CACHE_BACKEND=locmem      Per-process memory (default)
+    CACHE_BACKEND=redis       Redis at CACHE_LOCATION (requires ``redis``)
+    CACHE_BACKEND=memcached   Memcached at CACHE_LOCATION (requires ``pymemcache``)
+    CACHE_BACKEND=file        Files under CACHE_LOCATION, shared by the processes of one host
+    CACHE_BACKEND=db          The database table CACHE_LOCATION (run ``createcachetable``)
+
+Only the per-process backend is unsuitable for data that several
+processes must agree on, such as the cached users of CachedModelBackend
+or cached sessions (see ``session_engine``).
+"""
+from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+}
+
+DEFAULT_LOCATIONS = {
+    'locmem': 'hirechain',
+    'redis': 'redis://127.0.0.1:6379/1',
+    'memcached': '127.0.0.1:11211',
+    'db': 'hirechain_cache',
+}
+
+# Backends whose entries are only seen by the process that wrote them
+PROCESS_LOCAL_BACKENDS = (
+    CACHE_BACKENDS['locmem'],
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_settings():
+    """The ``default`` cache for the profile named by CACHE_BACKEND"""
+    backend = config('CACHE_BACKEND', default='locmem')
+    if backend not in CACHE_BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unknown CACHE_BACKEND {backend!r}; expected one of {', '.join(CACHE_BACKENDS)}"
+        )
+    location = config('CACHE_LOCATION', default=DEFAULT_LOCATIONS.get(backend, ''))
+    if not location:
+        raise ImproperlyConfigured(f'CACHE_BACKEND={backend} needs CACHE_LOCATION')
+    return {'BACKEND': CACHE_BACKENDS[backend], 'LOCATION': location}
+
+
+def is_process_local(cache_config):
+    """True if entries in this CACHES entry are invisible to other processes"""
+    return cache_config['BACKEND'] in PROCESS_LOCAL_BACKENDS
+
+
+def session_engine(cache_config):
+    """
+    cached_db when ``cache_config`` is shared, plain db otherwise: with a
+    per-process cache a logout in one process would leave the session
+    cached, and valid, in every other one.
+    """
+    if is_process_local(cache_config):
+        return 'django.contrib.sessions.backends.db'
+    return 'django.contrib.sessions.backends.cached_db'
@@ -0,0 +1,102 @@
+"""
+Database profiles for HireChain.
+
+``database_settings`` builds the ``default`` entry of DATABASES from
+environment variables (or a ``.env`` file, read by python-decouple):
+
+    DB_ENGINE=sqlite      SQLite file at DB_NAME (default: db.sqlite3)
+    DB_ENGINE=postgres    PostgreSQL at DB_HOST/DB_PORT, optionally pooled
+
+SQLite connections are tuned by ``apply_sqlite_pragmas``, a
+``connection_created`` hook that runs the PRAGMAs listed under the
+database's ``PRAGMAS`` key each time Django opens a connection.
+"""
+from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Applied to every new SQLite connection, along with the cache and mmap
+# sizes. WAL lets readers run alongside the single writer; synchronous=NORMAL
+# is durable across application crashes in WAL mode and only fsyncs at
+# checkpoints.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+}
+
+
+def sqlite_settings(base_dir):
+    """SQLite with WAL, a busy timeout and write locks taken at BEGIN"""
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': config('DB_NAME', default=str(base_dir / 'db.sqlite3')),
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Seconds a writer waits for the lock before "database is locked"
+            'timeout': config('DB_BUSY_TIMEOUT', default=20, cast=int),
+            # Take the write lock when a transaction starts, so concurrent
+            # read-then-write transactions queue on the busy timeout instead of
+            # failing when they try to upgrade a read lock
+            'transaction_mode': config('DB_SQLITE_TRANSACTION_MODE', default='IMMEDIATE'),
+        },
+        'PRAGMAS': {
+            **SQLITE_PRAGMAS,
+            # A negative cache_size is in KiB rather than pages
+            'cache_size': -config('DB_SQLITE_CACHE_KB', default=64000, cast=int),
+            'mmap_size': config('DB_SQLITE_MMAP_MB', default=256, cast=int) * 1024 * 1024,
+        },
+    }
+
+
+def postgres_settings():
+    """
+    PostgreSQL, with a psycopg connection pool per process when DB_POOL is
+    set (requires ``psycopg[pool]``) and persistent connections otherwise.
+    """
+    pool = config('DB_POOL', default=False, cast=bool)
+    options = {}
+    if pool:
+        options['pool'] = {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            # Seconds a request waits for a free connection
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+        }
+    return {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': config('DB_NAME', default='hirechain'),
+        'USER': config('DB_USER', default='hirechain'),
+        'PASSWORD': config('DB_PASSWORD', default=''),
+        'HOST': config('DB_HOST', default='localhost'),
+        'PORT': config('DB_PORT', default='5432'),
+        # The pool manages connection lifetime itself and requires 0 here
+        'CONN_MAX_AGE': 0 if pool else config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': not pool,
+        'OPTIONS': options,
+    }
+
+
+def database_settings(base_dir):
+    """The ``default`` database for the profile named by DB_ENGINE"""
+    engine = config('DB_ENGINE', default='sqlite')
+    if engine == 'sqlite':
+        return sqlite_settings(base_dir)
+    if engine in ('postgres', 'postgresql'):
+        return postgres_settings()
+    raise ImproperlyConfigured(f"Unknown DB_ENGINE {engine!r}; expected 'sqlite' or 'postgres'")
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Run the database's PRAGMAS on each new SQLite connection"""
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = connection.settings_dict.get('PRAGMAS') or {}
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
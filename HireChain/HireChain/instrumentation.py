@@ -0,0 +1,194 @@
+"""
+Per-request timing for HireChain.
+
+ServerTimingMiddleware times a sample of requests and reports the total,
+view, SQL and template time in a ``Server-Timing`` header, which browser
+developer tools show next to each request. The numbers are collected in a
+context variable, so they follow a request across the threads that
+``sync_to_async`` and ``async_to_sync`` hop between, and unsampled
+requests cost one context variable lookup per query.
+"""
+import json
+import logging
+import random
+from contextvars import ContextVar
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """Counters collected while handling one request"""
+
+    def __init__(self, slow_query_ms):
+        self.started = perf_counter()
+        self.view_started = None
+        self.queries = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.slow_query_ms = slow_query_ms
+        self.slow_queries = []
+
+
+def time_query(execute, sql, params, many, context):
+    """Database execute wrapper that adds each query to the current request's timings"""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = perf_counter() - started
+        timings.queries += 1
+        timings.sql_time += elapsed
+        if timings.slow_query_ms is not None and elapsed * 1000 >= timings.slow_query_ms:
+            timings.slow_queries.append((elapsed, sql))
+
+
+def instrument(connection):
+    """Install ``time_query`` on a database connection once"""
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+def instrument_open_connections():
+    """Install ``time_query`` on this thread's already open connections"""
+    for connection in connections.all(initialized_only=True):
+        instrument(connection)
+
+
+@receiver(connection_created)
+def instrument_new_connection(sender, connection, **kwargs):
+    instrument(connection)
+
+
+class TimedTemplate:
+    """Wraps a backend template and adds its render time to the current request"""
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        if timings is None:
+            return self.template.render(context, request)
+        started = perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            timings.template_time += perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    Django template backend that records render time for Server-Timing.
+    Follows Open/Closed Principle - extends DjangoTemplates.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
+
+
+class ServerTimingMiddleware:
+    """
+    Time a sample of requests and add a Server-Timing header, if
+    SERVER_TIMING_HEADER allows, and a log line, if SERVER_TIMING_LOG does.
+    Should be the first middleware, so ``total`` covers the whole stack;
+    ``view`` runs from the view middleware phase until the response is back
+    here, so it includes the response phase of the inner middleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        # Connections opened before this module was imported
+        instrument_open_connections()
+
+    def _start(self):
+        if random.random() >= settings.SERVER_TIMING_SAMPLE_RATE:
+            return None, None
+        timings = RequestTimings(settings.SERVER_TIMING_SLOW_QUERY_MS)
+        return timings, _current.set(timings)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = self._start()
+        if timings is None:
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._finish(request, response, timings)
+        return response
+
+    async def __acall__(self, request):
+        timings, token = self._start()
+        if timings is None:
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._finish(request, response, timings)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _current.get()
+        if timings is not None:
+            timings.view_started = perf_counter()
+            # Under ASGI this runs on the thread that sync views and ORM calls use
+            instrument_open_connections()
+
+    def _finish(self, request, response, timings):
+        finished = perf_counter()
+        total_ms = (finished - timings.started) * 1000
+        view_ms = (finished - timings.view_started) * 1000 if timings.view_started else 0.0
+        db_ms = timings.sql_time * 1000
+        template_ms = timings.template_time * 1000
+
+        metrics = [
+            f'total;dur={total_ms:.1f}',
+            f'view;dur={view_ms:.1f}',
+            f'db;dur={db_ms:.1f};desc="{timings.queries} queries"',
+            f'tpl;dur={template_ms:.1f}',
+        ]
+        if settings.SERVER_TIMING_HEADER:
+            existing = response.get('Server-Timing')
+            response['Server-Timing'] = ', '.join(([existing] if existing else []) + metrics)
+
+        if settings.SERVER_TIMING_LOG:
+            logger.info(json.dumps({
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'total_ms': round(total_ms, 2),
+                'view_ms': round(view_ms, 2),
+                'db_ms': round(db_ms, 2),
+                'queries': timings.queries,
+                'template_ms': round(template_ms, 2),
+            }))
+        for elapsed, sql in timings.slow_queries:
+            logger.warning(
+                'Slow query (%.1fms) during %s %s: %s', elapsed * 1000, request.method, request.path, sql
+            )
@@ -12,6 +12,9 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 from pathlib import Path
 
+from .cache import cache_settings, session_engine
+from .database import database_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -41,9 +44,12 @@ INSTALLED_APPS = [
     'accounts',
     'jobs',
     'applications',
+    'taskqueue',
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the whole middleware stack
+    'HireChain.instrumentation.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -57,7 +63,8 @@ ROOT_URLCONF = 'HireChain.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates that records render time for Server-Timing
+        'BACKEND': 'HireChain.instrumentation.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -71,18 +78,46 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'HireChain.wsgi.application'
+ASGI_APPLICATION = 'HireChain.asgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# Chosen by DB_ENGINE ('sqlite' or 'postgres') and the other DB_* environment
+# variables described in HireChain/database.py. SQLite runs in WAL mode with
+# persistent connections; Postgres can use a connection pool (DB_POOL=True).
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_settings(BASE_DIR),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Chosen by CACHE_BACKEND (see HireChain/cache.py). The default is per
+# process; with several web processes or background workers use a shared
+# backend, which CachedModelBackend needs before it caches users at all
+
+CACHES = {
+    'default': cache_settings(),
 }
 
+# Seconds a serialized job detail payload stays cached
+JOB_DETAIL_CACHE_TIMEOUT = 60 * 60
+# The same with a per-process cache, which other processes' saves cannot
+# invalidate: the longest a changed or deactivated job is served stale
+JOB_DETAIL_LOCAL_CACHE_TIMEOUT = 5
+
+# Sessions
+# https://docs.djangoproject.com/en/6.0/topics/http/sessions/#configuring-the-session-engine
+# cached_db reads sessions from the cache and only falls back to the database
+# on a miss; it is only used with a shared cache (above), so a logout is seen
+# by every process, and plain db otherwise.
+# 'django.contrib.sessions.backends.signed_cookies' keeps them in the cookie
+# and needs no lookup at all.
+SESSION_ENGINE = session_engine(CACHES['default'])
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -126,6 +161,31 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# File storage
+# https://docs.djangoproject.com/en/6.0/ref/settings/#storages
+# Resumes are stored once per distinct content under resumes/ab/cd/<sha256>
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    'resumes': {
+        'BACKEND': 'applications.storage.ContentAddressedStorage',
+        'OPTIONS': {'prefix': 'resumes'},
+    },
+}
+
+# Resume downloads
+# None streams files from Django; 'x-sendfile' (Apache/lighttpd) or
+# 'x-accel-redirect' (nginx) hands the transfer to the web server
+RESUME_SENDFILE_BACKEND = None
+# nginx 'internal' location mapped to MEDIA_ROOT, used with x-accel-redirect
+RESUME_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+RESUME_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
 
@@ -135,6 +195,101 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
 # Authentication
+# Loads the per-request user from the cache instead of the custom_users table
+AUTHENTICATION_BACKENDS = ['accounts.backends.CachedModelBackend']
+# Seconds a logged-in user object stays cached (0 disables the cache).
+# Users are only cached in a shared cache, so that a change made in one
+# process (a role or is_active change, a worker bumping the unread counter)
+# drops the copy every process reads
+USER_CACHE_TIMEOUT = 300
 LOGIN_URL = '/accounts/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+# Job feed
+# Number of jobs per keyset page on the home feed and /api/jobs/
+JOBS_PAGE_SIZE = 20
+JOBS_PAGE_SIZE_MAX = 100
+# Number of ranked matches shown on the home page for a search
+JOBS_SEARCH_LIMIT = 50
+
+# Admin applications list
+# Rows per keyset page of /applications/api/applications/
+APPLICATIONS_PAGE_SIZE = 50
+APPLICATIONS_PAGE_SIZE_MAX = 200
+
+# Notification stream
+# Seconds between keep-alive comments on an idle event stream
+NOTIFICATION_STREAM_HEARTBEAT = 15
+# Seconds before an event stream is closed and the browser reconnects
+NOTIFICATION_STREAM_MAX_AGE = 300
+# Seconds a long-poll request waits for an event before returning empty
+NOTIFICATION_LONGPOLL_TIMEOUT = 25
+# Seconds between polls when the site is served over WSGI, where
+# neither the stream nor a waiting long-poll works
+NOTIFICATION_POLL_INTERVAL = 30
+# Most missed notifications sent to a client when it (re)connects
+NOTIFICATION_EVENT_BUFFER = 20
+# Seconds between the checks each web process with open streams makes for
+# notifications written elsewhere (workers, other processes), and the most
+# rows it reads per check
+NOTIFICATION_RELAY_INTERVAL = 1
+NOTIFICATION_RELAY_BATCH_SIZE = 500
+# Ids behind the newest relayed one that each check reads again, so rows
+# whose transaction committed after a later id's are still relayed
+NOTIFICATION_RELAY_LOOKBACK = 1000
+
+# Notification retention (run with: python manage.py compact_notifications)
+# Read notifications older than this many days move to the compressed archive
+NOTIFICATION_RETENTION_DAYS = 90
+# Notifications archived per transaction
+NOTIFICATION_COMPACT_BATCH_SIZE = 1000
+# Entries per page of /applications/api/notifications/history/
+NOTIFICATION_HISTORY_PAGE_SIZE = 50
+NOTIFICATION_HISTORY_PAGE_SIZE_MAX = 200
+
+# Seconds a submitted application's Idempotency-Key is answered from the
+# cache; later retries are resolved through the (user, job) unique constraint
+APPLY_IDEMPOTENCY_TIMEOUT = 24 * 60 * 60
+
+# Background task queue (run with: python manage.py run_workers)
+# Tasks run concurrently per worker process
+TASK_QUEUE_WORKERS = 4
+# Seconds a claimed task is hidden from other workers before it is retried
+TASK_QUEUE_VISIBILITY_TIMEOUT = 300
+# Attempts before a task is marked failed, and the base retry backoff in seconds
+TASK_QUEUE_MAX_ATTEMPTS = 5
+TASK_QUEUE_RETRY_DELAY = 10
+# Seconds an idle worker sleeps between polls
+TASK_QUEUE_POLL_INTERVAL = 1
+# Run tasks in-process after commit instead of queueing them (no workers needed)
+TASK_QUEUE_EAGER = False
+
+# Request instrumentation (Server-Timing header)
+# Fraction of requests timed; none unless DEBUG. For production logging
+# set a small rate (e.g. 0.1) with SERVER_TIMING_LOG
+SERVER_TIMING_SAMPLE_RATE = 1.0 if DEBUG else 0.0
+# Send the timings to the client; they reveal query counts and server
+# load, so keep this off in production
+SERVER_TIMING_HEADER = DEBUG
+# Write a JSON log line with the timings of each timed request
+SERVER_TIMING_LOG = False
+# Log the SQL of queries slower than this many milliseconds (None disables)
+SERVER_TIMING_SLOW_QUERY_MS = 200
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'HireChain.instrumentation': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
@@ -0,0 +1,29 @@
+from django.contrib.auth.backends import ModelBackend
+
+from .caching import user_cache
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend that serves the per-request user lookup from the cache.
+    Logging in still checks the password against the database.
+    Follows Open/Closed Principle - extends ModelBackend.
+    """
+
+    def get_user(self, user_id):
+        user = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                user_cache.set(user)
+            return user
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        user = await user_cache.aget(user_id)
+        if user is None:
+            user = await super().aget_user(user_id)
+            if user is not None:
+                await user_cache.aset(user)
+            return user
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from HireChain.cache import is_process_local
+
+
+class UserCache:
+    """
+    Cache of authenticated user objects, keyed by user id, so requests do
+    not have to load the user row before the view runs.
+    Entries are dropped when the user is saved, deleted or logs out and
+    when their unread counter moves; each drop is repeated after the
+    surrounding transaction commits, so a request reading the row
+    mid-transaction cannot leave the old copy behind.
+    Invalidations must reach every process, so users are only cached in a
+    shared cache; with a per-process one each lookup goes to the database.
+    Follows Single Responsibility Principle - only handles user caching.
+    """
+
+    def __init__(self, alias='default', timeout=None):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def _key(user_id):
+        return f'accounts:user:{user_id}'
+
+    def _timeout(self):
+        return self.timeout if self.timeout is not None else settings.USER_CACHE_TIMEOUT
+
+    @property
+    def enabled(self):
+        return self._timeout() > 0 and not is_process_local(settings.CACHES[self.alias])
+
+    def get(self, user_id):
+        if not self.enabled:
+            return None
+        return self.cache.get(self._key(user_id))
+
+    async def aget(self, user_id):
+        if not self.enabled:
+            return None
+        return await self.cache.aget(self._key(user_id))
+
+    def set(self, user):
+        if self.enabled:
+            self.cache.set(self._key(user.pk), user, self._timeout())
+
+    async def aset(self, user):
+        if self.enabled:
+            await self.cache.aset(self._key(user.pk), user, self._timeout())
+
+    def invalidate(self, *user_ids):
+        keys = [self._key(user_id) for user_id in user_ids]
+        if not keys:
+            return
+        self.cache.delete_many(keys)
+        transaction.on_commit(lambda: self.cache.delete_many(keys))
+
+
+user_cache = UserCache()
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from HireChain.cache import is_process_local
+from .caching import user_cache
+
+CACHED_SESSION_ENGINES = (
+    'django.contrib.sessions.backends.cache',
+    'django.contrib.sessions.backends.cached_db',
+)
+
+
+@register(deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Users and sessions are only cached in a cache every process shares"""
+    if settings.SESSION_ENGINE in CACHED_SESSION_ENGINES and is_process_local(
+        settings.CACHES[settings.SESSION_CACHE_ALIAS]
+    ):
+        return [Warning(
+            f'SESSION_ENGINE {settings.SESSION_ENGINE} keeps sessions in a '
+            'per-process cache, so a logout in one process leaves the session '
+            'valid in the others.',
+            hint='Set CACHE_BACKEND to redis, memcached, file or db, or use the db session engine.',
+            id='accounts.W001',
+        )]
+
+    uncached = []
+    if ('accounts.backends.CachedModelBackend' in settings.AUTHENTICATION_BACKENDS
+            and is_process_local(settings.CACHES[user_cache.alias])):
+        uncached.append('users')
+    if (settings.SESSION_ENGINE == 'django.contrib.sessions.backends.db'
+            and is_process_local(settings.CACHES[settings.SESSION_CACHE_ALIAS])):
+        uncached.append('sessions')
+    if not uncached:
+        return []
+    return [Warning(
+        f'{" and ".join(uncached).capitalize()} are loaded from the database on '
+        'every request, because the cache is per process.',
+        hint='Set CACHE_BACKEND to redis, memcached, file or db so the web and '
+             'worker processes share cached users, sessions and their invalidations.',
+        id='accounts.W001',
+    )]
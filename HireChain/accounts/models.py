@@ -15,6 +15,8 @@ class CustomUser(AbstractUser):
     user_type = models.CharField(max_length=20, choices=USER_TYPE_CHOICES, default='job_seeker')
     phone = models.CharField(max_length=15, blank=True, null=True)
     linkedin = models.URLField(blank=True, null=True)
+    # Denormalized count of unread notifications, kept by applications.counters
+    unread_notifications = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -23,6 +25,17 @@ class CustomUser(AbstractUser):
         verbose_name = 'User'
         verbose_name_plural = 'Users'
     
+    def save(self, *args, **kwargs):
+        # The unread counter only changes through atomic UPDATEs, so a full
+        # save of an existing user must not write back a stale copy of it
+        if (not self._state.adding and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert')):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'unread_notifications'
+            ]
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return f"{self.username} ({self.get_user_type_display()})"
     
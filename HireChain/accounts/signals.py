@@ -0,0 +1,20 @@
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .caching import user_cache
+from .models import CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the cached copy of a saved or deleted user"""
+    user_cache.invalidate(instance.pk)
+
+
+@receiver(user_logged_out)
+def invalidate_logged_out_user(sender, request, user, **kwargs):
+    """Drop the cached copy of a user who logs out"""
+    if user is not None:
+        user_cache.invalidate(user.pk)
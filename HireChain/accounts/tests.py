@@ -1,3 +1,89 @@
-from django.test import TestCase
+import os
+import subprocess
+import sys
+import tempfile
 
-# Create your tests here.
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from HireChain.cache import CACHE_BACKENDS, session_engine
+from .backends import CachedModelBackend
+from .caching import user_cache
+from .checks import check_shared_cache
+from .models import CustomUser
+
+
+class CachedModelBackendTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('cached', 'cached@example.com', 'password')
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def shared_cache(self):
+        """A file cache, which every process on this host can read and write"""
+        return override_settings(CACHES={
+            'default': {'BACKEND': CACHE_BACKENDS['file'], 'LOCATION': self.cache_dir.name},
+        })
+
+    def invalidate_in_another_process(self, user_id):
+        env = {
+            **os.environ,
+            'CACHE_BACKEND': 'file',
+            'CACHE_LOCATION': self.cache_dir.name,
+            'DB_NAME': os.path.join(self.cache_dir.name, 'other.sqlite3'),
+        }
+        script = (
+            'import django; django.setup(); '
+            'from accounts.caching import user_cache; '
+            f'user_cache.invalidate({user_id})'
+        )
+        subprocess.run([sys.executable, '-c', script], cwd=settings.BASE_DIR, env=env, check=True)
+
+    def test_process_local_cache_is_not_used(self):
+        backend = CachedModelBackend()
+        backend.get_user(self.user.id)
+        with self.assertNumQueries(1):
+            backend.get_user(self.user.id)
+
+    def test_shared_cache_serves_repeat_lookups(self):
+        with self.shared_cache():
+            backend = CachedModelBackend()
+            backend.get_user(self.user.id)
+            with self.assertNumQueries(0):
+                self.assertEqual(backend.get_user(self.user.id), self.user)
+
+    def test_invalidation_from_another_process_drops_the_entry(self):
+        with self.shared_cache():
+            backend = CachedModelBackend()
+            backend.get_user(self.user.id)
+            # Changed without signals, as another process's write looks from here
+            CustomUser.objects.filter(id=self.user.id).update(user_type='admin')
+            self.assertEqual(backend.get_user(self.user.id).user_type, 'job_seeker')
+
+            self.invalidate_in_another_process(self.user.id)
+            self.assertIsNone(user_cache.get(self.user.id))
+            with self.assertNumQueries(1):
+                self.assertEqual(backend.get_user(self.user.id).user_type, 'admin')
+
+
+class SharedCacheCheckTests(TestCase):
+    locmem = {'default': {'BACKEND': CACHE_BACKENDS['locmem']}}
+    file = {'default': {'BACKEND': CACHE_BACKENDS['file'], 'LOCATION': tempfile.gettempdir()}}
+
+    def test_sessions_are_only_cached_in_a_shared_cache(self):
+        self.assertEqual(session_engine(self.locmem['default']), 'django.contrib.sessions.backends.db')
+        self.assertEqual(session_engine(self.file['default']), 'django.contrib.sessions.backends.cached_db')
+
+    def test_cached_sessions_in_process_local_cache_are_flagged(self):
+        with override_settings(CACHES=self.locmem, SESSION_ENGINE='django.contrib.sessions.backends.cached_db'):
+            [warning] = check_shared_cache(None)
+        self.assertEqual(warning.id, 'accounts.W001')
+        self.assertIn('logout', warning.msg)
+
+    def test_shared_cache_passes(self):
+        with override_settings(CACHES=self.file, SESSION_ENGINE=session_engine(self.file['default'])):
+            self.assertEqual(check_shared_cache(None), [])
@@ -1,7 +1,23 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from .bulk import bulk_update_status, UPDATED
 from .models import Application
 
 
+def make_status_action(status, label):
+    """Build an admin action that moves the selected applications to ``status``"""
+    def action(modeladmin, request, queryset):
+        results = bulk_update_status(queryset.values_list('id', flat=True), status)
+        updated = sum(1 for outcome in results.values() if outcome == UPDATED)
+        modeladmin.message_user(
+            request,
+            f'{updated} application(s) marked as {label}; {len(results) - updated} unchanged.',
+            messages.SUCCESS
+        )
+    action.__name__ = f'mark_{status}'
+    action.short_description = f'Mark selected applications as {label}'
+    return action
+
+
 @admin.register(Application)
 class ApplicationAdmin(admin.ModelAdmin):
     """
@@ -12,6 +28,7 @@ class ApplicationAdmin(admin.ModelAdmin):
     list_filter = ['status', 'applied_date']
     search_fields = ['full_name', 'email', 'phone', 'job__title']
     readonly_fields = ['applied_date', 'updated_date']
+    actions = [make_status_action(status, label) for status, label in Application.STATUS_CHOICES]
     
     fieldsets = (
         ('Applicant Information', {
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Application
+from .tasks import notify_status_change
+
+# Application ids handled per SELECT/UPDATE, kept under SQLite's parameter limit
+BATCH_SIZE = 500
+
+# Largest number of ids accepted in one bulk request
+MAX_BULK_IDS = 5000
+
+UPDATED = 'updated'
+UNCHANGED = 'unchanged'
+NOT_FOUND = 'not_found'
+
+
+def bulk_update_status(application_ids, new_status):
+    """
+    Move many applications to ``new_status`` and notify their applicants.
+    Per batch this is one locking SELECT, one UPDATE and one bulk INSERT of
+    notify_status_change tasks; applications already in ``new_status`` are
+    skipped, as in the single-item view.
+    Returns a dict mapping each requested id to UPDATED, UNCHANGED or NOT_FOUND.
+    """
+    if new_status not in dict(Application.STATUS_CHOICES):
+        raise ValueError(f'Invalid status: {new_status}')
+
+    ids = list(dict.fromkeys(int(application_id) for application_id in application_ids))
+    results = dict.fromkeys(ids, NOT_FOUND)
+    for start in range(0, len(ids), BATCH_SIZE):
+        _update_batch(ids[start:start + BATCH_SIZE], new_status, results)
+    return results
+
+
+def _update_batch(ids, new_status, results):
+    with transaction.atomic():
+        # Lock the rows so a concurrent update cannot change them between check and write
+        current = Application.objects.select_for_update().filter(id__in=ids).values_list('id', 'status')
+        changed = []
+        for application_id, status in current:
+            if status == new_status:
+                results[application_id] = UNCHANGED
+            else:
+                changed.append(application_id)
+                results[application_id] = UPDATED
+        if not changed:
+            return
+
+        Application.objects.filter(id__in=changed).update(status=new_status, updated_date=timezone.now())
+        notify_status_change.enqueue_many(
+            {'application_id': application_id, 'status': new_status} for application_id in changed
+        )
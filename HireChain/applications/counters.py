@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+
+from accounts.caching import user_cache
+
+# Cached user objects carry the counter, so each change drops them from the cache
+
+
+def increment_unread(user_id, by=1):
+    """Atomically add ``by`` to a user's unread notification counter"""
+    if by:
+        get_user_model().objects.filter(pk=user_id).update(
+            unread_notifications=F('unread_notifications') + by
+        )
+        user_cache.invalidate(user_id)
+
+
+def decrement_unread(user_id, by=1):
+    """Atomically subtract ``by`` from a user's unread counter, never below zero"""
+    if by:
+        get_user_model().objects.filter(pk=user_id).update(
+            unread_notifications=Greatest(F('unread_notifications') - by, Value(0))
+        )
+        user_cache.invalidate(user_id)
+
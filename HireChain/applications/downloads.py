@@ -0,0 +1,132 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_range(header, size):
+    """
+    Parse a single-range ``Range`` header into ``(start, end)`` inclusive.
+    Returns None when the header should be ignored (absent, malformed or
+    multi-range) and raises ValueError when the range is unsatisfiable.
+    """
+    match = _RANGE_RE.match(header.strip()) if header else None
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError('Empty suffix range')
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError('Range not satisfiable')
+    return start, end
+
+
+def _if_range_matches(request, etag, last_modified):
+    """True if there is no If-Range, or it still matches the file"""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        return if_range == etag
+    # A date only validates the range if it is exactly the file's
+    # Last-Modified; RFC 9110 section 13.1.5
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(last_modified) == since
+
+
+def _file_etag(storage, name, stat):
+    """
+    Strong ETag for a stored file. Content-addressed names already identify
+    the bytes; any other name can be rewritten in place, so its tag comes
+    from the file's mtime and size.
+    """
+    is_hashed_name = getattr(storage, 'is_hashed_name', None)
+    if is_hashed_name is not None and is_hashed_name(name):
+        return quote_etag(os.path.splitext(os.path.basename(name))[0])
+    return quote_etag(f'{stat.st_mtime_ns:x}-{stat.st_size:x}')
+
+
+def _read_range(path, start, length, chunk_size):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(request, storage, name, filename):
+    """
+    Serve a stored file with validators and single-range support.
+    With RESUME_SENDFILE_BACKEND set, the web server sends the bytes via
+    X-Sendfile or X-Accel-Redirect and handles ranges itself; otherwise the
+    file is streamed in RESUME_DOWNLOAD_CHUNK_SIZE chunks.
+    """
+    path = storage.path(name)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    size = stat.st_size
+    etag = _file_etag(storage, name, stat)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    disposition = content_disposition_header(True, filename)
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is not None:
+        return response
+
+    backend = settings.RESUME_SENDFILE_BACKEND
+    if backend:
+        response = HttpResponse(content_type=content_type)
+        if backend == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = settings.RESUME_ACCEL_REDIRECT_PREFIX + name
+        else:
+            response['X-Sendfile'] = path
+    else:
+        byte_range = None
+        if _if_range_matches(request, etag, stat.st_mtime):
+            try:
+                byte_range = parse_range(request.headers.get('Range'), size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        if byte_range is None:
+            # FileResponse lets the server use wsgi.file_wrapper/sendfile
+            response = FileResponse(open(path, 'rb'), content_type=content_type)
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                _read_range(path, start, length, settings.RESUME_DOWNLOAD_CHUNK_SIZE),
+                status=206, content_type=content_type
+            )
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(length)
+        response['Accept-Ranges'] = 'bytes'
+
+    response['Content-Disposition'] = disposition
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = 'private, no-transform'
+    return response
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .models import Notification
+
+
+class Subscription:
+    """
+    One listener (an SSE stream or a long-poll request) waiting for events.
+    Events are handed over to the listener's own event loop, so publishing
+    from a sync view thread is safe.
+    """
+
+    def __init__(self, user_id, loop, maxsize=100):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+
+    def deliver(self, event):
+        """Called from any thread; drops the event if the listener has fallen behind"""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The listener's event loop has already shut down
+            pass
+
+    def _put(self, event):
+        if not self.queue.full():
+            self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Wait up to ``timeout`` seconds for the next event, or return None"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class NotificationBroker:
+    """
+    In-process publish/subscribe hub for user notifications.
+    Follows Single Responsibility Principle - only routes events to listeners.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id):
+        subscription = Subscription(user_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            listeners = self._subscribers.get(subscription.user_id)
+            if listeners is not None:
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscribers[subscription.user_id]
+
+    def has_listeners(self):
+        with self._lock:
+            return bool(self._subscribers)
+
+    def publish(self, user_id, event):
+        """Hand ``event`` to every listener of ``user_id``"""
+        with self._lock:
+            listeners = list(self._subscribers.get(user_id, ()))
+        for subscription in listeners:
+            subscription.deliver(event)
+
+
+class NotificationRelay:
+    """
+    Tails the notifications table and publishes new rows to the broker, so
+    notifications written by background workers and other web processes
+    reach the streams held by this one. While the process has listeners it
+    runs one indexed range query every NOTIFICATION_RELAY_INTERVAL seconds,
+    however many streams are open; it stops when the last one leaves.
+    Ids are allocated when a row is inserted, not when it commits, so a
+    lower id can become visible after a higher one. Each check re-reads the
+    last NOTIFICATION_RELAY_LOOKBACK ids and skips the ones already seen.
+    Follows Single Responsibility Principle - only relays stored notifications.
+    """
+
+    def __init__(self, broker):
+        self.broker = broker
+        self._task = None
+        self._last_id = 0
+        self._seen = set()
+
+    def _running(self, loop):
+        return self._task is not None and not self._task.done() and self._task.get_loop() is loop
+
+    async def ensure_running(self):
+        """
+        Start relaying from the newest stored notification unless already
+        running. Subscribe first, then call this, then read anything older
+        from the database, so no notification falls between the two.
+        """
+        loop = asyncio.get_running_loop()
+        if self._running(loop):
+            return
+        seen = await sync_to_async(self._recent_ids)()
+        if not self._running(loop):
+            self._last_id = max(seen, default=0)
+            self._seen = set(seen)
+            self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        while self.broker.has_listeners():
+            notifications = await sync_to_async(self._new_notifications)(self._last_id, self._seen)
+            self._relay(notifications)
+            if len(notifications) < settings.NOTIFICATION_RELAY_BATCH_SIZE:
+                await asyncio.sleep(settings.NOTIFICATION_RELAY_INTERVAL)
+
+    def _relay(self, notifications):
+        for notification in notifications:
+            self._seen.add(notification['id'])
+            self._last_id = max(self._last_id, notification['id'])
+            # Rows read before the relay saw them only move it forward
+            if notification['event'] is not None:
+                self.broker.publish(notification['user_id'], notification['event'])
+        floor = self._window_floor(self._last_id)
+        self._seen = {id_ for id_ in self._seen if id_ > floor}
+
+    @staticmethod
+    def _window_floor(last_id):
+        return max(last_id - settings.NOTIFICATION_RELAY_LOOKBACK, 0)
+
+    @staticmethod
+    def _recent_ids():
+        newest_id = Notification.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        return list(
+            Notification.objects.filter(id__gt=NotificationRelay._window_floor(newest_id))
+            .values_list('id', flat=True)
+        )
+
+    @staticmethod
+    def _new_notifications(last_id, seen):
+        window = (
+            Notification.objects.filter(id__gt=NotificationRelay._window_floor(last_id))
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        ids = [id_ for id_ in window if id_ not in seen][:settings.NOTIFICATION_RELAY_BATCH_SIZE]
+        if not ids:
+            return []
+        notifications = (
+            Notification.objects.filter(id__in=ids)
+            .select_related('application__job')
+            .order_by('id')
+        )
+        return [
+            {'id': n.id, 'user_id': n.user_id, 'event': None if n.is_read else n.to_dict()}
+            for n in notifications
+        ]
+
+
+broker = NotificationBroker()
+relay = NotificationRelay(broker)
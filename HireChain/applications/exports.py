@@ -0,0 +1,129 @@
+import csv
+import json
+import re
+
+from asgiref.sync import sync_to_async
+
+from .models import Application
+from .search import search_applications
+
+# Rows fetched per database round trip and written per streamed chunk
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_COLUMNS = [
+    'id', 'full_name', 'email', 'phone', 'linkedin', 'portfolio', 'job_title',
+    'company_name', 'status', 'applied_date', 'updated_date', 'username',
+]
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson',
+}
+
+# Cells a spreadsheet would run as a formula; phone numbers such as
+# "+1 (555) 010-2000" are left alone
+_FORMULA_RE = re.compile(r'^[=@\t\r]|^[+-](?![\d\s().-]*$)')
+
+
+def filter_applications(queryset, status=None, search=None, job_id=None):
+    """Apply the admin list's status and job filters and applicant search to ``queryset``"""
+    if status:
+        queryset = queryset.filter(status=status)
+    if job_id:
+        queryset = queryset.filter(job_id=job_id)
+    if search:
+        queryset = search_applications(queryset, search)
+    return queryset
+
+
+def export_queryset(status=None, search=None, job_id=None):
+    """Applications to export, newest first, with only the exported columns loaded"""
+    queryset = (
+        Application.objects.select_related('job', 'user')
+        .only(
+            'id', 'full_name', 'email', 'phone', 'linkedin', 'portfolio', 'status',
+            'applied_date', 'updated_date', 'job__title', 'job__company_name', 'user__username',
+        )
+        .order_by('-applied_date', '-id')
+    )
+    return filter_applications(queryset, status, search, job_id)
+
+
+def _row(application):
+    return {
+        'id': application.id,
+        'full_name': application.full_name,
+        'email': application.email,
+        'phone': application.phone,
+        'linkedin': application.linkedin or '',
+        'portfolio': application.portfolio or '',
+        'job_title': application.job.title,
+        'company_name': application.job.company_name,
+        'status': application.status,
+        'applied_date': application.applied_date.isoformat(),
+        'updated_date': application.updated_date.isoformat(),
+        'username': application.user.username,
+    }
+
+
+def _csv_cell(value):
+    if isinstance(value, str) and _FORMULA_RE.match(value):
+        return "'" + value
+    return value
+
+
+class _Echo:
+    """File-like object whose write() returns the line instead of storing it"""
+
+    def write(self, value):
+        return value
+
+
+def _chunked(queryset, chunk_size, format_row):
+    """Stream formatted rows, ``chunk_size`` rows per yielded chunk"""
+    lines = []
+    for application in queryset.iterator(chunk_size=chunk_size):
+        lines.append(format_row(_row(application)))
+        if len(lines) >= chunk_size:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+
+def csv_chunks(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the export as CSV text, header first"""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    yield from _chunked(
+        queryset, chunk_size,
+        lambda row: writer.writerow([_csv_cell(row[column]) for column in EXPORT_COLUMNS])
+    )
+
+
+def jsonl_chunks(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the export as JSON Lines text"""
+    yield from _chunked(queryset, chunk_size, lambda row: json.dumps(row) + '\n')
+
+
+def export_chunks(export_format, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Chunks of the export in ``export_format`` ('csv' or 'jsonl')"""
+    if export_format == 'csv':
+        return csv_chunks(queryset, chunk_size)
+    return jsonl_chunks(queryset, chunk_size)
+
+
+async def aiterate(chunks):
+    """
+    Serve a synchronous chunk generator to an ASGI server one chunk at a
+    time. Django would otherwise read a sync iterator into a list before
+    sending it asynchronously. Every step runs on the same thread, which
+    the database cursor behind ``chunks`` needs.
+    """
+    iterator = iter(chunks)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while True:
+        chunk = await next_chunk(iterator, None)
+        if chunk is None:
+            break
+        yield chunk
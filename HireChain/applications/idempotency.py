@@ -0,0 +1,87 @@
+import hashlib
+import json
+import re
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+
+# Printable, cache-safe and no longer than Application.idempotency_key
+_KEY_PATTERN = re.compile(r'[A-Za-z0-9_.:-]{1,64}')
+
+
+class InvalidIdempotencyKey(ValueError):
+    pass
+
+
+def get_idempotency_key(request):
+    """The request's Idempotency-Key header, or None if it has none"""
+    key = request.headers.get(IDEMPOTENCY_KEY_HEADER, '').strip()
+    if not key:
+        return None
+    if not _KEY_PATTERN.fullmatch(key):
+        raise InvalidIdempotencyKey(key)
+    return key
+
+
+def request_fingerprint(job_id, request):
+    """
+    SHA-256 of what a submission asks for: the job, the form fields and the
+    contents of the uploaded files. The CSRF token is left out, since a
+    re-rendered form carries a new one. A key sent again with a different
+    fingerprint is a client reusing it, not retrying.
+    """
+    fields = sorted(
+        (name, values) for name, values in request.POST.lists() if name != 'csrfmiddlewaretoken'
+    )
+    files = []
+    for name, uploads in sorted(request.FILES.lists()):
+        for upload in uploads:
+            digest = hashlib.sha256()
+            for chunk in upload.chunks():
+                digest.update(chunk)
+            upload.seek(0)
+            files.append((name, digest.hexdigest()))
+    payload = json.dumps([job_id, fields, files]).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+class AppliedKeyCache:
+    """
+    Remembers which application each (user, Idempotency-Key) created and
+    the fingerprint of the request that created it, so a retried submission
+    is answered without touching the database.
+    Entries are written once the creating transaction commits.
+    Follows Single Responsibility Principle - only handles idempotency keys.
+    """
+
+    def __init__(self, alias='default', timeout=None):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def _key(user_id, key):
+        return f'applications:apply:{user_id}:{key}'
+
+    def _timeout(self):
+        return self.timeout if self.timeout is not None else settings.APPLY_IDEMPOTENCY_TIMEOUT
+
+    def get(self, user_id, key):
+        """``(application_id, fingerprint)`` for a key, or None"""
+        return self.cache.get(self._key(user_id, key))
+
+    def remember(self, user_id, key, application_id, fingerprint):
+        cache_key, timeout = self._key(user_id, key), self._timeout()
+        transaction.on_commit(lambda: self.cache.set(cache_key, (application_id, fingerprint), timeout))
+
+    def forget(self, user_id, key):
+        self.cache.delete(self._key(user_id, key))
+
+
+applied_keys = AppliedKeyCache()
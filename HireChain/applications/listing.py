@@ -0,0 +1,40 @@
+from jobs.pagination import SortedKeysetPaginator
+
+from .exports import filter_applications
+from .models import Application
+
+# Sort keys of the admin applications list and the columns each orders by;
+# every ordering has a matching index (see Application.Meta.indexes)
+SORT_FIELDS = {
+    'applied_date': ('applied_date', 'id'),
+    'status': ('status', 'applied_date', 'id'),
+    'job': ('job_id', 'applied_date', 'id'),
+}
+
+# Largest number of ids accepted by the batch details endpoint
+MAX_DETAIL_IDS = 100
+
+LIST_COLUMNS = ['id', 'full_name', 'job_id', 'email', 'phone', 'has_resume', 'status', 'applied_date']
+
+
+def application_page(page_size, cursor=None, sort='applied_date', descending=True,
+                     status=None, search=None, job_id=None):
+    """
+    One keyset page of the admin list as ``(rows, job_titles, next_cursor)``.
+    Rows follow LIST_COLUMNS; job titles are returned once per job rather
+    than once per row. Raises InvalidCursor for a malformed cursor.
+    """
+    queryset = filter_applications(Application.objects.all(), status, search, job_id).values(
+        'id', 'full_name', 'job_id', 'job__title', 'email', 'phone', 'resume', 'status', 'applied_date'
+    )
+    paginator = SortedKeysetPaginator(queryset, page_size, SORT_FIELDS[sort], descending)
+    items, next_cursor = paginator.get_page(cursor)
+
+    rows, job_titles = [], {}
+    for item in items:
+        job_titles[item['job_id']] = item['job__title']
+        rows.append([
+            item['id'], item['full_name'], item['job_id'], item['email'], item['phone'],
+            bool(item['resume']), item['status'], item['applied_date'].isoformat(),
+        ])
+    return rows, job_titles, next_cursor
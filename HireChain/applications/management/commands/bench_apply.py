@@ -0,0 +1,158 @@
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from applications.idempotency import applied_keys
+from applications.models import Application
+from applications.tasks import notify_application_submitted
+from jobs.benchmarks import percentile
+from jobs.models import Job
+from taskqueue.models import Task
+
+APPLY_FORM = {
+    'full_name': 'Bench Applicant',
+    'email': 'bench_applicant@example.com',
+    'phone': '+15550000000',
+    'cover_letter': 'Benchmark application.',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the apply pipeline: SQL queries per first submission, retry '
+        'and duplicate, then applies per second with concurrent clients. '
+        'Clients work in pairs sharing one applicant, like a double-click in '
+        'two tabs, and every submission is retried once with its '
+        'Idempotency-Key. Everything the benchmark creates is deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=8,
+            help='Concurrent clients, two per applicant (default: 8)'
+        )
+        parser.add_argument(
+            '--jobs', type=int, default=50,
+            help='Jobs each applicant applies to (default: 50)'
+        )
+
+    def handle(self, *args, **options):
+        threads, job_count = options['threads'], options['jobs']
+        if threads < 2 or threads % 2 or job_count < 1:
+            raise CommandError('--threads must be an even number of at least 2 and --jobs positive')
+        job_ids = list(Job.objects.filter(is_active=True).order_by('id').values_list('id', flat=True)[:job_count])
+        if len(job_ids) < 2:
+            raise CommandError('Not enough active jobs; run generate_data first')
+
+        User = get_user_model()
+        prefix = f'bench_apply_{int(time.time())}'
+        applicants = [
+            User.objects.create_user(f'{prefix}_{n}', f'{prefix}_{n}@example.com')
+            for n in range(threads // 2 + 1)
+        ]
+        # Half of all submissions are expected duplicates; do not log each 400
+        request_logger = logging.getLogger('django.request')
+        log_level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        try:
+            # The test client sends Host: testserver
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                self.report_queries(applicants[0], job_ids[:2])
+                self.report_concurrency(applicants[1:], job_ids)
+        finally:
+            request_logger.setLevel(log_level)
+            application_ids = list(
+                Application.objects.filter(user__in=applicants).values_list('id', flat=True)
+            )
+            Task.objects.filter(
+                name=notify_application_submitted.task_name,
+                payload__application_id__in=application_ids,
+            ).delete()
+            User.objects.filter(id__in=[applicant.id for applicant in applicants]).delete()
+
+        self.stdout.write(self.style.SUCCESS('Apply benchmark complete'))
+
+    def report_queries(self, applicant, job_ids):
+        """Queries for a first submission, its retries and a second submission"""
+        client = Client(raise_request_exception=False)
+        client.force_login(applicant)
+        # Warm the session and user caches so only the view's own queries count
+        client.post(reverse('applications:apply_job', args=[job_ids[0]]), APPLY_FORM)
+
+        path = reverse('applications:apply_job', args=[job_ids[1]])
+        key = uuid.uuid4().hex
+        cases = [
+            ('first submission', key),
+            ('retry, key cached', key),
+            ('retry, key expired', key),
+            ('second submission', uuid.uuid4().hex),
+        ]
+        for label, case_key in cases:
+            if label == 'retry, key expired':
+                applied_keys.forget(applicant.id, key)
+            with CaptureQueriesContext(connection) as queries:
+                response = client.post(path, APPLY_FORM, headers={'Idempotency-Key': case_key})
+            self.stdout.write(f'{label:<20} {response.status_code}  {len(queries):>2} queries')
+
+    def report_concurrency(self, applicants, job_ids):
+        results, lock = [], threading.Lock()
+        start = threading.Barrier(len(applicants) * 2 + 1)
+        workers = [
+            threading.Thread(target=self.client_thread, args=(applicant, job_ids, start, lock, results))
+            for applicant in applicants for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        start.wait()
+        started = perf_counter()
+        for worker in workers:
+            worker.join()
+        elapsed = perf_counter() - started
+
+        created = Application.objects.filter(user__in=applicants).count()
+        for kind in ('submit', 'retry'):
+            timings = [seconds for result_kind, _, seconds in results if result_kind == kind]
+            statuses = Counter(status for result_kind, status, _ in results if result_kind == kind)
+            self.stdout.write(
+                f'{kind:<8} {len(timings):>6} requests  p50 {percentile(timings, 50) * 1000:>7.2f}ms  '
+                f'p95 {percentile(timings, 95) * 1000:>7.2f}ms  {dict(statuses)}'
+            )
+        self.stdout.write(
+            f'{created} application(s) for {len(applicants) * len(job_ids)} (applicant, job) pairs, '
+            f'{created / elapsed:.1f} applies/s, {len(results) / elapsed:.1f} requests/s '
+            f'with {len(workers)} clients'
+        )
+        if created != len(applicants) * len(job_ids):
+            raise CommandError('Each (applicant, job) pair should have exactly one application')
+        if any(status >= 500 for _, status, _ in results):
+            raise CommandError('Some submissions failed with a server error')
+
+    @staticmethod
+    def client_thread(applicant, job_ids, start, lock, results):
+        """One browser tab: submit to every job, retrying each submission once"""
+        client = Client(raise_request_exception=False)
+        client.force_login(applicant)
+        timings = []
+        start.wait()
+        try:
+            for job_id in job_ids:
+                path = reverse('applications:apply_job', args=[job_id])
+                headers = {'Idempotency-Key': uuid.uuid4().hex}
+                for kind in ('submit', 'retry'):
+                    began = perf_counter()
+                    response = client.post(path, APPLY_FORM, headers=headers)
+                    timings.append((kind, response.status_code, perf_counter() - began))
+        finally:
+            connections.close_all()
+        with lock:
+            results.extend(timings)
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from applications.retention import archivable_notifications, compact_notifications, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        'Move read notifications older than the retention period into the '
+        'compressed notification archive, a batch per transaction'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS,
+            help=f'Archive read notifications older than this (default: {settings.NOTIFICATION_RETENTION_DAYS})'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.NOTIFICATION_COMPACT_BATCH_SIZE,
+            help=f'Notifications moved per transaction (default: {settings.NOTIFICATION_COMPACT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--pause', type=float, default=0,
+            help='Seconds to sleep between batches, to leave room for other writers (default: 0)'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only count the notifications that would be archived'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 0 or options['batch_size'] < 1:
+            raise CommandError('--days must be zero or more and --batch-size positive')
+
+        cutoff = retention_cutoff(options['days'])
+        if options['dry_run']:
+            count = archivable_notifications(cutoff).count()
+            self.stdout.write(f'{count} notification(s) read before {cutoff:%Y-%m-%d %H:%M} would be archived')
+            return
+
+        progress = None
+        if options['verbosity'] > 1:
+            progress = lambda total: self.stdout.write(f'Archived {total} notification(s)...')  # noqa: E731
+        total = compact_notifications(
+            cutoff, batch_size=options['batch_size'], pause=options['pause'], on_batch=progress
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {total} notification(s) read before {cutoff:%Y-%m-%d %H:%M}'))
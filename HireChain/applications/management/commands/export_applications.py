@@ -0,0 +1,34 @@
+import sys
+
+from django.core.management.base import BaseCommand
+from applications.exports import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, export_chunks, export_queryset
+
+
+class Command(BaseCommand):
+    help = 'Export applications as CSV or JSON Lines, with the admin list filters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default='csv', help='Output format (default: csv)')
+        parser.add_argument('--status', help='Only export applications with this status')
+        parser.add_argument('--job', type=int, help='Only export applications for this job id')
+        parser.add_argument('--search', help='Only export applications matching this search')
+        parser.add_argument('--output', help='File to write to (default: standard output)')
+        parser.add_argument(
+            '--chunk-size', type=int, default=EXPORT_CHUNK_SIZE,
+            help=f'Rows fetched and written at a time (default: {EXPORT_CHUNK_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        queryset = export_queryset(options['status'], (options['search'] or '').strip(), options['job'])
+        chunks = export_chunks(options['format'], queryset, options['chunk_size'])
+
+        output = open(options['output'], 'w', newline='', encoding='utf-8') if options['output'] else sys.stdout
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+        finally:
+            if options['output']:
+                output.close()
+
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(f"Exported applications to {options['output']}"))
@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from applications import resumes
+from applications.models import Application
+from applications.storage import resume_storage
+
+
+class Command(BaseCommand):
+    help = 'Move existing resumes into content-addressed, deduplicated storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=200,
+            help='Number of applications migrated per transaction (default: 200)'
+        )
+        parser.add_argument(
+            '--keep-originals', action='store_true',
+            help='Leave the old files in place after migrating them'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        storage = resume_storage()
+        migrated = deduplicated = missing = 0
+        last_id = 0
+
+        while True:
+            batch = list(
+                Application.objects.filter(id__gt=last_id)
+                .exclude(resume='').exclude(resume__isnull=True)
+                .order_by('id')
+                .values_list('id', 'resume')[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            moved = []
+            with transaction.atomic():
+                for application_id, old_name in batch:
+                    if storage.is_hashed_name(old_name):
+                        continue
+                    if not storage.exists(old_name):
+                        missing += 1
+                        self.stdout.write(self.style.WARNING(f'Missing file for application {application_id}: {old_name}'))
+                        continue
+
+                    with storage.open(old_name, 'rb') as old_file:
+                        new_name = storage.save(old_name, old_file)
+                    if resumes.ResumeFile.objects.filter(name=new_name).exists():
+                        deduplicated += 1
+                    # update() skips the signals, so the reference is counted here
+                    Application.objects.filter(id=application_id).update(resume=new_name)
+                    resumes.acquire(new_name)
+                    moved.append(old_name)
+                    migrated += 1
+
+            if not options['keep_originals']:
+                for old_name in moved:
+                    storage.delete(old_name)
+
+            self.stdout.write(f'Processed applications up to id {last_id}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Migrated {migrated} resume(s), {deduplicated} shared an existing file, {missing} missing'
+        ))
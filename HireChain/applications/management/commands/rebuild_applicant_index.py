@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from applications.models import Application
+from applications.search import get_applicant_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the applicant search index'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of applications indexed per transaction (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        backend = get_applicant_search_backend()
+
+        # Entries are rewritten in place and stale ones dropped at the end,
+        # so searches keep answering from the old entries during the rebuild
+        indexed = 0
+        applications = (
+            Application.objects.select_related('job')
+            .order_by('id')
+            .iterator(chunk_size=batch_size)
+        )
+        batch = []
+        for application in applications:
+            batch.append(application)
+            if len(batch) >= batch_size:
+                indexed += self._index_batch(backend, batch)
+                batch = []
+        if batch:
+            indexed += self._index_batch(backend, batch)
+        backend.prune()
+
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} application(s)'))
+
+    def _index_batch(self, backend, batch):
+        with transaction.atomic():
+            for application in batch:
+                backend.index_application(application, application.job.title)
+        return len(batch)
@@ -0,0 +1,61 @@
+from functools import lru_cache
+from string import Formatter
+
+# Notifications store one of these codes instead of the full sentence; the
+# text is rendered when the notification is read. Placeholders are filled
+# from the notification's params, then from its application's job.
+MESSAGE_TEMPLATES = {
+    'submitted': 'Your application for {job_title} at {company_name} has been submitted successfully!',
+    'status_new': 'Your application status has been updated to: New',
+    'status_reviewing': 'Good news! Your application for {job_title} is now being reviewed by the hiring team.',
+    'status_interview_scheduled': (
+        'Congratulations! You have been selected for an interview for the {job_title} position. '
+        'The HR team will contact you soon.'
+    ),
+    'status_rejected': (
+        'Thank you for your interest in the {job_title} position. '
+        'Unfortunately, we have decided to move forward with other candidates.'
+    ),
+    'status_other': 'Your application status has been updated to: {status}',
+}
+
+# Code of notifications whose text is stored in full in Notification.message
+CUSTOM = 'custom'
+
+SUBMITTED = 'submitted'
+
+STATUS_OTHER = 'status_other'
+
+_JOB_FIELDS = {
+    'job_title': 'title',
+    'company_name': 'company_name',
+}
+
+
+def status_code(status):
+    """Message code for a change to ``status``"""
+    code = f'status_{status}'
+    return code if code in MESSAGE_TEMPLATES else STATUS_OTHER
+
+
+@lru_cache(maxsize=None)
+def compiled_template(code):
+    """``(template, placeholder names)`` for a code, parsed once per process"""
+    template = MESSAGE_TEMPLATES[code]
+    names = tuple(name for _, name, _, _ in Formatter().parse(template) if name)
+    return template, names
+
+
+def render_message(code, job, params=None):
+    """
+    The text of a notification with ``code``. Only the job fields the
+    template uses are read, so a job loaded with ``only('title')`` works
+    for the status messages.
+    """
+    template, names = compiled_template(code)
+    params = params or {}
+    values = {
+        name: params[name] if name in params else getattr(job, _JOB_FIELDS[name])
+        for name in names
+    }
+    return template.format_map(values)
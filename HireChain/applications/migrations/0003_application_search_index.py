@@ -0,0 +1,48 @@
+from django.db import migrations
+
+from applications.search import SEARCH_FIELDS, SEARCH_TABLE
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            f"{', '.join(SEARCH_FIELDS)}, "
+            f"tokenize = 'porter unicode61 remove_diacritics 2', prefix = '2 3 4')"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE TABLE {SEARCH_TABLE} ("
+            f"application_id bigint PRIMARY KEY REFERENCES applications (id) ON DELETE CASCADE, "
+            f"document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {SEARCH_TABLE}_document_gin ON {SEARCH_TABLE} USING gin (document)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+def populate_search_index(apps, schema_editor):
+    from applications.search import get_applicant_search_backend
+
+    Application = apps.get_model('applications', 'Application')
+    backend = get_applicant_search_backend()
+    for application in Application.objects.select_related('job').iterator(chunk_size=1000):
+        backend.index_application(application, application.job.title)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+    ]
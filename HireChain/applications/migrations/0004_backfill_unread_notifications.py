@@ -0,0 +1,27 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def backfill_unread_counts(apps, schema_editor):
+    Notification = apps.get_model('applications', 'Notification')
+    CustomUser = apps.get_model('accounts', 'CustomUser')
+    counts = (
+        Notification.objects.filter(is_read=False)
+        .values('user')
+        .annotate(unread=Count('id'))
+        .order_by()
+    )
+    for row in counts.iterator():
+        CustomUser.objects.filter(pk=row['user']).update(unread_notifications=row['unread'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_customuser_unread_notifications'),
+        ('applications', '0003_application_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_unread_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-17 19:50
+
+import applications.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_notification_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Resume File',
+                'verbose_name_plural': 'Resume Files',
+                'db_table': 'resume_files',
+            },
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.FileField(blank=True, null=True, storage=applications.storage.resume_storage, upload_to='resumes/'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_resume_storage'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='application',
+            name='app_status_applied_idx',
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-status', '-applied_date', '-id'], name='app_status_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-job', '-applied_date', '-id'], name='app_job_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-job', '-status', '-applied_date', '-id'], name='app_job_status_idx'),
+        ),
+    ]
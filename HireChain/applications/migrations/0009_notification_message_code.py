@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-17 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_notification_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='code',
+            field=models.CharField(default='custom', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='params',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='message',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
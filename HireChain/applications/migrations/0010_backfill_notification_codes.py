@@ -0,0 +1,97 @@
+from collections import defaultdict
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 2000
+
+# The message templates as they were when this migration was written
+TEMPLATES = {
+    'submitted': 'Your application for {job_title} at {company_name} has been submitted successfully!',
+    'status_new': 'Your application status has been updated to: New',
+    'status_reviewing': 'Good news! Your application for {job_title} is now being reviewed by the hiring team.',
+    'status_interview_scheduled': (
+        'Congratulations! You have been selected for an interview for the {job_title} position. '
+        'The HR team will contact you soon.'
+    ),
+    'status_rejected': (
+        'Thank you for your interest in the {job_title} position. '
+        'Unfortunately, we have decided to move forward with other candidates.'
+    ),
+}
+STATUS_OTHER_PREFIX = 'Your application status has been updated to: '
+
+
+def _code_for(message, job_title, company_name):
+    """``(code, params)`` of a stored message, or None if it is free text"""
+    for code, template in TEMPLATES.items():
+        if message == template.format(job_title=job_title, company_name=company_name):
+            return code, None
+    if message.startswith(STATUS_OTHER_PREFIX):
+        return 'status_other', {'status': message[len(STATUS_OTHER_PREFIX):]}
+    return None
+
+
+def _batches(queryset, fields):
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id).order_by('id').values('id', *fields)[:BATCH_SIZE])
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1]['id']
+
+
+def encode_messages(apps, schema_editor):
+    """Replace stored sentences with their template code, one transaction per batch"""
+    Notification = apps.get_model('applications', 'Notification')
+    custom = Notification.objects.filter(code='custom')
+    fields = ('message', 'application__job__title', 'application__job__company_name')
+    for rows in _batches(custom, fields):
+        by_code = defaultdict(list)
+        with_params = []
+        for row in rows:
+            match = _code_for(row['message'], row['application__job__title'], row['application__job__company_name'])
+            if match is None:
+                continue
+            code, params = match
+            if params is None:
+                by_code[code].append(row['id'])
+            else:
+                with_params.append((row['id'], code, params))
+        with transaction.atomic():
+            for code, ids in by_code.items():
+                Notification.objects.filter(id__in=ids).update(code=code, message='')
+            for notification_id, code, params in with_params:
+                Notification.objects.filter(id=notification_id).update(code=code, params=params, message='')
+
+
+def decode_messages(apps, schema_editor):
+    """Write the rendered sentence back into every templated notification"""
+    Notification = apps.get_model('applications', 'Notification')
+    templated = Notification.objects.exclude(code='custom')
+    fields = ('code', 'params', 'application__job__title', 'application__job__company_name')
+    for rows in _batches(templated, fields):
+        with transaction.atomic():
+            for row in rows:
+                if row['code'] == 'status_other':
+                    message = STATUS_OTHER_PREFIX + row['params']['status']
+                else:
+                    message = TEMPLATES[row['code']].format(
+                        job_title=row['application__job__title'],
+                        company_name=row['application__job__company_name'],
+                    )
+                Notification.objects.filter(id=row['id']).update(code='custom', params=None, message=message)
+
+
+class Migration(migrations.Migration):
+
+    # Each batch commits on its own, so a large table is never locked for the whole run
+    atomic = False
+
+    dependencies = [
+        ('applications', '0009_notification_message_code'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode_messages, decode_messages),
+    ]
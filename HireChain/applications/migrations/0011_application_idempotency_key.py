@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_backfill_notification_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+    ]
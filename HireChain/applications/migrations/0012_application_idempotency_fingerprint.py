@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-17 23:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_application_idempotency_key'),
+        ('jobs', '0005_job_facets'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='idempotency_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('user', 'idempotency_key'), name='app_user_idempotency_key_uniq'),
+        ),
+    ]
@@ -1,6 +1,13 @@
+import json
+import zlib
+from datetime import datetime
+
 from django.db import models
 from django.conf import settings
+from django.urls import reverse
 from jobs.models import Job
+from .message_templates import CUSTOM, STATUS_OTHER, render_message, status_code
+from .storage import resume_storage
 
 
 class Application(models.Model):
@@ -21,23 +28,57 @@ class Application(models.Model):
     email = models.EmailField()
     phone = models.CharField(max_length=15)
     linkedin = models.URLField(blank=True, null=True)
-    resume = models.FileField(upload_to='resumes/', blank=True, null=True)
+    resume = models.FileField(upload_to='resumes/', storage=resume_storage, blank=True, null=True)
     portfolio = models.URLField(blank=True, null=True)
     cover_letter = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=30, choices=STATUS_CHOICES, default='new')
     applied_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
+    # Client-supplied key of the request that created the application, so a
+    # retried submission can be answered with the original result
+    idempotency_key = models.CharField(max_length=64, blank=True, null=True, editable=False)
+    # SHA-256 of that request, so the key cannot be reused for another one
+    idempotency_fingerprint = models.CharField(max_length=64, blank=True, null=True, editable=False)
     
     class Meta:
         db_table = 'applications'
         ordering = ['-applied_date']
         unique_together = ('user', 'job')
+        constraints = [
+            # A key creates at most one application per user, whichever job
+            models.UniqueConstraint(fields=['user', 'idempotency_key'], name='app_user_idempotency_key_uniq'),
+        ]
+        indexes = [
+            # Admin listing, newest first, optionally filtered or sorted by status
+            models.Index(fields=['-applied_date', '-id'], name='app_applied_idx'),
+            models.Index(fields=['-status', '-applied_date', '-id'], name='app_status_applied_idx'),
+            # Per-job listing and the job sort, by date or status. Every column
+            # runs the same way, so one index serves both sort directions
+            models.Index(fields=['-job', '-applied_date', '-id'], name='app_job_applied_idx'),
+            models.Index(fields=['-job', '-status', '-applied_date', '-id'], name='app_job_status_idx'),
+        ]
         verbose_name = 'Application'
         verbose_name_plural = 'Applications'
     
     def __str__(self):
         return f"{self.full_name} - {self.job.title}"
     
+    def to_detail_dict(self):
+        """Serialize for the application details APIs; load with select_related('job')"""
+        return {
+            'id': self.id,
+            'full_name': self.full_name,
+            'email': self.email,
+            'phone': self.phone,
+            'linkedin': self.linkedin,
+            'portfolio': self.portfolio,
+            'cover_letter': self.cover_letter,
+            'status': self.status,
+            'job_title': self.job.title,
+            'applied_date': self.applied_date.strftime('%B %d, %Y'),
+            'resume_url': reverse('applications:download_resume', args=[self.id]) if self.resume else None,
+        }
+    
     def get_status_badge_class(self):
         """Get CSS class for status badge"""
         status_classes = {
@@ -47,6 +88,12 @@ class Application(models.Model):
             'rejected': 'badge-rejected',
         }
         return status_classes.get(self.status, 'badge-default')
+    
+    def status_notification(self):
+        """Notification fields for telling the applicant about their current status"""
+        code = status_code(self.status)
+        params = {'status': self.get_status_display()} if code == STATUS_OTHER else None
+        return {'code': code, 'params': params}
 
 
 class Notification(models.Model):
@@ -56,15 +103,119 @@ class Notification(models.Model):
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notifications')
     application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='notifications')
-    message = models.TextField()
+    # The text is rendered from a template on read (see message_templates);
+    # only CUSTOM notifications keep their full text in ``message``
+    code = models.CharField(max_length=30, default=CUSTOM)
+    params = models.JSONField(blank=True, null=True)
+    message = models.TextField(blank=True, default='')
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         db_table = 'notifications'
         ordering = ['-created_at']
+        indexes = [
+            # A user's unread notifications, newest first
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=models.Q(is_read=False),
+                name='notif_user_unread_idx',
+            ),
+            # Read notifications by age, for compact_notifications
+            models.Index(
+                fields=['created_at', 'id'],
+                condition=models.Q(is_read=True),
+                name='notif_read_created_idx',
+            ),
+        ]
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
     
     def __str__(self):
-        return f"Notification for {self.user.username} - {self.message[:50]}"
+        return f"Notification for {self.user.username} - {self.get_message()[:50]}"
+    
+    def get_message(self):
+        """The notification text, rendered from its code and application's job"""
+        if self.code == CUSTOM:
+            return self.message
+        return render_message(self.code, self.application.job, self.params)
+    
+    def to_dict(self):
+        """Serialize for the notifications API and event stream"""
+        return {
+            'id': self.id,
+            'message': self.get_message(),
+            'created_at': self.created_at.strftime('%b %d, %Y %I:%M %p'),
+            'application_id': self.application_id,
+            'job_title': self.application.job.title,
+        }
+
+
+class NotificationArchive(models.Model):
+    """
+    Read notifications moved out of the notifications table by
+    ``compact_notifications``. Each row holds one user's share of one
+    compaction batch as zlib-compressed JSON.
+    Follows Single Responsibility Principle - stores archived notifications.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notification_archives'
+    )
+    first_created = models.DateTimeField()
+    last_created = models.DateTimeField()
+    count = models.PositiveIntegerField()
+    data = models.BinaryField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'notification_archive'
+        indexes = [
+            # A user's archived history, newest first
+            models.Index(fields=['user', '-last_created'], name='notif_archive_user_idx'),
+        ]
+        verbose_name = 'Notification Archive'
+        verbose_name_plural = 'Notification Archives'
+    
+    def __str__(self):
+        return f"{self.count} archived notification(s) for user {self.user_id}"
+    
+    @classmethod
+    def pack(cls, user_id, entries):
+        """
+        Build an archive row from ``entries``, dicts with ``id``, ``message``,
+        ``created_at`` (a datetime), ``application_id`` and ``job_title``,
+        oldest first.
+        """
+        payload = [{**entry, 'created_at': entry['created_at'].isoformat()} for entry in entries]
+        return cls(
+            user_id=user_id,
+            first_created=entries[0]['created_at'],
+            last_created=entries[-1]['created_at'],
+            count=len(entries),
+            data=zlib.compress(json.dumps(payload, separators=(',', ':')).encode()),
+        )
+    
+    def entries(self):
+        """The archived notifications, oldest first, with ``created_at`` as a datetime"""
+        entries = json.loads(zlib.decompress(self.data))
+        for entry in entries:
+            entry['created_at'] = datetime.fromisoformat(entry['created_at'])
+        return entries
+
+
+class ResumeFile(models.Model):
+    """
+    Reference count for a content-addressed resume file.
+    Identical uploads share one file; it is deleted when no application uses it.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'resume_files'
+        verbose_name = 'Resume File'
+        verbose_name_plural = 'Resume Files'
+    
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} reference(s))"
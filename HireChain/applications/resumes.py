@@ -0,0 +1,70 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import ResumeFile
+from .storage import resume_storage
+
+
+def acquire(name):
+    """Record one more application referencing the stored file ``name``"""
+    if not name:
+        return
+    if ResumeFile.objects.filter(name=name).update(ref_count=F('ref_count') + 1):
+        return
+    try:
+        with transaction.atomic():
+            ResumeFile.objects.create(name=name, ref_count=1)
+    except IntegrityError:
+        # Another request created the row first
+        ResumeFile.objects.filter(name=name).update(ref_count=F('ref_count') + 1)
+
+
+def release(name):
+    """
+    Drop one reference to ``name``; the file is deleted once the last
+    reference is gone and the surrounding transaction has committed.
+    """
+    if not name:
+        return
+    ResumeFile.objects.filter(name=name, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+    stored_at = _modified_time(name)
+    transaction.on_commit(lambda: collect(name, stored_at))
+
+
+def collect(name, stored_at):
+    """
+    Delete ``name`` if it is still unreferenced. The row stays locked
+    until the file is gone, so an acquire() waits and then starts a new
+    row. A file whose mtime moved since the release was stored again by
+    an upload that has not acquired it yet, and is kept.
+    """
+    with transaction.atomic():
+        row = ResumeFile.objects.select_for_update().filter(name=name).first()
+        if row is None or row.ref_count > 0:
+            return
+        if _modified_time(name) != stored_at:
+            return
+        row.delete()
+        resume_storage().delete(name)
+
+
+def _modified_time(name):
+    storage = resume_storage()
+    return storage.get_modified_time(name) if storage.exists(name) else None
+
+
+def discard(name):
+    """
+    Delete a file stored for an application that was never saved, unless
+    some application already references it.
+    """
+    if not name:
+        return
+    with transaction.atomic():
+        row = ResumeFile.objects.select_for_update().filter(name=name).first()
+        if row is not None:
+            if row.ref_count > 0:
+                return
+            # Left at zero by a collect() that saw this upload's mtime
+            row.delete()
+        resume_storage().delete(name)
@@ -0,0 +1,137 @@
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Notification, NotificationArchive
+
+# Display format of notification times, as in Notification.to_dict
+CREATED_AT_FORMAT = '%b %d, %Y %I:%M %p'
+
+
+def retention_cutoff(days=None):
+    """Read notifications created before this moment may be archived"""
+    if days is None:
+        days = settings.NOTIFICATION_RETENTION_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable_notifications(cutoff):
+    return Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+
+def compact_batch(cutoff, batch_size):
+    """
+    Move up to ``batch_size`` of the oldest archivable notifications into
+    NotificationArchive, one compressed row per user, and delete them.
+    Runs in its own short transaction; returns the number moved.
+    """
+    with transaction.atomic():
+        notifications = list(
+            archivable_notifications(cutoff)
+            .order_by('created_at', 'id')
+            .select_related('application__job')
+            .only(
+                'id', 'user_id', 'application_id', 'code', 'params', 'message', 'created_at',
+                'application__job__title', 'application__job__company_name',
+            )
+            [:batch_size]
+        )
+        if not notifications:
+            return 0
+
+        # Archived entries keep the rendered text, as the job may be gone by the time they are read
+        by_user = defaultdict(list)
+        for notification in notifications:
+            by_user[notification.user_id].append({
+                'id': notification.id,
+                'message': notification.get_message(),
+                'created_at': notification.created_at,
+                'application_id': notification.application_id,
+                'job_title': notification.application.job.title,
+            })
+        NotificationArchive.objects.bulk_create(
+            [NotificationArchive.pack(user_id, entries) for user_id, entries in by_user.items()]
+        )
+        Notification.objects.filter(id__in=[n.id for n in notifications]).delete()
+    return len(notifications)
+
+
+def compact_notifications(cutoff, batch_size=None, pause=0, on_batch=None):
+    """
+    Archive every read notification created before ``cutoff``, one batch
+    per transaction so writers are never locked out for long. ``pause``
+    seconds are slept between batches; ``on_batch`` is called with the
+    running total after each one. Returns the number archived.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_COMPACT_BATCH_SIZE
+    total = 0
+    while True:
+        moved = compact_batch(cutoff, batch_size)
+        total += moved
+        if moved and on_batch:
+            on_batch(total)
+        if moved < batch_size:
+            return total
+        if pause:
+            time.sleep(pause)
+
+
+def _history_entry(notification_id, message, created_at, application_id, job_title, is_read, archived):
+    return {
+        'id': notification_id,
+        'message': message,
+        'created_at': created_at.strftime(CREATED_AT_FORMAT),
+        'timestamp': created_at.isoformat(),
+        'application_id': application_id,
+        'job_title': job_title,
+        'is_read': is_read,
+        'archived': archived,
+    }
+
+
+def notification_history(user_id, limit, cursor=None):
+    """
+    A user's notifications, live and archived, newest first.
+    Ordered by ``(created_at, id)``, which archived entries keep, so rows
+    created in the same instant are told apart by id.
+    Returns ``(entries, next_cursor)``; pass ``next_cursor`` back as
+    ``cursor`` for the following page, or stop when it is None.
+    """
+    live = Notification.objects.filter(user_id=user_id).select_related('application__job')
+    chunks = NotificationArchive.objects.filter(user_id=user_id).order_by('-last_created', '-id')
+    if cursor is not None:
+        created_at, pk = cursor
+        live = live.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+        chunks = chunks.filter(first_created__lte=created_at)
+
+    entries = [
+        (n.created_at, n.id, _history_entry(
+            n.id, n.get_message(), n.created_at, n.application_id, n.application.job.title, n.is_read, False
+        ))
+        for n in live.order_by('-created_at', '-id')[:limit + 1]
+    ]
+    for chunk in chunks.iterator():
+        # Once a page and one more are in hand, a chunk whose newest entry is
+        # older than all of them (and every chunk after it) cannot change the page
+        if len(entries) > limit:
+            entries.sort(key=lambda item: (item[0], item[1]), reverse=True)
+            del entries[limit + 1:]
+            if chunk.last_created < entries[-1][0]:
+                break
+        for entry in chunk.entries():
+            if cursor is not None and (entry['created_at'], entry['id']) >= cursor:
+                continue
+            entries.append((entry['created_at'], entry['id'], _history_entry(
+                entry['id'], entry['message'], entry['created_at'], entry['application_id'],
+                entry['job_title'], True, True
+            )))
+
+    entries.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    page = entries[:limit]
+    next_cursor = page[-1][:2] if len(entries) > limit else None
+    return [entry for _, _, entry in page], next_cursor
@@ -0,0 +1,187 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from jobs.search import tokenize
+
+# Columns indexed for applicant search, in the order they are stored
+SEARCH_FIELDS = ('full_name', 'email', 'phone', 'job_title', 'cover_letter')
+
+SEARCH_TABLE = 'applications_search'
+
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Shortest trailing run of phone digits that is indexed on its own
+MIN_PHONE_SUFFIX = 4
+
+# Applications re-indexed per batch when a job title changes
+REINDEX_BATCH_SIZE = 1000
+
+
+def _phone_terms(phone):
+    """
+    The phone as typed plus every trailing run of its digits, so prefix
+    queries match a number with or without country and area codes.
+    """
+    digits = _NON_DIGIT_RE.sub('', phone)
+    suffixes = [digits[i:] for i in range(len(digits) - MIN_PHONE_SUFFIX + 1)]
+    return ' '.join([phone] + suffixes)
+
+
+def _application_table():
+    from .models import Application
+
+    return connection.ops.quote_name(Application._meta.db_table)
+
+
+def _document_values(application, job_title):
+    """Column values for an application as stored in the index"""
+    return [
+        application.full_name or '',
+        application.email or '',
+        _phone_terms(application.phone or ''),
+        job_title or '',
+        application.cover_letter or '',
+    ]
+
+
+class BaseApplicantSearchBackend:
+    """
+    Interface for applicant search backends.
+    Follows Dependency Inversion Principle - views depend on this interface,
+    not on a particular database's full-text engine.
+    """
+
+    def index_application(self, application, job_title):
+        raise NotImplementedError
+
+    def remove_application(self, application_id):
+        raise NotImplementedError
+
+    def prune(self):
+        """Drop entries for applications that no longer exist"""
+        raise NotImplementedError
+
+    def filter(self, queryset, query):
+        """Restrict an Application queryset to rows matching every token of ``query``"""
+        raise NotImplementedError
+
+    def reindex_job(self, job):
+        """Re-index a job's applications under its current title"""
+        from .models import Application
+
+        applications = Application.objects.filter(job=job).iterator(chunk_size=REINDEX_BATCH_SIZE)
+        for application in applications:
+            self.index_application(application, job.title)
+
+
+class SQLiteApplicantSearchBackend(BaseApplicantSearchBackend):
+    """FTS5 virtual table keyed by application id with prefix indexes"""
+
+    def index_application(self, application, job_title):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [application.id])
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, {", ".join(SEARCH_FIELDS)}) '
+                f'VALUES (%s, {", ".join(["%s"] * len(SEARCH_FIELDS))})',
+                [application.id] + _document_values(application, job_title)
+            )
+
+    def remove_application(self, application_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [application_id])
+
+    def prune(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid NOT IN (SELECT id FROM {_application_table()})'
+            )
+
+    def filter(self, queryset, query):
+        tokens = tokenize(query)
+        if not tokens:
+            return queryset
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        return queryset.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s', [match]
+        ))
+
+
+class PostgresApplicantSearchBackend(BaseApplicantSearchBackend):
+    """
+    tsvector table with a GIN index. Uses the 'simple' configuration so
+    names, emails and phone numbers are indexed verbatim rather than stemmed.
+    """
+
+    def _document_sql(self):
+        return ' || '.join(["to_tsvector('simple', %s)"] * len(SEARCH_FIELDS))
+
+    def index_application(self, application, job_title):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (application_id, document) '
+                f'VALUES (%s, {self._document_sql()}) '
+                f'ON CONFLICT (application_id) DO UPDATE SET document = EXCLUDED.document',
+                [application.id] + _document_values(application, job_title)
+            )
+
+    def remove_application(self, application_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE application_id = %s', [application_id])
+
+    def prune(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} s WHERE NOT EXISTS '
+                f'(SELECT 1 FROM {_application_table()} a WHERE a.id = s.application_id)'
+            )
+
+    def filter(self, queryset, query):
+        tokens = tokenize(query)
+        if not tokens:
+            return queryset
+        tsquery = ' & '.join(f'{token}:*' for token in tokens)
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT application_id FROM {SEARCH_TABLE} "
+            f"WHERE document @@ to_tsquery('simple', %s)", [tsquery]
+        ))
+
+
+class FallbackApplicantSearchBackend(BaseApplicantSearchBackend):
+    """Unindexed icontains search for databases without a full-text engine"""
+
+    def index_application(self, application, job_title):
+        pass
+
+    def remove_application(self, application_id):
+        pass
+
+    def prune(self):
+        pass
+
+    def filter(self, queryset, query):
+        for token in tokenize(query):
+            queryset = queryset.filter(
+                Q(full_name__icontains=token) | Q(email__icontains=token)
+                | Q(phone__icontains=token) | Q(job__title__icontains=token)
+                | Q(cover_letter__icontains=token)
+            )
+        return queryset
+
+
+_BACKENDS = {
+    'sqlite': SQLiteApplicantSearchBackend,
+    'postgresql': PostgresApplicantSearchBackend,
+}
+
+
+def get_applicant_search_backend():
+    """Return the applicant search backend matching the default database"""
+    return _BACKENDS.get(connection.vendor, FallbackApplicantSearchBackend)()
+
+
+def search_applications(queryset, query):
+    """Filter an Application queryset by a free-text query"""
+    return get_applicant_search_backend().filter(queryset, query)
@@ -0,0 +1,95 @@
+from django.db.models.signals import post_init, pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from jobs.models import Job
+from .counters import increment_unread, decrement_unread
+from .idempotency import applied_keys
+from .models import Application, Notification
+from .search import get_applicant_search_backend
+from . import resumes
+
+
+@receiver(post_save, sender=Application)
+def sync_application_search_index(sender, instance, raw=False, **kwargs):
+    """Keep the applicant search index in step with the saved application"""
+    if raw:
+        return
+    get_applicant_search_backend().index_application(instance, instance.job.title)
+
+
+@receiver(post_delete, sender=Application)
+def remove_application_from_search_index(sender, instance, **kwargs):
+    """Drop a deleted application from the applicant search index"""
+    get_applicant_search_backend().remove_application(instance.id)
+
+
+@receiver(pre_save, sender=Job)
+def remember_job_title(sender, instance, raw=False, **kwargs):
+    """Stash the stored title so post_save can tell whether it changed"""
+    if raw or instance.pk is None or instance._state.adding:
+        instance._indexed_title = None
+        return
+    instance._indexed_title = Job.objects.filter(pk=instance.pk).values_list('title', flat=True).first()
+
+
+@receiver(post_save, sender=Job)
+def reindex_job_applications(sender, instance, created=False, raw=False, **kwargs):
+    """Re-index a job's applications when its title changes"""
+    old_title = getattr(instance, '_indexed_title', None)
+    if raw or created or old_title is None or old_title == instance.title:
+        return
+    get_applicant_search_backend().reindex_job(instance)
+
+
+@receiver(post_save, sender=Notification)
+def count_new_notification(sender, instance, created=False, raw=False, **kwargs):
+    """Bump the owner's unread counter for a new unread notification"""
+    if raw or not created or instance.is_read:
+        return
+    increment_unread(instance.user_id)
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_deleted_notification(sender, instance, **kwargs):
+    """Keep the unread counter right when an unread notification is deleted"""
+    if not instance.is_read:
+        decrement_unread(instance.user_id)
+
+
+def _resume_name(value):
+    return getattr(value, 'name', value) or ''
+
+
+@receiver(post_init, sender=Application)
+def remember_resume(sender, instance, **kwargs):
+    """Note the loaded resume so a replaced file can be released on save"""
+    # Read the raw attribute so a deferred resume is not fetched
+    if 'resume' in instance.__dict__:
+        instance._stored_resume = _resume_name(instance.__dict__['resume'])
+
+
+@receiver(post_save, sender=Application)
+def count_resume_references(sender, instance, created=False, raw=False, **kwargs):
+    """Keep resume reference counts in step with the saved application"""
+    if raw or not hasattr(instance, '_stored_resume'):
+        return
+    previous = '' if created else instance._stored_resume
+    current = _resume_name(instance.resume)
+    if current != previous:
+        resumes.acquire(current)
+        resumes.release(previous)
+    instance._stored_resume = current
+
+
+@receiver(post_delete, sender=Application)
+def forget_idempotency_key(sender, instance, **kwargs):
+    """Stop answering retries with a deleted application"""
+    if instance.idempotency_key:
+        applied_keys.forget(instance.user_id, instance.idempotency_key)
+
+
+@receiver(post_delete, sender=Application)
+def release_resume(sender, instance, **kwargs):
+    """Drop the deleted application's reference to its resume"""
+    if 'resume' in instance.__dict__:
+        resumes.release(_resume_name(instance.resume))
@@ -0,0 +1,72 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage, storages
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File storage that names each file after the SHA-256 of its contents.
+    Files are hashed while being streamed to a temporary file and then
+    moved to a sharded path such as ``resumes/ab/cd/<sha256>.pdf``; a file
+    whose contents are already stored is discarded instead of written twice.
+    Follows Open/Closed Principle - extends FileSystemStorage.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, prefix='resumes', **kwargs):
+        self.prefix = prefix
+        super().__init__(**kwargs)
+
+    def hashed_name(self, hexdigest, extension):
+        """Sharded storage path for a digest"""
+        return f'{self.prefix}/{hexdigest[:2]}/{hexdigest[2:4]}/{hexdigest}{extension}'
+
+    def is_hashed_name(self, name):
+        """True if ``name`` is already a content-addressed path"""
+        parts = name.split('/')
+        if len(parts) != 4 or parts[0] != self.prefix:
+            return False
+        digest = os.path.splitext(parts[3])[0]
+        return len(digest) == 64 and parts[1] == digest[:2] and parts[2] == digest[2:4]
+
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content, so it never needs a suffix
+        return name
+
+    def _save(self, name, content):
+        extension = os.path.splitext(name)[1].lower()
+        tmp_dir = self.path(f'{self.prefix}/tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                for chunk in content.chunks(self.chunk_size):
+                    digest.update(chunk)
+                    tmp_file.write(chunk)
+
+            name = self.hashed_name(digest.hexdigest(), extension)
+            full_path = self.path(name)
+            if os.path.exists(full_path):
+                # Same contents already stored; the new mtime keeps a
+                # pending collection from deleting it (see resumes.collect)
+                os.remove(tmp_path)
+                os.utime(full_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(tmp_path, self.file_permissions_mode)
+                os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return name
+
+
+def resume_storage():
+    """Storage for Application.resume, configured as STORAGES['resumes']"""
+    return storages['resumes']
@@ -0,0 +1,31 @@
+from taskqueue.registry import task
+from .message_templates import SUBMITTED
+from .models import Application, Notification
+
+
+@task()
+def notify_application_submitted(application_id):
+    """Tell an applicant their application was received"""
+    application = Application.objects.filter(id=application_id).first()
+    if application is None:
+        return
+    Notification.objects.create(
+        user_id=application.user_id,
+        application=application,
+        code=SUBMITTED,
+    )
+
+
+@task()
+def notify_status_change(application_id, status):
+    """Tell an applicant their application moved to ``status``"""
+    application = Application.objects.filter(id=application_id).first()
+    if application is None:
+        return
+    # Describe the transition that was queued, even if the status has moved on since
+    application.status = status
+    Notification.objects.create(
+        user_id=application.user_id,
+        application=application,
+        **application.status_notification()
+    )
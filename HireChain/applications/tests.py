@@ -1,3 +1,752 @@
-from django.test import TestCase
+import asyncio
+import base64
+import csv
+import io
+import hashlib
+import importlib
+import json
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+
+from accounts.models import CustomUser
+from jobs.models import Job
+from jobs.tests import QueryPlanMixin
+from .bulk import MAX_BULK_IDS, NOT_FOUND, UNCHANGED, UPDATED
+from .counters import decrement_unread
+from .exports import csv_chunks, export_queryset
+from .events import NotificationRelay, broker, relay
+from .idempotency import applied_keys
+from .listing import SORT_FIELDS
+from . import resumes
+from .models import Application, Notification, NotificationArchive, ResumeFile
+from .retention import compact_batch
+from .search import SEARCH_TABLE, get_applicant_search_backend, search_applications
+from .storage import resume_storage
+
+
+class TemporaryMediaMixin:
+    """Store uploaded files in a directory removed after each test"""
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media = override_settings(MEDIA_ROOT=media_root.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+
+class ApplicationQueryPlanTests(QueryPlanMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com', 'password')
+        cls.job = Job.objects.create(
+            title='Engineer', company_name='Acme', location='Remote', description='Build things'
+        )
+        cls.application = Application.objects.create(
+            user=cls.user, job=cls.job, full_name='Jane Doe',
+            email='jane@example.com', phone='5550100'
+        )
+        Notification.objects.create(user=cls.user, application=cls.application, message='Submitted')
+
+    def test_unread_notifications_use_partial_index(self):
+        queryset = Notification.objects.filter(user=self.user, is_read=False).order_by('-created_at')[:10]
+        self.assertUsesIndex(queryset, 'notif_user_unread_idx')
+
+    def test_mark_all_read_uses_partial_index(self):
+        queryset = Notification.objects.filter(user=self.user, is_read=False)
+        self.assertUsesIndex(queryset, 'notif_user_unread_idx')
+
+    def test_status_listing_uses_index(self):
+        queryset = Application.objects.filter(status='new').order_by('-applied_date')[:50]
+        self.assertUsesIndex(queryset, 'app_status_applied_idx')
+
+    def test_unfiltered_listing_uses_index(self):
+        queryset = Application.objects.order_by('-applied_date')[:50]
+        self.assertUsesIndex(queryset, 'app_applied_idx')
+
+    def test_duplicate_application_check_uses_unique_index(self):
+        # Served by the index behind unique_together ('user', 'job')
+        queryset = Application.objects.filter(user=self.user, job=self.job)
+        self.assertUsesIndex(queryset)
+
+
+class NotificationStreamTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('listener', 'listener@example.com', 'password')
+        cls.job = Job.objects.create(
+            title='Engineer', company_name='Acme', location='Remote', description='Build things'
+        )
+        cls.application = Application.objects.create(
+            user=cls.user, job=cls.job, full_name='Jane Doe',
+            email='jane@example.com', phone='5550100'
+        )
+
+    def setUp(self):
+        # As the test client does, keep the handler from closing the test transaction's connection
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+
+    async def open_stream(self):
+        """
+        Request the event stream through the ASGI handler, as a server would.
+        Returns the queue of sent ASGI messages and a coroutine to disconnect.
+        """
+        await self.async_client.aforce_login(self.user)
+        cookie = f'{settings.SESSION_COOKIE_NAME}={self.async_client.cookies[settings.SESSION_COOKIE_NAME].value}'
+        path = reverse('applications:notification_stream')
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+            'query_string': b'', 'root_path': '', 'client': ('127.0.0.1', 50000),
+            'server': ('testserver', 80),
+            'headers': [(b'host', b'testserver'), (b'cookie', cookie.encode())],
+        }
+        sent = asyncio.Queue()
+        disconnected = asyncio.Event()
+        requested = False
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        handler = asyncio.create_task(ASGIHandler()(scope, receive, sent.put))
+
+        async def disconnect():
+            disconnected.set()
+            await asyncio.wait_for(handler, 5)
+            # Let the relay notice the stream has gone before the loop closes
+            if relay._task is not None:
+                await asyncio.wait_for(relay._task, 5)
+
+        start = await asyncio.wait_for(sent.get(), 5)
+        self.assertEqual(start['status'], 200)
+        first = await asyncio.wait_for(sent.get(), 5)
+        self.assertEqual(first['body'], b'retry: 3000\n\n')
+        self.assertTrue(first['more_body'])
+        return sent, disconnect
+
+    async def test_asgi_stream_sends_events_before_closing(self):
+        sent, disconnect = await self.open_stream()
+        try:
+            # Well inside NOTIFICATION_STREAM_MAX_AGE, so only incremental delivery passes
+            broker.publish(self.user.id, {'id': 10 ** 9, 'message': 'Hello'})
+            event = await asyncio.wait_for(sent.get(), 5)
+            self.assertIn(b'event: notification', event['body'])
+            self.assertIn(b'"Hello"', event['body'])
+        finally:
+            await disconnect()
+
+    @override_settings(NOTIFICATION_RELAY_INTERVAL=0.05)
+    async def test_relay_delivers_notifications_written_elsewhere(self):
+        sent, disconnect = await self.open_stream()
+        try:
+            # Written without publishing, as a background worker process would
+            notification = await Notification.objects.acreate(
+                user=self.user, application=self.application, message='From a worker'
+            )
+            event = await asyncio.wait_for(sent.get(), 5)
+            self.assertIn(f'id: {notification.id}\n'.encode(), event['body'])
+            self.assertIn(b'"From a worker"', event['body'])
+        finally:
+            await disconnect()
+
+    def test_relay_reads_back_for_ids_that_commit_late(self):
+        earlier, later = [
+            Notification.objects.create(user=self.user, application=self.application, message=message)
+            for message in ('Earlier id', 'Later id')
+        ]
+        # The later id's transaction committed first and has been relayed
+        tail = NotificationRelay(broker)
+        tail._relay(tail._new_notifications(earlier.id, set()))
+        self.assertEqual(tail._last_id, later.id)
+        notifications = tail._new_notifications(tail._last_id, {later.id})
+        self.assertEqual([n['id'] for n in notifications], [earlier.id])
+        tail._relay(notifications)
+        self.assertEqual(tail._new_notifications(tail._last_id, tail._seen), [])
+
+    def test_wsgi_stream_asks_client_to_poll(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('applications:notification_stream'))
+        self.assertEqual(response.status_code, 204)
+
+    def test_wsgi_poll_answers_at_once_with_retry(self):
+        self.client.force_login(self.user)
+        notification = Notification.objects.create(
+            user=self.user, application=self.application, message='Submitted'
+        )
+        response = self.client.get(reverse('applications:poll_notifications'), {'last_id': notification.id - 1})
+        data = response.json()
+        self.assertEqual([n['id'] for n in data['notifications']], [notification.id])
+        self.assertEqual(data['retry'], settings.NOTIFICATION_POLL_INTERVAL * 1000)
+
+
+class ApplyIdempotencyTests(TemporaryMediaMixin, TestCase):
+
+    form = {'full_name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '5550100'}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com', 'password')
+        cls.job, cls.other_job = [
+            Job.objects.create(title=title, company_name='Acme', location='Remote', description='Build things')
+            for title in ('Engineer', 'Designer')
+        ]
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def apply(self, job=None, key=None, **data):
+        headers = {'Idempotency-Key': key} if key else {}
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse('applications:apply_job', args=[(job or self.job).id]),
+                {**self.form, **data}, headers=headers,
+            )
+
+    def assertNoWrites(self, queries):
+        writes = [query['sql'] for query in queries if query['sql'].split()[0] in ('INSERT', 'UPDATE', 'DELETE')]
+        self.assertEqual(writes, [])
+
+    def test_replay_returns_first_result_without_writes(self):
+        first = self.apply(key='retry-1').json()
+        with CaptureQueriesContext(connection) as queries:
+            replay = self.apply(key='retry-1')
+        self.assertEqual(replay.json(), first)
+        self.assertNoWrites(queries)
+
+    def test_replay_after_key_expired_returns_first_result(self):
+        first = self.apply(key='retry-1').json()
+        applied_keys.forget(self.user.id, 'retry-1')
+        self.assertEqual(self.apply(key='retry-1').json(), first)
+        self.assertEqual(Application.objects.count(), 1)
+
+    def test_malformed_key_is_rejected(self):
+        self.assertEqual(self.apply(key='not a key!').status_code, 400)
+        self.assertFalse(Application.objects.exists())
+
+    def test_key_reused_with_different_form_is_rejected(self):
+        self.apply(key='retry-1')
+        self.assertEqual(self.apply(key='retry-1', full_name='Someone Else').status_code, 422)
+        applied_keys.forget(self.user.id, 'retry-1')
+        self.assertEqual(self.apply(key='retry-1', full_name='Someone Else').status_code, 422)
+
+    def test_key_reused_for_another_job_is_rejected(self):
+        self.apply(key='retry-1')
+        self.assertEqual(self.apply(job=self.other_job, key='retry-1').status_code, 422)
+        applied_keys.forget(self.user.id, 'retry-1')
+        self.assertEqual(self.apply(job=self.other_job, key='retry-1').status_code, 422)
+        self.assertFalse(Application.objects.filter(job=self.other_job).exists())
+
+    def test_double_submit_without_key_creates_one_application(self):
+        self.assertEqual(self.apply().status_code, 200)
+        self.assertEqual(self.apply().status_code, 400)
+        self.assertEqual(Application.objects.filter(user=self.user, job=self.job).count(), 1)
+
+    def test_duplicate_discards_its_uploaded_resume(self):
+        kept, dropped = b'%PDF first resume', b'%PDF second resume'
+        self.apply(resume=SimpleUploadedFile('cv.pdf', kept))
+        self.assertEqual(self.apply(resume=SimpleUploadedFile('cv.pdf', dropped)).status_code, 400)
+
+        storage = resume_storage()
+        kept_name, dropped_name = [
+            storage.hashed_name(hashlib.sha256(content).hexdigest(), '.pdf') for content in (kept, dropped)
+        ]
+        self.assertEqual(Application.objects.get().resume.name, kept_name)
+        self.assertTrue(storage.exists(kept_name))
+        self.assertFalse(storage.exists(dropped_name))
+
+
+class ApplicationListApiTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user('admin', 'admin@example.com', 'password', user_type='admin')
+        jobs = [
+            Job.objects.create(title=title, company_name='Acme', location='Remote', description='Build things')
+            for title in ('Engineer', 'Designer')
+        ]
+        for n in range(5):
+            user = CustomUser.objects.create_user(f'applicant{n}', f'applicant{n}@example.com')
+            for job in jobs:
+                Application.objects.create(
+                    user=user, job=job, full_name=f'Applicant {n}', email=user.email, phone='5550100',
+                    status='new' if n % 2 else 'reviewing',
+                )
+        # Ties on every leading sort column, so only the id tells rows apart
+        Application.objects.update(applied_date=timezone.now())
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def get_page(self, **params):
+        return self.client.get(reverse('applications:applications_list_api'), {'limit': 3, **params})
+
+    def walk(self, sort, direction):
+        ids, cursor = [], None
+        while True:
+            params = {'sort': sort, 'dir': direction, **({'cursor': cursor} if cursor else {})}
+            page = self.get_page(**params).json()
+            ids += [row[0] for row in page['rows']]
+            cursor = page['next_cursor']
+            if cursor is None:
+                return ids
+
+    def test_cursors_walk_tied_rows_once_each(self):
+        for sort, fields in SORT_FIELDS.items():
+            for direction, prefix in (('desc', '-'), ('asc', '')):
+                with self.subTest(sort=sort, dir=direction):
+                    ordering = [prefix + field for field in fields]
+                    expected = list(Application.objects.order_by(*ordering).values_list('id', flat=True))
+                    self.assertEqual(self.walk(sort, direction), expected)
+
+    @staticmethod
+    def encode(values):
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def test_invalid_cursor_is_rejected(self):
+        encode = self.encode
+        applied = timezone.now().isoformat()
+        cursors = [
+            'not a cursor!',
+            encode('status'),
+            encode(['new', applied]),
+            encode([None, None, None]),
+            encode(['new', 123, 1]),
+            encode(['new', applied, 'abc']),
+            encode(['new', 'yesterday', 1]),
+        ]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.get_page(sort='status', cursor=cursor).status_code, 400)
+
+
+class UnreadCounterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com', 'password')
+        cls.application = Application.objects.create(
+            user=cls.user, full_name='Jane Doe', email='jane@example.com', phone='5550100',
+            job=Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build things'),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def notify(self, count=1):
+        return [
+            Notification.objects.create(user=self.user, application=self.application, message='Submitted')
+            for _ in range(count)
+        ]
+
+    def unread(self):
+        return CustomUser.objects.values_list('unread_notifications', flat=True).get(pk=self.user.pk)
+
+    def test_create_increments(self):
+        self.notify(2)
+        self.assertEqual(self.unread(), 2)
+
+    def test_mark_read_decrements_once(self):
+        [notification, _] = self.notify(2)
+        url = reverse('applications:mark_notification_read', args=[notification.id])
+        self.client.post(url)
+        self.client.post(url)
+        self.assertEqual(self.unread(), 1)
+
+    def test_mark_all_read_decrements_by_unread_rows(self):
+        self.notify(3)
+        self.client.post(reverse('applications:mark_all_notifications_read'))
+        self.assertEqual(self.unread(), 0)
+
+    def test_never_drops_below_zero(self):
+        [notification] = self.notify()
+        CustomUser.objects.filter(pk=self.user.pk).update(unread_notifications=0)
+        self.client.post(reverse('applications:mark_notification_read', args=[notification.id]))
+        decrement_unread(self.user.id, 5)
+        self.assertEqual(self.unread(), 0)
+
+    def test_user_save_keeps_counter(self):
+        user = CustomUser.objects.get(pk=self.user.pk)
+        self.notify(2)
+        user.first_name = 'Jane'
+        user.save()
+        user.refresh_from_db()
+        self.assertEqual((user.first_name, user.unread_notifications), ('Jane', 2))
+
+
+class NotificationRetentionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com', 'password')
+        cls.other = CustomUser.objects.create_user('other', 'other@example.com', 'password')
+        cls.application = Application.objects.create(
+            user=cls.user, full_name='Jane Doe', email='jane@example.com', phone='5550100',
+            job=Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build things'),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def notify(self, user, count, is_read=True):
+        return [
+            Notification.objects.create(
+                user=user, application=self.application, message=f'Update {n}', is_read=is_read
+            ).id
+            for n in range(count)
+        ]
+
+    def test_compact_batch_archives_oldest_read_notifications(self):
+        archived = self.notify(self.user, 3) + self.notify(self.other, 1)
+        kept = self.notify(self.user, 1, is_read=False)
+        old = timezone.now() - timedelta(days=1)
+        Notification.objects.update(created_at=old)
+        Notification.objects.filter(id=archived[-1]).update(created_at=old + timedelta(seconds=1))
+
+        self.assertEqual(compact_batch(timezone.now(), batch_size=3), 3)
+        self.assertEqual(compact_batch(timezone.now(), batch_size=3), 1)
+        self.assertEqual(compact_batch(timezone.now(), batch_size=3), 0)
+        self.assertEqual(list(Notification.objects.values_list('id', flat=True)), kept)
+        entries = [
+            (archive.user_id, entry['id'], entry['message'])
+            for archive in NotificationArchive.objects.order_by('id') for entry in archive.entries()
+        ]
+        self.assertEqual(entries, [
+            (self.user.id, archived[0], 'Update 0'),
+            (self.user.id, archived[1], 'Update 1'),
+            (self.user.id, archived[2], 'Update 2'),
+            (self.other.id, archived[3], 'Update 0'),
+        ])
+
+    def test_compact_batch_keeps_recent_notifications(self):
+        self.notify(self.user, 2)
+        self.assertEqual(compact_batch(timezone.now() - timedelta(days=1), batch_size=10), 0)
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_history_pages_through_tied_timestamps(self):
+        ids = self.notify(self.user, 5) + self.notify(self.user, 2, is_read=False)
+        Notification.objects.update(created_at=timezone.now() - timedelta(days=1))
+        compact_batch(timezone.now(), batch_size=3)
+
+        seen, cursor = [], None
+        while True:
+            params = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            page = self.client.get(reverse('applications:notification_history'), params).json()
+            seen += [entry['id'] for entry in page['notifications']]
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(seen, sorted(ids, reverse=True))
+
+    def test_invalid_history_cursor_is_rejected(self):
+        response = self.client.get(reverse('applications:notification_history'), {'cursor': 'not a cursor!'})
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(TASK_QUEUE_EAGER=True)
+class BulkStatusUpdateTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user('admin', 'admin@example.com', 'password', user_type='admin')
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com', 'password')
+        cls.new, cls.reviewing = [
+            Application.objects.create(
+                user=cls.user, full_name='Jane Doe', email='jane@example.com', phone='5550100', status=status,
+                job=Job.objects.create(title=title, company_name='Acme', location='Remote', description='Build things'),
+            )
+            for title, status in (('Engineer', 'new'), ('Designer', 'reviewing'))
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def update(self, ids, status='reviewing'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse('applications:bulk_update_status'),
+                json.dumps({'ids': ids, 'status': status}), content_type='application/json',
+            )
+
+    def test_results_per_id(self):
+        missing = self.reviewing.id + 1000
+        response = self.update([self.new.id, self.reviewing.id, missing])
+        self.assertEqual(response.json()['results'], {
+            str(self.new.id): UPDATED, str(self.reviewing.id): UNCHANGED, str(missing): NOT_FOUND,
+        })
+        self.new.refresh_from_db()
+        self.assertEqual(self.new.status, 'reviewing')
+
+    def test_only_changed_applications_are_notified(self):
+        self.update([self.new.id, self.reviewing.id])
+        self.assertEqual(
+            list(Notification.objects.values_list('application_id', flat=True)), [self.new.id]
+        )
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.unread_notifications, 1)
+
+    def test_repeat_update_sends_nothing(self):
+        self.update([self.new.id])
+        self.assertEqual(self.update([self.new.id]).json()['results'], {str(self.new.id): UNCHANGED})
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_invalid_status_is_rejected(self):
+        self.assertEqual(self.update([self.new.id], status='hired!').status_code, 400)
+        self.new.refresh_from_db()
+        self.assertEqual(self.new.status, 'new')
+
+    def test_too_many_ids_are_rejected(self):
+        response = self.update(list(range(1, MAX_BULK_IDS + 2)))
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_non_admin_is_refused(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.update([self.new.id]).status_code, 403)
+
+
+class CsvExportTests(TestCase):
+
+    names = ['=SUM(A1:A2)', '+cmd|calc', '-2+3', '@SUM(A1)', '\tTabbed', '\rReturned', 'Jane Doe']
+
+    @classmethod
+    def setUpTestData(cls):
+        job = Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build things')
+        for n, name in enumerate(cls.names):
+            user = CustomUser.objects.create_user(f'applicant{n}', f'applicant{n}@example.com')
+            Application.objects.create(
+                user=user, job=job, full_name=name, email=user.email, phone='+1 (555) 010-2000'
+            )
+
+    def export(self):
+        rows = list(csv.DictReader(io.StringIO(''.join(csv_chunks(export_queryset())), newline='')))
+        return {row['id']: row for row in rows}
+
+    def test_formula_cells_are_escaped(self):
+        rows = self.export()
+        for application in Application.objects.all():
+            with self.subTest(name=application.full_name):
+                expected = application.full_name if application.full_name == 'Jane Doe' else "'" + application.full_name
+                self.assertEqual(rows[str(application.id)]['full_name'], expected)
+
+    def test_phone_numbers_are_left_alone(self):
+        self.assertEqual({row['phone'] for row in self.export().values()}, {'+1 (555) 010-2000'})
+
+
+class NotificationCodeBackfillTests(TestCase):
+
+    migration = importlib.import_module('applications.migrations.0010_backfill_notification_codes')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com', 'password')
+        cls.application = Application.objects.create(
+            user=cls.user, full_name='Jane Doe', email='jane@example.com', phone='5550100',
+            job=Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build things'),
+        )
+
+    def legacy(self, message):
+        return Notification.objects.create(user=self.user, application=self.application, message=message).id
+
+    def test_backfill_encodes_legacy_messages_in_batches(self):
+        submitted = self.legacy('Your application for Engineer at Acme has been submitted successfully!')
+        reviewing = self.legacy(
+            'Good news! Your application for Engineer is now being reviewed by the hiring team.'
+        )
+        hired = self.legacy('Your application status has been updated to: Hired')
+        custom = self.legacy('Please bring your portfolio.')
+        rendered = {n.id: n.get_message() for n in Notification.objects.select_related('application__job')}
+
+        with mock.patch.object(self.migration, 'BATCH_SIZE', 2):
+            self.migration.encode_messages(apps, None)
+        stored = {n.id: n for n in Notification.objects.select_related('application__job')}
+        self.assertEqual(
+            {id_: (n.code, n.params, n.message) for id_, n in stored.items()},
+            {
+                submitted: ('submitted', None, ''),
+                reviewing: ('status_reviewing', None, ''),
+                hired: ('status_other', {'status': 'Hired'}, ''),
+                custom: ('custom', None, 'Please bring your portfolio.'),
+            },
+        )
+        self.assertEqual({id_: n.get_message() for id_, n in stored.items()}, rendered)
+
+        self.migration.decode_messages(apps, None)
+        self.assertEqual(set(Notification.objects.values_list('code', flat=True)), {'custom'})
+        self.assertEqual(dict(Notification.objects.values_list('id', 'message')), rendered)
+
+
+class ApplicantSearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build things')
+        cls.applications = [
+            Application.objects.create(
+                user=CustomUser.objects.create_user(f'applicant{n}', email), job=cls.job,
+                full_name=name, email=email, phone=phone,
+            )
+            for n, (name, email, phone) in enumerate((
+                ('Zoë Müller', 'zoe@example.com', '+1 (555) 010-2000'),
+                ('Jane Doe', 'jane@example.com', '5550100'),
+            ))
+        ]
+
+    def names(self, query):
+        return sorted(search_applications(Application.objects.all(), query).values_list('full_name', flat=True))
+
+    def test_prefix_matches(self):
+        self.assertEqual(self.names('jan'), ['Jane Doe'])
+        self.assertEqual(self.names('jane@exa'), ['Jane Doe'])
+        self.assertEqual(self.names('2000'), ['Zoë Müller'])
+
+    @skipUnless(connection.vendor == 'sqlite', 'the FTS5 tokenizer folds diacritics')
+    def test_diacritics_are_folded(self):
+        self.assertEqual(self.names('muller'), ['Zoë Müller'])
+        self.assertEqual(self.names('zoë'), ['Zoë Müller'])
+
+    def test_index_follows_save_and_delete(self):
+        application = self.applications[1]
+        application.full_name = 'Janet Roe'
+        application.save()
+        self.assertEqual(self.names('roe'), ['Janet Roe'])
+        self.assertEqual(self.names('doe'), [])
+        application.delete()
+        self.assertEqual(self.names('roe'), [])
+
+    def test_index_follows_job_title(self):
+        self.job.title = 'Designer'
+        self.job.save()
+        self.assertEqual(self.names('designer'), ['Jane Doe', 'Zoë Müller'])
+
+    def test_rebuild_indexes_changes_and_drops_stale_entries(self):
+        backend = get_applicant_search_backend()
+        # Changed without signals, so the index is out of step until rebuilt
+        Application.objects.filter(id=self.applications[1].id).update(full_name='Janet Roe')
+        orphan = Application(id=self.applications[1].id + 1000, full_name='Orphan', email='', phone='')
+        backend.index_application(orphan, 'Engineer')
+        call_command('rebuild_applicant_index', batch_size=1, stdout=io.StringIO())
+        self.assertEqual(self.names('roe'), ['Janet Roe'])
+        self.assertEqual(self.names('doe'), [])
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {SEARCH_TABLE}')
+            self.assertEqual(cursor.fetchone()[0], len(self.applications))
+
+
+class ResumeCollectionTests(TemporaryMediaMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com')
+        cls.job = Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build')
+
+    def setUp(self):
+        super().setUp()
+        self.storage = resume_storage()
+        self.name = self.storage.save('cv.pdf', ContentFile(b'%PDF resume'))
+        # Stored a while ago, so storing it again visibly moves the mtime
+        os.utime(self.storage.path(self.name), (1_000_000_000, 1_000_000_000))
+        self.application = Application.objects.create(
+            user=self.user, job=self.job, full_name='Jane Doe', email='jane@example.com',
+            phone='5550100', resume=self.name,
+        )
+
+    def test_last_release_deletes_file(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.application.delete()
+        self.assertFalse(self.storage.exists(self.name))
+        self.assertFalse(ResumeFile.objects.filter(name=self.name).exists())
+
+    def test_file_acquired_before_collection_is_kept(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.application.delete()
+        resumes.acquire(self.name)
+        for callback in callbacks:
+            callback()
+        self.assertTrue(self.storage.exists(self.name))
+        self.assertEqual(ResumeFile.objects.get(name=self.name).ref_count, 1)
+
+    def test_file_stored_again_before_collection_is_kept(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.application.delete()
+        # An upload of the same resume, which will acquire it once saved
+        self.storage.save('cv.pdf', ContentFile(b'%PDF resume'))
+        for callback in callbacks:
+            callback()
+        self.assertTrue(self.storage.exists(self.name))
+        resumes.acquire(self.name)
+        self.assertEqual(ResumeFile.objects.get(name=self.name).ref_count, 1)
+
+
+class ResumeDownloadTests(TemporaryMediaMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('applicant', 'applicant@example.com')
+        cls.job = Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build')
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+        self.storage = resume_storage()
+
+    def create_application(self, name):
+        application = Application.objects.create(
+            user=self.user, job=self.job, full_name='Jane Doe', email='jane@example.com', phone='5550100',
+        )
+        # Set without signals, as rows from before content addressing were
+        Application.objects.filter(id=application.id).update(resume=name)
+        return reverse('applications:download_resume', args=[application.id])
+
+    def write(self, name, content, mtime):
+        path = self.storage.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(content)
+        os.utime(path, (mtime, mtime))
+
+    def test_content_addressed_etag_is_the_digest(self):
+        name = self.storage.save('cv.pdf', ContentFile(b'%PDF resume'))
+        response = self.client.get(self.create_application(name))
+        self.assertEqual(response['ETag'], f'"{hashlib.sha256(b"%PDF resume").hexdigest()}"')
+
+    def test_legacy_etag_changes_when_file_is_rewritten(self):
+        url = self.create_application('resumes/cv.pdf')
+        self.write('resumes/cv.pdf', b'%PDF first', 1_000_000_000)
+        first = self.client.get(url)['ETag']
+        self.write('resumes/cv.pdf', b'%PDF second version', 1_000_000_000)
+        self.assertNotEqual(self.client.get(url)['ETag'], first)
+
+    def test_if_range_date_must_match_exactly(self):
+        url = self.create_application('resumes/cv.pdf')
+        self.write('resumes/cv.pdf', b'%PDF resume', 1_000_000_000)
+        exact = self.client.get(url, headers={'Range': 'bytes=0-3', 'If-Range': http_date(1_000_000_000)})
+        self.assertEqual(exact.status_code, 206)
+        later = self.client.get(url, headers={'Range': 'bytes=0-3', 'If-Range': http_date(1_000_000_060)})
+        self.assertEqual(later.status_code, 200)
@@ -6,9 +6,17 @@ app_name = 'applications'
 urlpatterns = [
     path('apply/<int:job_id>/', views.apply_job_view, name='apply_job'),
     path('admin/applications/', views.admin_applications_view, name='admin_applications'),
+    path('admin/applications/export/', views.export_applications, name='export_applications'),
+    path('api/applications/', views.applications_list_api, name='applications_list_api'),
+    path('api/applications/details/', views.application_details_batch_api, name='application_details_batch_api'),
     path('api/application/<int:application_id>/', views.application_detail_api, name='application_detail_api'),
+    path('api/application/<int:application_id>/resume/', views.download_resume, name='download_resume'),
     path('api/application/<int:application_id>/update-status/', views.update_application_status, name='update_status'),
+    path('api/applications/update-status/', views.bulk_update_application_status, name='bulk_update_status'),
     path('api/notifications/', views.get_notifications, name='get_notifications'),
+    path('api/notifications/stream/', views.notification_stream, name='notification_stream'),
+    path('api/notifications/history/', views.notification_history_api, name='notification_history'),
+    path('api/notifications/poll/', views.poll_notifications, name='poll_notifications'),
     path('api/notifications/<int:notification_id>/read/', views.mark_notification_read, name='mark_notification_read'),
     path('api/notifications/read-all/', views.mark_all_notifications_read, name='mark_all_notifications_read'),
 ]
@@ -1,10 +1,33 @@
+import asyncio
+import json
+import os
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, FileResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse, Http404
+from django.utils import timezone
+from django.utils.text import slugify
 from jobs.models import Job
+from jobs.pagination import InvalidCursor, KeysetPaginator
+from .bulk import bulk_update_status, MAX_BULK_IDS
+from .counters import decrement_unread
+from .downloads import serve_file
+from .events import broker, relay
+from . import resumes
 from .models import Application, Notification
 from .forms import ApplicationForm
+from .idempotency import InvalidIdempotencyKey, applied_keys, get_idempotency_key, request_fingerprint
+from .listing import LIST_COLUMNS, MAX_DETAIL_IDS, SORT_FIELDS, application_page
+from .retention import notification_history
+from .exports import EXPORT_FORMATS, aiterate, export_chunks, export_queryset
+from .tasks import notify_application_submitted, notify_status_change
 
 
 @login_required
@@ -13,39 +36,12 @@ def apply_job_view(request, job_id):
     Handle job application submission.
     Follows Single Responsibility Principle - only handles application creation.
     """
-    job = get_object_or_404(Job, id=job_id, is_active=True)
+    if request.method == 'POST':
+        return _submit_application(request, job_id)
     
-    # Check if user already applied
+    job = get_object_or_404(Job, id=job_id, is_active=True)
     if Application.objects.filter(user=request.user, job=job).exists():
-        return JsonResponse({
-            'success': False, 
-            'message': 'You have already applied for this job.'
-        }, status=400)
-    
-    if request.method == 'POST':
-        form = ApplicationForm(request.POST, request.FILES)
-        if form.is_valid():
-            application = form.save(commit=False)
-            application.user = request.user
-            application.job = job
-            application.save()
-            
-            # Create notification for application submission
-            Notification.objects.create(
-                user=request.user,
-                application=application,
-                message=f"Your application for {job.title} at {job.company_name} has been submitted successfully!"
-            )
-            
-            return JsonResponse({
-                'success': True, 
-                'message': 'Application submitted successfully!'
-            })
-        else:
-            return JsonResponse({
-                'success': False, 
-                'errors': form.errors
-            }, status=400)
+        return _already_applied_response()
     
     form = ApplicationForm(initial={
         'email': request.user.email,
@@ -56,32 +52,199 @@ def apply_job_view(request, job_id):
     return render(request, 'applications/apply.html', {'form': form, 'job': job})
 
 
+def _submit_application(request, job_id):
+    """
+    Create the application and queue its notification in one transaction.
+    Duplicates are caught by the (user, job) unique constraint rather than a
+    check beforehand, so two submissions racing each other cannot both get
+    through. A retry carrying the Idempotency-Key of a submission that
+    succeeded gets the original response back; the same key sent with a
+    different job or form is rejected.
+    """
+    try:
+        key = get_idempotency_key(request)
+    except InvalidIdempotencyKey:
+        return JsonResponse({'success': False, 'message': 'Invalid Idempotency-Key header.'}, status=400)
+    fingerprint = None
+    if key is not None:
+        fingerprint = request_fingerprint(job_id, request)
+        applied = applied_keys.get(request.user.id, key)
+        if applied is not None:
+            application_id, applied_fingerprint = applied
+            if applied_fingerprint != fingerprint:
+                return _key_reused_response()
+            return _applied_response(application_id)
+    
+    job = get_object_or_404(Job, id=job_id, is_active=True)
+    form = ApplicationForm(request.POST, request.FILES)
+    if not form.is_valid():
+        return JsonResponse({
+            'success': False, 
+            'errors': form.errors
+        }, status=400)
+    
+    application = form.save(commit=False)
+    application.user = request.user
+    application.job = job
+    application.idempotency_key = key
+    application.idempotency_fingerprint = fingerprint
+    try:
+        with transaction.atomic():
+            application.save()
+            # The notification is written by a background worker
+            notify_application_submitted.enqueue(application_id=application.id)
+    except IntegrityError:
+        resumes.discard(application.resume.name)
+        # The clash is on (user, job) or on (user, idempotency key)
+        clashes = Q(job=job) if key is None else Q(job=job) | Q(idempotency_key=key)
+        existing = list(
+            Application.objects.filter(clashes, user=request.user)
+            .only('id', 'idempotency_key', 'idempotency_fingerprint')[:2]
+        )
+        if not existing:
+            raise
+        same_key = [other for other in existing if key is not None and other.idempotency_key == key]
+        if not same_key:
+            return _already_applied_response()
+        application = same_key[0]
+        if application.idempotency_fingerprint != fingerprint:
+            return _key_reused_response()
+    
+    if key is not None:
+        applied_keys.remember(request.user.id, key, application.id, fingerprint)
+    return _applied_response(application.id)
+
+
+def _applied_response(application_id):
+    return JsonResponse({
+        'success': True, 
+        'message': 'Application submitted successfully!',
+        'application_id': application_id,
+    })
+
+
+def _key_reused_response():
+    return JsonResponse({
+        'success': False, 
+        'message': 'This Idempotency-Key was already used for a different submission.'
+    }, status=422)
+
+
+def _already_applied_response():
+    return JsonResponse({
+        'success': False, 
+        'message': 'You have already applied for this job.'
+    }, status=400)
+
+
 @login_required
 def admin_applications_view(request):
     """
     Display all applications for admin.
+    Rows are loaded page by page from ``applications_list_api``, so the
+    page does not grow with the number of applications.
     Follows Single Responsibility Principle - only handles applications display.
     """
     if not request.user.is_admin_user():
         return render(request, '403.html', status=403)
     
-    applications = Application.objects.select_related('user', 'job').all()
-    
-    # Filter by status if provided
+    # Filter by status, job and indexed search over name, email, phone, job
+    # title and cover letter; the list API and export apply the same filters
     status_filter = request.GET.get('status')
-    if status_filter:
-        applications = applications.filter(status=status_filter)
-    
-    # Search functionality
-    search_query = request.GET.get('search')
-    if search_query:
-        applications = applications.filter(full_name__icontains=search_query)
+    search_query = request.GET.get('search', '').strip()
+    job_id = request.GET.get('job', '')
+    job_filter = Job.objects.filter(id=job_id).only('id', 'title').first() if job_id.isdigit() else None
     
     return render(request, 'applications/admin_applications.html', {
-        'applications': applications
+        'status_filter': status_filter or '',
+        'search_query': search_query,
+        'job_filter': job_filter,
+        'status_labels': dict(Application.STATUS_CHOICES),
     })
 
 
+def _get_applications_page_size(request):
+    """Read the optional ``limit`` parameter, clamped to the configured maximum"""
+    try:
+        limit = int(request.GET.get('limit', settings.APPLICATIONS_PAGE_SIZE))
+    except ValueError:
+        limit = settings.APPLICATIONS_PAGE_SIZE
+    return max(1, min(limit, settings.APPLICATIONS_PAGE_SIZE_MAX))
+
+
+@login_required
+def applications_list_api(request):
+    """
+    One keyset page of the admin applications list (admin only).
+    Accepts ``sort`` (applied_date, status or job), ``dir`` (desc or asc),
+    ``status``, ``job`` and ``search`` filters and a ``cursor``. Rows come
+    back as arrays in ``columns`` order, with job titles listed once in
+    ``jobs`` instead of on every row.
+    Follows Interface Segregation Principle - specific API for the admin list.
+    """
+    if not request.user.is_admin_user():
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    sort = request.GET.get('sort', 'applied_date')
+    if sort not in SORT_FIELDS:
+        return JsonResponse({'error': f"Sort must be one of: {', '.join(SORT_FIELDS)}"}, status=400)
+    direction = request.GET.get('dir', 'desc')
+    if direction not in ('asc', 'desc'):
+        return JsonResponse({'error': 'Direction must be asc or desc'}, status=400)
+    job_id = request.GET.get('job') or None
+    if job_id is not None and not job_id.isdigit():
+        return JsonResponse({'error': 'Job must be a job id'}, status=400)
+    
+    try:
+        rows, job_titles, next_cursor = application_page(
+            _get_applications_page_size(request),
+            cursor=request.GET.get('cursor'),
+            sort=sort,
+            descending=direction == 'desc',
+            status=request.GET.get('status'),
+            search=request.GET.get('search', '').strip(),
+            job_id=job_id,
+        )
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
+    
+    return JsonResponse({
+        'columns': LIST_COLUMNS,
+        'rows': rows,
+        'jobs': job_titles,
+        'next_cursor': next_cursor,
+    })
+
+
+@login_required
+def export_applications(request):
+    """
+    Stream the admin application list as CSV or JSON Lines (admin only).
+    Honors the same ``status``, ``job`` and ``search`` filters as the admin list and
+    reads rows in chunks, so memory use does not grow with the export size.
+    """
+    if not request.user.is_admin_user():
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': 'Format must be csv or jsonl'}, status=400)
+    
+    job_id = request.GET.get('job', '')
+    queryset = export_queryset(
+        request.GET.get('status'), request.GET.get('search', '').strip(), job_id if job_id.isdigit() else None
+    )
+    chunks = export_chunks(export_format, queryset)
+    if isinstance(request, ASGIRequest):
+        chunks = aiterate(chunks)
+    
+    response = StreamingHttpResponse(chunks, content_type=EXPORT_FORMATS[export_format])
+    filename = f"applications-{timezone.now():%Y%m%d-%H%M}.{export_format}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @login_required
 def application_detail_api(request, application_id):
     """
@@ -91,21 +254,56 @@ def application_detail_api(request, application_id):
     if not request.user.is_admin_user():
         return JsonResponse({'error': 'Unauthorized'}, status=403)
     
-    application = get_object_or_404(Application, id=application_id)
-    data = {
-        'id': application.id,
-        'full_name': application.full_name,
-        'email': application.email,
-        'phone': application.phone,
-        'linkedin': application.linkedin,
-        'portfolio': application.portfolio,
-        'cover_letter': application.cover_letter,
-        'status': application.status,
-        'job_title': application.job.title,
-        'applied_date': application.applied_date.strftime('%B %d, %Y'),
-        'resume_url': application.resume.url if application.resume else None,
-    }
-    return JsonResponse(data)
+    application = get_object_or_404(Application.objects.select_related('job'), id=application_id)
+    return JsonResponse(application.to_detail_dict())
+
+
+@login_required
+def application_details_batch_api(request):
+    """
+    Details of several applications in one request (admin only), so the
+    admin page can prefetch the next candidates before their modal opens.
+    Expects ``ids`` as a comma-separated list; ids that do not exist are
+    left out of the response.
+    Follows Interface Segregation Principle - specific API for batch details.
+    """
+    if not request.user.is_admin_user():
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    try:
+        ids = [int(application_id) for application_id in request.GET.get('ids', '').split(',') if application_id]
+    except ValueError:
+        return JsonResponse({'error': 'ids must be a comma-separated list of integers'}, status=400)
+    if len(ids) > MAX_DETAIL_IDS:
+        return JsonResponse({'error': f'At most {MAX_DETAIL_IDS} applications can be fetched at once'}, status=400)
+    
+    applications = Application.objects.select_related('job').filter(id__in=ids)
+    return JsonResponse({
+        'applications': {str(application.id): application.to_detail_dict() for application in applications},
+    })
+
+
+@login_required
+def download_resume(request, application_id):
+    """
+    Download an application's resume (admins and the applicant only).
+    Supports Range/If-Range for resumable downloads and hands the transfer
+    to the web server when RESUME_SENDFILE_BACKEND is configured.
+    """
+    application = get_object_or_404(
+        Application.objects.only('id', 'user_id', 'full_name', 'resume'), id=application_id
+    )
+    if not (request.user.is_admin_user() or application.user_id == request.user.id):
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    if not application.resume:
+        raise Http404('No resume was uploaded with this application.')
+    
+    extension = os.path.splitext(application.resume.name)[1]
+    filename = f"{slugify(application.full_name) or 'applicant'}-resume{extension}"
+    response = serve_file(request, application.resume.storage, application.resume.name, filename)
+    if response is None:
+        raise Http404('Resume file is missing.')
+    return response
 
 
 @login_required
@@ -124,23 +322,12 @@ def update_application_status(request, application_id):
         
         if new_status in dict(Application.STATUS_CHOICES):
             application.status = new_status
-            application.save()
-            
-            # Create notification for status change
-            status_messages = {
-                'new': 'Your application status has been updated to: New',
-                'reviewing': f'Good news! Your application for {application.job.title} is now being reviewed by the hiring team.',
-                'interview_scheduled': f'Congratulations! You have been selected for an interview for the {application.job.title} position. The HR team will contact you soon.',
-                'rejected': f'Thank you for your interest in the {application.job.title} position. Unfortunately, we have decided to move forward with other candidates.'
-            }
-            
-            # Only create notification if status actually changed
-            if old_status != new_status:
-                Notification.objects.create(
-                    user=application.user,
-                    application=application,
-                    message=status_messages.get(new_status, f'Your application status has been updated to: {application.get_status_display()}')
-                )
+            with transaction.atomic():
+                application.save()
+                
+                # Only notify if status actually changed
+                if old_status != new_status:
+                    notify_status_change.enqueue(application_id=application.id, status=new_status)
             
             return JsonResponse({
                 'success': True, 
@@ -154,6 +341,43 @@ def update_application_status(request, application_id):
     
     return JsonResponse({'error': 'Invalid request'}, status=400)
 
+
+@login_required
+def bulk_update_application_status(request):
+    """
+    Update the status of many applications at once (admin only).
+    Expects a JSON body ``{"ids": [...], "status": "..."}`` and returns the
+    outcome for each id: updated, unchanged or not_found.
+    """
+    if not request.user.is_admin_user():
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Invalid request'}, status=400)
+    
+    try:
+        payload = json.loads(request.body)
+        ids = [int(application_id) for application_id in payload['ids']]
+        new_status = payload['status']
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'success': False, 'message': 'Expected a list of ids and a status.'}, status=400)
+    
+    if len(ids) > MAX_BULK_IDS:
+        return JsonResponse({
+            'success': False,
+            'message': f'At most {MAX_BULK_IDS} applications can be updated at once.'
+        }, status=400)
+    
+    try:
+        results = bulk_update_status(ids, new_status)
+    except ValueError:
+        return JsonResponse({'success': False, 'message': 'Invalid status.'}, status=400)
+    
+    return JsonResponse({
+        'success': True,
+        'results': {str(application_id): outcome for application_id, outcome in results.items()},
+    })
+
 @login_required
 def get_notifications(request):
     """Get user's unread notifications"""
@@ -165,26 +389,26 @@ def get_notifications(request):
         is_read=False
     ).select_related('application__job').order_by('-created_at')[:10]
     
-    notifications_data = [{
-        'id': n.id,
-        'message': n.message,
-        'created_at': n.created_at.strftime('%b %d, %Y %I:%M %p'),
-        'application_id': n.application.id,
-        'job_title': n.application.job.title
-    } for n in notifications]
+    notifications_data = [n.to_dict() for n in notifications]
     
+    # The unread total is kept on the user row, so no COUNT(*) is needed
     return JsonResponse({
         'notifications': notifications_data,
-        'count': notifications.count()
+        'count': request.user.unread_notifications
     })
 
 @login_required
 def mark_notification_read(request, notification_id):
     """Mark a specific notification as read"""
     if request.method == 'POST':
-        notification = get_object_or_404(Notification, id=notification_id, user=request.user)
-        notification.is_read = True
-        notification.save()
+        # Only an unread -> read transition changes the counter
+        with transaction.atomic():
+            updated = Notification.objects.filter(
+                id=notification_id, user=request.user, is_read=False
+            ).update(is_read=True)
+            decrement_unread(request.user.id, updated)
+        if not updated:
+            get_object_or_404(Notification, id=notification_id, user=request.user)
         return JsonResponse({'success': True})
     return JsonResponse({'error': 'Invalid request'}, status=400)
 
@@ -192,6 +416,158 @@ def mark_notification_read(request, notification_id):
 def mark_all_notifications_read(request):
     """Mark all notifications as read"""
     if request.method == 'POST':
-        Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+        # Subtract rather than reset so notifications created meanwhile still count
+        with transaction.atomic():
+            updated = Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+            decrement_unread(request.user.id, updated)
         return JsonResponse({'success': True})
     return JsonResponse({'error': 'Invalid request'}, status=400)
+
+
+@login_required
+def notification_history_api(request):
+    """
+    The user's full notification history, newest first, including read
+    notifications archived by ``compact_notifications``. Page with the
+    ``next_cursor`` of the previous response.
+    """
+    try:
+        limit = int(request.GET.get('limit', settings.NOTIFICATION_HISTORY_PAGE_SIZE))
+    except ValueError:
+        limit = settings.NOTIFICATION_HISTORY_PAGE_SIZE
+    limit = max(1, min(limit, settings.NOTIFICATION_HISTORY_PAGE_SIZE_MAX))
+    
+    cursor = request.GET.get('cursor')
+    if cursor:
+        try:
+            created_at, pk = KeysetPaginator.decode_cursor(cursor)
+        except InvalidCursor:
+            return JsonResponse({'error': 'Invalid cursor'}, status=400)
+        if timezone.is_naive(created_at):
+            created_at = timezone.make_aware(created_at)
+        cursor = (created_at, pk)
+    
+    entries, next_cursor = notification_history(request.user.id, limit, cursor or None)
+    return JsonResponse({
+        'notifications': entries,
+        'next_cursor': KeysetPaginator.encode_cursor(*next_cursor) if next_cursor else None,
+    })
+
+
+def _parse_last_event_id(request):
+    """Id of the newest notification the client already has"""
+    value = request.headers.get('Last-Event-ID') or request.GET.get('last_id') or 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+@sync_to_async
+def _stored_notifications(user_id, after_id, since):
+    """
+    Unread notifications newer than ``after_id``, or created since ``since``
+    when the client has none yet; what a client missed while not listening.
+    """
+    notifications = Notification.objects.filter(user_id=user_id, is_read=False, id__gt=after_id)
+    if not after_id:
+        notifications = notifications.filter(created_at__gte=since)
+    notifications = notifications.select_related('application__job').order_by('id')
+    return [n.to_dict() for n in notifications[:settings.NOTIFICATION_EVENT_BUFFER]]
+
+
+def _format_sse(event):
+    return f"id: {event['id']}\nevent: notification\ndata: {json.dumps(event)}\n\n"
+
+
+def _can_stream(request):
+    """
+    True when the request came in over ASGI. Under WSGI Django consumes an
+    async iterator to the end before sending anything, so an event stream
+    would stay silent until it closed.
+    """
+    return isinstance(request, ASGIRequest)
+
+
+async def notification_stream(request):
+    """
+    Server-Sent Events stream of the user's new notifications.
+    On connect it reads anything newer than Last-Event-ID from the database;
+    after that events come from the broker, fed by this process's relay, and
+    an idle connection makes no queries. The stream closes after a while and
+    the browser reconnects with Last-Event-ID to pick up anything it missed.
+    Without ASGI it answers 204, which tells EventSource not to reconnect;
+    the client then falls back to ``poll_notifications``.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'error': 'Unauthorized'}, status=401)
+    if not _can_stream(request):
+        return HttpResponse(status=204)
+    last_id = _parse_last_event_id(request)
+    connected_at = timezone.now()
+
+    async def events():
+        sent_ids = set()
+        subscription = broker.subscribe(user.id)
+        try:
+            yield 'retry: 3000\n\n'
+            await relay.ensure_running()
+            for event in await _stored_notifications(user.id, last_id, connected_at):
+                sent_ids.add(event['id'])
+                yield _format_sse(event)
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + settings.NOTIFICATION_STREAM_MAX_AGE
+            while loop.time() < deadline:
+                event = await subscription.get(settings.NOTIFICATION_STREAM_HEARTBEAT)
+                if event is None:
+                    yield ': keep-alive\n\n'
+                elif event['id'] not in sent_ids:
+                    # The relay can deliver an older id late; skip only repeats
+                    sent_ids.add(event['id'])
+                    yield _format_sse(event)
+        finally:
+            broker.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def poll_notifications(request):
+    """
+    Long-poll fallback for clients that cannot use the event stream.
+    Returns stored notifications newer than ``last_id`` straight away,
+    otherwise waits for the relay to publish the next one.
+    Without ASGI a waiting request would hold a worker thread, so it checks
+    the database at once and ``retry`` asks the client to wait
+    NOTIFICATION_POLL_INTERVAL seconds before polling again.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'error': 'Unauthorized'}, status=401)
+    last_id = _parse_last_event_id(request)
+    connected_at = timezone.now()
+    
+    if not _can_stream(request):
+        # A client holding no notifications yet sends last_id=0; cover the gap since its previous poll
+        since = connected_at - timedelta(seconds=2 * settings.NOTIFICATION_POLL_INTERVAL)
+        events = await _stored_notifications(user.id, last_id, since)
+        return JsonResponse({'notifications': events, 'retry': settings.NOTIFICATION_POLL_INTERVAL * 1000})
+
+    subscription = broker.subscribe(user.id)
+    try:
+        await relay.ensure_running()
+        events = await _stored_notifications(user.id, last_id, connected_at)
+        if not events:
+            event = await subscription.get(settings.NOTIFICATION_LONGPOLL_TIMEOUT)
+            # A relayed id can be lower than last_id when its row committed
+            # late; the client drops ones it already holds
+            if event is not None:
+                events = [event]
+    finally:
+        broker.unsubscribe(subscription)
+
+    return JsonResponse({'notifications': events, 'retry': 0})
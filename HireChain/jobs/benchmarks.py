@@ -0,0 +1,193 @@
+import math
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Count, Q
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.checks import CACHED_SESSION_ENGINES
+from applications.models import Application
+from .models import Job
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class Endpoint:
+    """
+    One benchmarked endpoint: a client to send requests with, a function
+    building the ``i``-th request, and the most SQL queries one request may run.
+    """
+
+    def __init__(self, name, client, make_request, query_budget, max_iterations=None):
+        self.name = name
+        self.client = client
+        self.make_request = make_request
+        self.query_budget = query_budget
+        self.max_iterations = max_iterations
+
+    def call(self, i):
+        method, path, data = self.make_request(i)
+        response = getattr(self.client, method)(path, data or {})
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+
+class BenchmarkSuite:
+    """
+    Drives the main endpoints through the test client against whatever
+    data is in the database (see ``generate_data``) and collects latency
+    percentiles, throughput and SQL query counts per endpoint.
+    Follows Single Responsibility Principle - only measures endpoints.
+    """
+
+    def __init__(self):
+        User = get_user_model()
+        self.job_ids = list(Job.objects.filter(is_active=True).order_by('id').values_list('id', flat=True))
+        self.application_ids = list(Application.objects.order_by('id').values_list('id', flat=True)[:10000])
+        if not self.job_ids or not self.application_ids:
+            raise ValueError('The database has no jobs or applications; run generate_data first')
+
+        self.admin = User.objects.filter(Q(is_superuser=True) | Q(user_type='admin')).first()
+        if self.admin is None:
+            self.admin = User.objects.create_user('bench_admin', 'bench_admin@example.com', user_type='admin')
+        # The busiest applicant reads their notifications
+        self.seeker = (
+            User.objects.filter(user_type='job_seeker')
+            .annotate(total=Count('notifications')).order_by('-total').first()
+        )
+        if self.seeker is None:
+            self.seeker = User.objects.create_user('bench_seeker', 'bench_seeker@example.com')
+        # Budgets assume sessions come from a shared cache; with a
+        # process-local one they are read from the database on every request
+        self.session_queries = 0 if settings.SESSION_ENGINE in CACHED_SESSION_ENGINES else 1
+        # A fresh applicant, so every apply request creates an application
+        self.applicant = User.objects.create_user(
+            f'bench_applicant_{int(time.time())}', 'bench_applicant@example.com'
+        )
+
+    def _client(self, user):
+        client = Client()
+        client.force_login(user)
+        return client
+
+    def endpoints(self):
+        seeker, admin, applicant = self._client(self.seeker), self._client(self.admin), self._client(self.applicant)
+        job_ids, application_ids = self.job_ids, self.application_ids
+        statuses = [status for status, _ in Application.STATUS_CHOICES]
+        sorts = ['applied_date', 'status', 'job']
+        apply_form = {
+            'full_name': 'Bench Applicant',
+            'email': 'bench_applicant@example.com',
+            'phone': '+15550000000',
+            'cover_letter': 'Benchmark application.',
+        }
+        return [
+            Endpoint('home_view', seeker, lambda i: ('get', reverse('jobs:home'), None), query_budget=6),
+            Endpoint(
+                'job_detail_api', seeker,
+                lambda i: ('get', reverse('jobs:job_detail_api', args=[job_ids[i % len(job_ids)]]), None),
+                query_budget=4,
+            ),
+            Endpoint(
+                'apply_job_view', applicant,
+                lambda i: ('post', reverse('applications:apply_job', args=[job_ids[i]]), apply_form),
+                query_budget=8, max_iterations=len(job_ids),
+            ),
+            Endpoint(
+                'admin_applications_view', admin,
+                lambda i: ('get', reverse('applications:admin_applications'), None), query_budget=2,
+            ),
+            Endpoint(
+                'applications_list_api', admin,
+                lambda i: ('get', reverse('applications:applications_list_api'), {'sort': sorts[i % len(sorts)]}),
+                query_budget=2,
+            ),
+            Endpoint(
+                'application_details_batch_api', admin,
+                lambda i: (
+                    'get', reverse('applications:application_details_batch_api'),
+                    {'ids': ','.join(str(application_ids[(i + n) % len(application_ids)]) for n in range(10))},
+                ),
+                query_budget=2,
+            ),
+            Endpoint(
+                'get_notifications', seeker,
+                lambda i: ('get', reverse('applications:get_notifications'), None), query_budget=2,
+            ),
+            Endpoint(
+                'update_application_status', admin,
+                lambda i: (
+                    'post',
+                    reverse('applications:update_status', args=[application_ids[i % len(application_ids)]]),
+                    {'status': statuses[i % len(statuses)]},
+                ),
+                query_budget=10,
+            ),
+        ]
+
+    def run_endpoint(self, endpoint, iterations, warmup):
+        """Measure ``iterations`` requests after ``warmup`` unmeasured ones"""
+        if endpoint.max_iterations is not None:
+            warmup = min(warmup, endpoint.max_iterations // 10)
+            iterations = min(iterations, endpoint.max_iterations - warmup)
+        for i in range(warmup):
+            endpoint.call(i)
+
+        timings, queries, status_codes = [], [], Counter()
+        started = time.perf_counter()
+        for i in range(warmup, warmup + iterations):
+            with CaptureQueriesContext(connection) as captured:
+                request_started = time.perf_counter()
+                response = endpoint.call(i)
+                timings.append((time.perf_counter() - request_started) * 1000)
+            queries.append(len(captured.captured_queries))
+            status_codes[str(response.status_code)] += 1
+        elapsed = time.perf_counter() - started
+
+        return {
+            'iterations': iterations,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'max_ms': round(max(timings), 3),
+            'throughput_rps': round(iterations / elapsed, 1),
+            'queries_mean': round(sum(queries) / len(queries), 2),
+            'queries_max': max(queries),
+            'query_budget': endpoint.query_budget + self.session_queries,
+            'status_codes': dict(status_codes),
+        }
+
+
+def find_regressions(results, baseline=None, tolerance=0.2):
+    """
+    Describe every endpoint that went over its query budget or, compared
+    with ``baseline``, got more than ``tolerance`` slower at p95 or runs
+    more queries per request.
+    """
+    problems = []
+    for name, result in results['endpoints'].items():
+        if result['queries_max'] > result['query_budget']:
+            problems.append(
+                f"{name}: {result['queries_max']} queries exceeds its budget of {result['query_budget']}"
+            )
+        previous = (baseline or {}).get('endpoints', {}).get(name)
+        if previous is None:
+            continue
+        if result['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+            problems.append(f"{name}: p95 {result['p95_ms']}ms vs {previous['p95_ms']}ms in the baseline")
+        if result['queries_max'] > previous['queries_max']:
+            problems.append(
+                f"{name}: {result['queries_max']} queries vs {previous['queries_max']} in the baseline"
+            )
+    return problems
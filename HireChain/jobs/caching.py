@@ -0,0 +1,195 @@
+import json
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from HireChain.cache import is_process_local
+
+# Version pointer value for jobs that are deleted or inactive
+UNAVAILABLE = '-'
+
+
+def version_from_datetime(value):
+    """Microsecond timestamp of an updated_date, as a cache version string"""
+    return str(int(value.timestamp() * 1_000_000))
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for one process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else None,
+            }
+
+
+class JobDetailCache:
+    """
+    Cache of serialized job detail JSON, keyed by job id and version.
+    A small pointer key holds the current version (the job's updated_date);
+    the payload lives under a key that includes that version. Saves move
+    the pointer forward, so a reader that raced a save can only ever store
+    a payload under an old version that is no longer pointed to.
+    Works with any Django cache backend; a per-process one only keeps
+    entries for JOB_DETAIL_LOCAL_CACHE_TIMEOUT seconds.
+    Follows Single Responsibility Principle - only handles detail caching.
+    """
+
+    def __init__(self, alias='default', timeout=None):
+        self.alias = alias
+        self.timeout = timeout
+        self.stats = CacheStats()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def version_of(job):
+        return version_from_datetime(job.updated_date)
+
+    @staticmethod
+    def _pointer_key(job_id):
+        return f'jobs:detail:{job_id}:version'
+
+    @staticmethod
+    def _payload_key(job_id, version):
+        return f'jobs:detail:{job_id}:{version}'
+
+    def _timeout(self):
+        timeout = self.timeout if self.timeout is not None else settings.JOB_DETAIL_CACHE_TIMEOUT
+        if is_process_local(settings.CACHES[self.alias]):
+            # Saves in other processes cannot reach this cache; bound how
+            # long it serves a job they changed, deactivated or deleted
+            return min(timeout, settings.JOB_DETAIL_LOCAL_CACHE_TIMEOUT)
+        return timeout
+
+    def get(self, job_id):
+        """
+        Return ``(payload, hit)`` for an active job, loading it on a miss.
+        ``payload`` is the JSON bytes, or None if the job is not available.
+        """
+        version = self.cache.get(self._pointer_key(job_id))
+        if version == UNAVAILABLE:
+            self.stats.record(hit=True)
+            return None, True
+        if version is not None:
+            payload = self.cache.get(self._payload_key(job_id, version))
+            if payload is not None:
+                self.stats.record(hit=True)
+                return payload, True
+
+        self.stats.record(hit=False)
+        from .models import Job
+
+        job = Job.objects.filter(id=job_id, is_active=True).first()
+        if job is None:
+            self.cache.add(self._pointer_key(job_id), UNAVAILABLE, self._timeout())
+            return None, False
+        # add() so a concurrent save that already moved the pointer wins
+        return self._store(job, set_pointer=self.cache.add), False
+
+    def get_version(self, job_id):
+        """
+        Current version string of an active job, or None if it is not
+        available. Only reads the pointer key, falling back to a single
+        column lookup on a miss.
+        """
+        version = self.cache.get(self._pointer_key(job_id))
+        if version is None:
+            from .models import Job
+
+            row = Job.objects.filter(id=job_id, is_active=True).values('updated_date').first()
+            if row is None:
+                version = UNAVAILABLE
+            else:
+                version = version_from_datetime(row['updated_date'])
+            self.cache.add(self._pointer_key(job_id), version, self._timeout())
+        return None if version == UNAVAILABLE else version
+
+    def _store(self, job, set_pointer):
+        version = self.version_of(job)
+        payload = json.dumps(job.to_detail_dict(), cls=DjangoJSONEncoder).encode()
+        self.cache.set(self._payload_key(job.id, version), payload, self._timeout())
+        set_pointer(self._pointer_key(job.id), version, self._timeout())
+        return payload
+
+    def warm(self, job):
+        """Store the payload for a freshly saved job ahead of the first read"""
+        if job.is_active:
+            self._store(job, set_pointer=self.cache.set)
+        else:
+            self.invalidate(job)
+
+    def invalidate(self, job):
+        """Point readers at the job's new version, or mark it unavailable"""
+        version = self.version_of(job) if job.is_active else UNAVAILABLE
+        self.cache.set(self._pointer_key(job.id), version, self._timeout())
+
+    def invalidate_deleted(self, job_id):
+        self.cache.set(self._pointer_key(job_id), UNAVAILABLE, self._timeout())
+
+
+job_detail_cache = JobDetailCache()
+
+
+class FeedVersion:
+    """
+    Version of the job listing, held under one cache key so the feed's
+    validators need no query. Every job save or delete sets it to the
+    current time; a missing key is seeded the same way, which costs
+    clients one full response rather than risking a stale 304.
+    Unavailable (None) when the cache is per process, since a write in
+    another process could not move it.
+    Follows Single Responsibility Principle - only tracks the feed version.
+    """
+
+    key = 'jobs:feed:version'
+
+    def __init__(self, alias='default'):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def enabled(self):
+        return not is_process_local(settings.CACHES[self.alias])
+
+    def get(self):
+        """Current version string, or None when the cache is per process"""
+        if not self.enabled:
+            return None
+        version = self.cache.get(self.key)
+        if version is None:
+            # add() so a bump that landed in between is kept
+            self.cache.add(self.key, version_from_datetime(timezone.now()), None)
+            version = self.cache.get(self.key)
+        return version
+
+    def bump(self):
+        if self.enabled:
+            self.cache.set(self.key, version_from_datetime(timezone.now()), None)
+
+
+feed_version = FeedVersion()
@@ -0,0 +1,89 @@
+import datetime
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from .caching import feed_version
+
+
+def conditional_view(validators_func):
+    """
+    Like django.views.decorators.http.condition, but computes the ETag and
+    Last-Modified together with a single call to ``validators_func``, which
+    receives the view's arguments and returns ``(etag, last_modified)`` or
+    None when the resource has no validators. Matching requests get a 304
+    without the view running.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            validators = None
+            if request.method in ('GET', 'HEAD'):
+                validators = validators_func(request, *args, **kwargs)
+            if validators is None:
+                return view_func(request, *args, **kwargs)
+
+            etag, last_modified = validators
+            etag = quote_etag(etag)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+            if 200 <= response.status_code < 300 or response.status_code == 304:
+                response.headers.setdefault('ETag', etag)
+                if timestamp and not response.has_header('Last-Modified'):
+                    response.headers['Last-Modified'] = http_date(timestamp)
+            return response
+        return inner
+    return decorator
+
+
+def _version_datetime(version):
+    return datetime.datetime.fromtimestamp(int(version) / 1_000_000, tz=datetime.timezone.utc)
+
+
+def feed_validators(queryset):
+    """
+    Validators for a listing of ``queryset``, taken from the cached feed
+    version that job saves and deletes move on. With a per-process cache
+    they fall back to the newest updated_date plus the row count, so
+    edits, deactivations and deletions all change them.
+    """
+    version = feed_version.get()
+    if version is not None:
+        return f'jobs-{version}', _version_datetime(version)
+    stats = queryset.aggregate(latest=Max('updated_date'), count=Count('id'))
+    latest = stats['latest']
+    version = int(latest.timestamp() * 1_000_000) if latest else 0
+    return f'jobs-{version}-{stats["count"]}', latest
+
+
+def job_version_validators(job_id, version):
+    """Validators for one job from its cached version string"""
+    return f'job-{job_id}-{version}', _version_datetime(version)
+
+
+def visitor_fingerprint(request):
+    """
+    Short digest of what a page renders per visitor: the CSRF secret from the
+    cookie and, for a logged-in user, the fields the navbar shows. None when
+    the visitor has no CSRF cookie yet, since rendering the page issues one.
+    """
+    csrf_secret = request.COOKIES.get(settings.CSRF_COOKIE_NAME)
+    if not csrf_secret:
+        return None
+    parts = [csrf_secret]
+    user = request.user
+    if user.is_authenticated:
+        parts += [user.id, user.username, user.email, user.is_admin_user(), user.unread_notifications]
+    return hashlib.sha256('\0'.join(map(str, parts)).encode()).hexdigest()[:16]
+
+
+def has_pending_messages(request):
+    """True when the page would render flash messages, which must not be cached"""
+    return len(get_messages(request)) > 0
@@ -0,0 +1,113 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+
+from .models import Job, JobFacet
+
+# (query parameter, Job field, label) for each filterable facet
+FACETS = (
+    ('location', 'location', 'Location'),
+    ('job_type', 'job_type', 'Job Type'),
+    ('company', 'company_name', 'Company'),
+)
+
+FACET_FIELDS = [field for _, field, _ in FACETS]
+
+# Values listed per facet, most common first
+FACET_LIMIT = 10
+
+
+def facet_values(job):
+    """The (field, value) pairs a job contributes to the counts; none if inactive"""
+    if not job.is_active:
+        return ()
+    return tuple((field, getattr(job, field)) for field in FACET_FIELDS)
+
+
+def apply_delta(old_values, new_values):
+    """
+    Move the counts from a job's old facet values to its new ones.
+    Changed values cost at most one INSERT and two UPDATEs; unchanged ones
+    cost nothing.
+    """
+    delta = Counter(new_values)
+    delta.subtract(Counter(old_values))
+    by_amount = {}
+    for key, amount in delta.items():
+        if amount:
+            by_amount.setdefault(amount, []).append(key)
+    if not by_amount:
+        return
+
+    with transaction.atomic():
+        added = [key for amount, keys in by_amount.items() if amount > 0 for key in keys]
+        if added:
+            JobFacet.objects.bulk_create(
+                [JobFacet(facet=facet, value=value) for facet, value in added], ignore_conflicts=True
+            )
+        for amount, keys in by_amount.items():
+            lookup = Q()
+            for facet, value in keys:
+                lookup |= Q(facet=facet, value=value)
+            JobFacet.objects.filter(lookup).update(count=F('count') + amount)
+
+
+def rebuild_facets():
+    """Recount every facet from the jobs table"""
+    active = Job.objects.filter(is_active=True).order_by()
+    rows = []
+    for field in FACET_FIELDS:
+        for value, count in active.values_list(field).annotate(total=Count('id')):
+            rows.append(JobFacet(facet=field, value=value, count=count))
+    with transaction.atomic():
+        JobFacet.objects.all().delete()
+        JobFacet.objects.bulk_create(rows)
+    return len(rows)
+
+
+def get_facet_counts(limit=FACET_LIMIT):
+    """Top ``limit`` values per facet as ``{field: [(value, count), ...]}``, in one query"""
+    ranked = (
+        JobFacet.objects.filter(count__gt=0)
+        .annotate(rank=Window(RowNumber(), partition_by=[F('facet')], order_by=[F('count').desc(), F('value')]))
+        .filter(rank__lte=limit)
+        .order_by('facet', 'rank')
+        .values_list('facet', 'value', 'count')
+    )
+    counts = {field: [] for field in FACET_FIELDS}
+    for facet, value, count in ranked:
+        counts.setdefault(facet, []).append((value, count))
+    return counts
+
+
+def selected_filters(params):
+    """Job field lookups for the facet parameters present in ``params``"""
+    return {field: params[param] for param, field, _ in FACETS if params.get(param)}
+
+
+def facet_groups(params, counts):
+    """
+    Facets for the template: each value with its count, whether it is
+    selected, and the query string that toggles it (dropping the cursor).
+    """
+    groups = []
+    for param, field, label in FACETS:
+        selected = params.get(param, '')
+        options = []
+        for value, count in counts.get(field, []):
+            query = params.copy()
+            query.pop('cursor', None)
+            if value == selected:
+                query.pop(param, None)
+            else:
+                query[param] = value
+            options.append({
+                'value': value,
+                'count': count,
+                'selected': value == selected,
+                'query': query.urlencode(),
+            })
+        groups.append({'param': param, 'label': label, 'selected': selected, 'options': options})
+    return groups
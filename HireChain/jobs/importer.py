@@ -0,0 +1,206 @@
+import csv
+import json
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from applications.search import get_applicant_search_backend
+from .caching import feed_version, job_detail_cache
+from .facets import apply_delta, facet_values
+from .forms import JobForm
+from .models import Job
+from .search import get_search_backend
+from .slugs import allocate_slugs, slug_base
+
+# Rows validated and written per transaction
+IMPORT_BATCH_SIZE = 500
+
+# Row errors kept in the result; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+# Attempts at a batch whose slugs or external ids were taken by a
+# concurrent import between the lookup and the insert
+WRITE_ATTEMPTS = 3
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+
+JOB_FIELDS = JobForm._meta.fields
+
+_EMPTY = (None, '')
+
+
+def read_rows(stream, import_format):
+    """
+    Yield ``(line, row, error)`` for each record of a text stream, reading
+    it one line at a time. ``row`` is a dict of field values, or None when
+    the record could not be parsed and ``error`` says why.
+    """
+    if import_format == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError as exc:
+            yield line, None, f'Invalid JSON: {exc}'
+            continue
+        if not isinstance(row, dict):
+            yield line, None, 'Each line must be a JSON object'
+            continue
+        yield line, row, None
+
+
+class ImportResult:
+    """Counts and row errors of one import run"""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+
+def _same_value(stored, value):
+    # Optional text fields may be stored as NULL or as an empty string
+    return stored == value or (stored in _EMPTY and value in _EMPTY)
+
+
+class JobImporter:
+    """
+    Upserts job postings from a partner feed, keyed on ``external_id``.
+    Every row is the complete posting: an optional field that is missing
+    or empty is cleared on an existing job, and a missing ``is_active`` or
+    ``job_type`` falls back to the default.
+    Rows are validated with JobForm and written in batches: one SELECT of
+    the batch's existing jobs, one slug lookup, one bulk INSERT and one
+    bulk UPDATE per batch.
+    Follows Single Responsibility Principle - only loads job feeds.
+    """
+
+    def __init__(self, batch_size=IMPORT_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def run(self, rows):
+        """Import ``(line, row, error)`` records from ``read_rows``"""
+        result = ImportResult()
+        batch = {}
+        for line, row, error in rows:
+            if error:
+                result.add_error(line, {'__all__': [error]})
+                continue
+            cleaned = self.clean_row(line, row, result)
+            if cleaned is None:
+                continue
+            external_id, data = cleaned
+            # A later row for the same job replaces an earlier one
+            batch.pop(external_id, None)
+            batch[external_id] = data
+            if len(batch) >= self.batch_size:
+                self.write_batch(batch, result)
+                batch = {}
+        if batch:
+            self.write_batch(batch, result)
+        return result
+
+    def clean_row(self, line, row, result):
+        """Validate a row with JobForm; returns ``(external_id, cleaned_data)`` or None"""
+        external_id = str(row.get('external_id') or '').strip()
+        if not external_id:
+            result.add_error(line, {'external_id': ['This field is required.']})
+            return None
+        if len(external_id) > Job._meta.get_field('external_id').max_length:
+            result.add_error(line, {'external_id': ['This value is too long.']})
+            return None
+
+        data = {field: row.get(field) for field in JOB_FIELDS if row.get(field) not in _EMPTY}
+        # Unlike a form POST, a missing column means "use the default"
+        data.setdefault('is_active', True)
+        data.setdefault('job_type', Job._meta.get_field('job_type').default)
+
+        # cleaned_data has every field, so the ones left out are cleared
+        form = JobForm(data=data)
+        if not form.is_valid():
+            result.add_error(line, {field: list(errors) for field, errors in form.errors.items()})
+            return None
+        return external_id, form.cleaned_data
+
+    def write_batch(self, batch, result):
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                created, updated, unchanged = self._write_batch(batch)
+                break
+            except IntegrityError:
+                # A concurrent import took a slug or external id; look again
+                if attempt == WRITE_ATTEMPTS:
+                    raise
+        result.created += created
+        result.updated += updated
+        result.unchanged += unchanged
+
+    def _write_batch(self, batch):
+        now = timezone.now()
+        with transaction.atomic():
+            existing = {job.external_id: job for job in Job.objects.filter(external_id__in=list(batch))}
+            new_jobs, changed, old_titles, old_facets = [], [], {}, []
+            for external_id, data in batch.items():
+                job = existing.get(external_id)
+                if job is None:
+                    new_jobs.append(Job(external_id=external_id, **data))
+                    continue
+                if all(_same_value(getattr(job, field), value) for field, value in data.items()):
+                    continue
+                old_titles[job.id] = job.title
+                old_facets += facet_values(job)
+                for field, value in data.items():
+                    setattr(job, field, value)
+                job.updated_date = now
+                changed.append(job)
+
+            slugs = allocate_slugs(Job.objects.all(), [slug_base(job.title, job.company_name) for job in new_jobs])
+            for job, slug in zip(new_jobs, slugs):
+                job.slug = slug
+            Job.objects.bulk_create(new_jobs)
+            if changed:
+                Job.objects.bulk_update(changed, [*JOB_FIELDS, 'updated_date'])
+            self._sync_derived_data(new_jobs, changed, old_titles, old_facets)
+        return len(new_jobs), len(changed), len(batch) - len(new_jobs) - len(changed)
+
+    @staticmethod
+    def _sync_derived_data(new_jobs, changed, old_titles, old_facets):
+        """
+        Do what the Job post_save receivers would, which bulk writes skip:
+        search indexes, facet counts, detail cache and feed version
+        """
+        written = [*new_jobs, *changed]
+        if not written:
+            return
+        search = get_search_backend()
+        for job in written:
+            search.sync_job(job)
+            job_detail_cache.invalidate(job)
+        applicant_search = get_applicant_search_backend()
+        for job in changed:
+            if job.title != old_titles[job.id]:
+                applicant_search.reindex_job(job)
+        apply_delta(old_facets, [value for job in written for value in facet_values(job)])
+        feed_version.bump()
@@ -0,0 +1,85 @@
+import json
+import platform
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+from jobs.benchmarks import BenchmarkSuite, find_regressions
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the main endpoints against the current database and report '
+        'latency percentiles, throughput and SQL queries per request. '
+        'Writes made by the benchmark are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations', type=int, default=200,
+            help='Measured requests per endpoint (default: 200)'
+        )
+        parser.add_argument(
+            '--warmup', type=int, default=10,
+            help='Unmeasured requests per endpoint before measuring (default: 10)'
+        )
+        parser.add_argument(
+            '--endpoint', action='append', dest='endpoints',
+            help='Only benchmark this endpoint; may be repeated'
+        )
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument(
+            '--compare', help='Fail if results regress against this earlier JSON file'
+        )
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help='Allowed p95 slowdown against --compare, as a fraction (default: 0.2)'
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as baseline_file:
+                baseline = json.load(baseline_file)
+
+        results = {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'python': platform.python_version(),
+                'iterations': options['iterations'],
+                'warmup': options['warmup'],
+            },
+            'endpoints': {},
+        }
+
+        # The test client sends Host: testserver
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']), transaction.atomic():
+            try:
+                suite = BenchmarkSuite()
+            except ValueError as exc:
+                raise CommandError(exc)
+            results['meta']['jobs'] = len(suite.job_ids)
+            for endpoint in suite.endpoints():
+                if options['endpoints'] and endpoint.name not in options['endpoints']:
+                    continue
+                result = suite.run_endpoint(endpoint, options['iterations'], options['warmup'])
+                results['endpoints'][endpoint.name] = result
+                self.stdout.write(
+                    f"{endpoint.name:<28} p50 {result['p50_ms']:>8.2f}ms  p95 {result['p95_ms']:>8.2f}ms  "
+                    f"p99 {result['p99_ms']:>8.2f}ms  {result['throughput_rps']:>8.1f} req/s  "
+                    f"{result['queries_max']:>3} queries  {result['status_codes']}"
+                )
+            transaction.set_rollback(True)
+
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                json.dump(results, output_file, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        problems = find_regressions(results, baseline, options['tolerance'])
+        if problems:
+            raise CommandError('Benchmark regressions:\n  ' + '\n  '.join(problems))
+        self.stdout.write(self.style.SUCCESS('All endpoints within budget'))
@@ -0,0 +1,69 @@
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from jobs.synthetic import SEED_PASSWORD, SyntheticDataGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a reproducible synthetic dataset of users, jobs, applications '
+        'and notifications for load testing'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='Number of job seekers (default: 1000)')
+        parser.add_argument('--jobs', type=int, default=200, help='Number of job postings (default: 200)')
+        parser.add_argument(
+            '--applications', type=int, default=5000,
+            help='Number of applications; each gets one or two notifications (default: 5000)'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=2000,
+            help='Rows written per bulk INSERT transaction (default: 2000)'
+        )
+        parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Worker processes for applications; ignored on SQLite (default: 1)'
+        )
+        parser.add_argument(
+            '--days', type=int, default=180,
+            help='Spread posting and application dates over this many days (default: 180)'
+        )
+        parser.add_argument(
+            '--prefix', default='seed',
+            help='Prefix for generated usernames and slugs, so several datasets can coexist (default: seed)'
+        )
+        parser.add_argument(
+            '--skip-index', action='store_true',
+            help='Do not rebuild the job and applicant search indexes afterwards'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            generator = SyntheticDataGenerator(
+                users=options['users'],
+                jobs=options['jobs'],
+                applications=options['applications'],
+                batch_size=options['batch_size'],
+                seed=options['seed'],
+                processes=options['processes'],
+                days=options['days'],
+                prefix=options['prefix'],
+                log=self.stdout.write if options['verbosity'] > 1 else None,
+            )
+        except ValueError as exc:
+            raise CommandError(exc)
+
+        started = time.perf_counter()
+        created = generator.run()
+        if not options['skip_index']:
+            call_command('rebuild_job_index', verbosity=options['verbosity'])
+            call_command('rebuild_applicant_index', verbosity=options['verbosity'])
+        elapsed = time.perf_counter() - started
+
+        summary = ', '.join(f'{count} {name}' for name, count in created.items())
+        self.stdout.write(self.style.SUCCESS(f'Created {summary} in {elapsed:.1f}s'))
+        if created['users']:
+            self.stdout.write(f"Generated users log in with the password '{SEED_PASSWORD}'")
@@ -0,0 +1,34 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from jobs.importer import IMPORT_BATCH_SIZE, IMPORT_FORMATS, JobImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = 'Import job postings from a CSV or JSON Lines feed, upserting on external_id'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Feed file to import')
+        parser.add_argument(
+            '--format', choices=IMPORT_FORMATS,
+            help='Feed format (default: taken from the file extension)'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+            help=f'Rows written per transaction (default: {IMPORT_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        import_format = options['format'] or os.path.splitext(options['path'])[1].lstrip('.').lower()
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError('Cannot tell the feed format; pass --format csv or --format jsonl')
+
+        with open(options['path'], encoding='utf-8-sig', newline='') as feed:
+            result = JobImporter(options['batch_size']).run(read_rows(feed, import_format))
+
+        for error in result.errors:
+            self.stderr.write(f"Line {error['line']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {result.created}, updated {result.updated}, '
+            f'unchanged {result.unchanged}, failed {result.failed} job(s)'
+        ))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from jobs.facets import rebuild_facets
+
+
+class Command(BaseCommand):
+    help = 'Recount the location, job type and company facets of active jobs'
+
+    def handle(self, *args, **options):
+        rows = rebuild_facets()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} facet count(s)'))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from jobs.models import Job
+from jobs.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for active job postings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of jobs indexed per transaction (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        backend = get_search_backend()
+
+        # Entries are rewritten in place and stale ones dropped at the end,
+        # so searches keep answering from the old entries during the rebuild
+        indexed = 0
+        jobs = Job.objects.filter(is_active=True).order_by('id').iterator(chunk_size=batch_size)
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if len(batch) >= batch_size:
+                indexed += self._index_batch(backend, batch)
+                batch = []
+        if batch:
+            indexed += self._index_batch(backend, batch)
+        backend.prune()
+
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} active job posting(s)'))
+
+    def _index_batch(self, backend, batch):
+        with transaction.atomic():
+            for job in batch:
+                backend.index_job(job)
+        return len(batch)
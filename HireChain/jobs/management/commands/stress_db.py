@@ -0,0 +1,151 @@
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.utils import timezone
+from jobs.benchmarks import percentile
+
+# Django's stock SQLite setup: rollback journal, 5 second busy timeout,
+# deferred transactions and a new connection for every request
+BASELINE_PROFILE = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'CONN_MAX_AGE': 0,
+    'OPTIONS': {},
+}
+
+SCHEMA = [
+    'CREATE TABLE stress_counter (id integer PRIMARY KEY, total integer NOT NULL)',
+    'INSERT INTO stress_counter (id, total) VALUES (1, 0)',
+    'CREATE TABLE stress_application ('
+    ' id integer PRIMARY KEY AUTOINCREMENT, worker integer NOT NULL, seq integer NOT NULL,'
+    ' payload text NOT NULL, created text NOT NULL)',
+    'CREATE INDEX stress_application_worker ON stress_application (worker, seq)',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure concurrent write throughput of the stock SQLite setup against '
+        'the configured database profile. Each thread repeats an apply-shaped '
+        'request (a read, then a transaction that checks for a duplicate, '
+        'inserts a row and bumps a shared counter) on a scratch database file.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=8,
+            help='Concurrent writers (default: 8)'
+        )
+        parser.add_argument(
+            '--operations', type=int, default=200,
+            help='Requests per thread (default: 200)'
+        )
+        parser.add_argument(
+            '--profile', choices=['baseline', 'configured', 'both'], default='both',
+            help='Which database profile to measure (default: both)'
+        )
+
+    def handle(self, *args, **options):
+        configured = settings.DATABASES['default']
+        if configured['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError('stress_db compares SQLite profiles; DB_ENGINE is not sqlite')
+        if options['threads'] < 1 or options['operations'] < 1:
+            raise CommandError('--threads and --operations must be positive')
+
+        profiles = {'baseline': BASELINE_PROFILE, 'configured': configured}
+        if options['profile'] != 'both':
+            profiles = {options['profile']: profiles[options['profile']]}
+
+        scratch_dir = Path(tempfile.mkdtemp(prefix='hirechain-stress-'))
+        try:
+            for name, profile in profiles.items():
+                result = self.run_profile(
+                    name, profile, scratch_dir / f'{name}.sqlite3', options['threads'], options['operations']
+                )
+                self.stdout.write(
+                    f"{name:<12} {result['committed']:>6} committed  {result['locked']:>5} locked  "
+                    f"{result['writes_per_second']:>8.1f} writes/s  p50 {result['p50_ms']:>7.2f}ms  "
+                    f"p95 {result['p95_ms']:>7.2f}ms  p99 {result['p99_ms']:>7.2f}ms"
+                )
+        finally:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+        self.stdout.write(self.style.SUCCESS('Stress test complete'))
+
+    def run_profile(self, name, profile, path, threads, operations):
+        """Run ``threads`` writers against a fresh database file using ``profile``"""
+        alias = f'stress_{name}'
+        # configure_settings fills in the keys Django defaults for DATABASES entries
+        scratch = {**profile, 'NAME': str(path), 'TEST': {}}
+        connections.settings[alias] = connections.configure_settings({DEFAULT_DB_ALIAS: scratch})[DEFAULT_DB_ALIAS]
+        try:
+            with connections[alias].cursor() as cursor:
+                for statement in SCHEMA:
+                    cursor.execute(statement)
+            connections[alias].close()
+
+            latencies, errors = [], []
+            lock = threading.Lock()
+            start = threading.Barrier(threads + 1)
+            workers = [
+                threading.Thread(target=self.writer, args=(alias, worker, operations, start, lock, latencies, errors))
+                for worker in range(threads)
+            ]
+            for worker in workers:
+                worker.start()
+            start.wait()
+            started = perf_counter()
+            for worker in workers:
+                worker.join()
+            elapsed = perf_counter() - started
+        finally:
+            del connections.settings[alias]
+
+        return {
+            'committed': len(latencies),
+            'locked': len(errors),
+            'writes_per_second': len(latencies) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(latencies, 50) * 1000 if latencies else 0.0,
+            'p95_ms': percentile(latencies, 95) * 1000 if latencies else 0.0,
+            'p99_ms': percentile(latencies, 99) * 1000 if latencies else 0.0,
+        }
+
+    @staticmethod
+    def writer(alias, worker, operations, start, lock, latencies, errors):
+        """One client thread; each iteration stands in for a request"""
+        connection = connections[alias]
+        start.wait()
+        try:
+            for seq in range(operations):
+                began = perf_counter()
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute('SELECT total FROM stress_counter WHERE id = 1')
+                        cursor.fetchone()
+                    with transaction.atomic(using=alias):
+                        with connection.cursor() as cursor:
+                            cursor.execute(
+                                'SELECT 1 FROM stress_application WHERE worker = %s AND seq = %s', [worker, seq]
+                            )
+                            cursor.fetchone()
+                            cursor.execute(
+                                'INSERT INTO stress_application (worker, seq, payload, created) '
+                                'VALUES (%s, %s, %s, %s)',
+                                [worker, seq, 'x' * 512, timezone.now().isoformat()]
+                            )
+                            cursor.execute('UPDATE stress_counter SET total = total + 1 WHERE id = 1')
+                except OperationalError as exc:
+                    with lock:
+                        errors.append(str(exc))
+                else:
+                    with lock:
+                        latencies.append(perf_counter() - began)
+                # What request_finished does: reconnect unless CONN_MAX_AGE allows reuse
+                connection.close_if_unusable_or_obsolete()
+        finally:
+            connection.close()
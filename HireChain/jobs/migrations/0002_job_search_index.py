@@ -0,0 +1,48 @@
+from django.db import migrations
+
+from jobs.search import SEARCH_FIELDS, SEARCH_TABLE
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            f"{', '.join(SEARCH_FIELDS)}, "
+            f"tokenize = 'porter unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE TABLE {SEARCH_TABLE} ("
+            f"job_id bigint PRIMARY KEY REFERENCES jobs (id) ON DELETE CASCADE, "
+            f"document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {SEARCH_TABLE}_document_gin ON {SEARCH_TABLE} USING gin (document)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+def populate_search_index(apps, schema_editor):
+    from jobs.search import get_search_backend
+
+    Job = apps.get_model('jobs', 'Job')
+    backend = get_search_backend()
+    for job in Job.objects.filter(is_active=True).iterator(chunk_size=1000):
+        backend.index_job(job)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-10-17 21:40
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# Same fields as jobs.facets.FACET_FIELDS
+FACET_FIELDS = ('location', 'job_type', 'company_name')
+
+
+def populate_facets(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobFacet = apps.get_model('jobs', 'JobFacet')
+    active = Job.objects.filter(is_active=True).order_by()
+    JobFacet.objects.bulk_create([
+        JobFacet(facet=field, value=value, count=count)
+        for field in FACET_FIELDS
+        for value, count in active.values_list(field).annotate(total=Count('id'))
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_external_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(max_length=50)),
+                ('value', models.CharField(max_length=200)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'job_facets',
+                'indexes': [models.Index(fields=['facet', '-count'], name='job_facet_count_idx')],
+                'constraints': [models.UniqueConstraint(fields=('facet', 'value'), name='job_facet_unique')],
+            },
+        ),
+        migrations.RunPython(populate_facets, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,5 @@
 from django.db import models
-from django.utils.text import slugify
+from .slugs import allocate_slugs, slug_base
 
 
 class Job(models.Model):
@@ -19,23 +19,72 @@ class Job(models.Model):
     posted_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
     slug = models.SlugField(unique=True, blank=True)
+    # Partner's id for jobs loaded by import_jobs; imports upsert on it
+    external_id = models.CharField(max_length=100, unique=True, blank=True, null=True)
     
     class Meta:
         db_table = 'jobs'
         ordering = ['-posted_date']
+        indexes = [
+            # Keyset-paginated feed of active jobs
+            models.Index(
+                fields=['-posted_date', '-id'],
+                condition=models.Q(is_active=True),
+                name='job_active_feed_idx',
+            ),
+        ]
         verbose_name = 'Job'
         verbose_name_plural = 'Jobs'
     
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(f"{self.title}-{self.company_name}")
+            self.slug = allocate_slugs(Job.objects.all(), [slug_base(self.title, self.company_name)])[0]
         super().save(*args, **kwargs)
     
     def __str__(self):
         return f"{self.title} at {self.company_name}"
     
+    def to_detail_dict(self):
+        """Serialize for the job details API"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'company': self.company_name,
+            'location': self.location,
+            'description': self.description,
+            'requirements': self.requirements,
+            'responsibilities': self.responsibilities,
+            'salary_range': self.salary_range,
+            'job_type': self.job_type,
+            'posted_date': self.posted_date.strftime('%B %d, %Y'),
+        }
+    
     def get_short_description(self, length=150):
         """Get truncated description"""
         if len(self.description) > length:
             return self.description[:length] + "..."
         return self.description
+
+
+class JobFacet(models.Model):
+    """
+    Number of active jobs per location, job type and company.
+    Kept up to date by jobs.facets from Job signals, so the home page
+    filters never run a GROUP BY over the jobs table.
+    Follows Single Responsibility Principle - stores facet counts only.
+    """
+    facet = models.CharField(max_length=50)
+    value = models.CharField(max_length=200)
+    count = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'job_facets'
+        constraints = [
+            models.UniqueConstraint(fields=['facet', 'value'], name='job_facet_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['facet', '-count'], name='job_facet_count_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.facet}={self.value} ({self.count})"
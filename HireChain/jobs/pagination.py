@@ -0,0 +1,143 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class KeysetPaginator:
+    """
+    Keyset (seek) pagination over a ``(posted_date, id)`` ordering.
+    Each page is fetched with a ``WHERE (posted_date, id) < (cursor)`` seek
+    instead of an OFFSET, so the cost of a page does not grow with its depth.
+    Follows Single Responsibility Principle - only handles page slicing.
+    """
+    date_field = 'posted_date'
+
+    def __init__(self, queryset, page_size):
+        self.queryset = queryset
+        self.page_size = page_size
+
+    @staticmethod
+    def encode_cursor(posted_date, pk):
+        """Encode the sort key of the last row on a page as an opaque token"""
+        raw = f"{posted_date.isoformat()}|{pk}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """Decode a token produced by ``encode_cursor``"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            posted_date, pk = raw.split('|')
+            return datetime.fromisoformat(posted_date), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+    def page_queryset(self, cursor=None):
+        """
+        The query for the page after ``cursor``, with one extra row to
+        learn whether another page exists.
+        """
+        queryset = self.queryset.order_by(f'-{self.date_field}', '-id')
+        if cursor:
+            posted_date, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f'{self.date_field}__lt': posted_date})
+                | Q(**{self.date_field: posted_date, 'id__lt': pk})
+            )
+        return queryset[:self.page_size + 1]
+
+    def get_page(self, cursor=None):
+        """
+        Return ``(items, next_cursor)`` for the page after ``cursor``.
+        ``next_cursor`` is ``None`` on the last page.
+        """
+        items = list(self.page_queryset(cursor))
+        next_cursor = None
+        if len(items) > self.page_size:
+            items = items[:self.page_size]
+            last = items[-1]
+            next_cursor = self.encode_cursor(getattr(last, self.date_field), last.id)
+        return items, next_cursor
+
+
+class SortedKeysetPaginator:
+    """
+    Keyset pagination over any ordering of model fields that ends in a
+    unique one, e.g. ``('status', 'applied_date', 'id')``. All fields sort
+    in the same direction, so one composite index can serve the seek.
+    Works on querysets of model instances or ``values()`` dicts.
+    Follows Single Responsibility Principle - only handles page slicing.
+    """
+
+    def __init__(self, queryset, page_size, fields, descending=True):
+        self.queryset = queryset
+        self.page_size = page_size
+        self.fields = tuple(fields)
+        self.descending = descending
+
+    @staticmethod
+    def _value(item, field):
+        return item[field] if isinstance(item, dict) else getattr(item, field)
+
+    def encode_cursor(self, item):
+        """Encode the sort key of ``item`` as an opaque token"""
+        values = [self._value(item, field) for field in self.fields]
+        # Full isoformat(); DjangoJSONEncoder would cut datetimes to milliseconds
+        raw = json.dumps(values, default=lambda value: value.isoformat()).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Decode a token produced by ``encode_cursor`` back to field values"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError(cursor)
+            # Every sort field is non-null and encodes as a string or number
+            if not all(isinstance(value, (str, int, float)) for value in values):
+                raise ValueError(cursor)
+            opts = self.queryset.model._meta
+            return [opts.get_field(field).to_python(value) for field, value in zip(self.fields, values)]
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, ValidationError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+    def page_queryset(self, cursor=None):
+        """
+        The query for the page after ``cursor``, with one extra row to
+        learn whether another page exists.
+        """
+        prefix = '-' if self.descending else ''
+        queryset = self.queryset.order_by(*[prefix + field for field in self.fields])
+        if cursor:
+            # (a, b, c) < (x, y, z) expanded to a < x OR (a = x AND b < y) OR ...
+            values = self.decode_cursor(cursor)
+            lookup = 'lt' if self.descending else 'gt'
+            seek = Q()
+            for position, field in enumerate(self.fields):
+                equal = {self.fields[i]: values[i] for i in range(position)}
+                seek |= Q(**equal, **{f'{field}__{lookup}': values[position]})
+            # The redundant bound on the leading column lets the database
+            # start the index scan at the cursor instead of filtering up to it
+            queryset = queryset.filter(seek, **{f'{self.fields[0]}__{lookup}e': values[0]})
+        return queryset[:self.page_size + 1]
+
+    def get_page(self, cursor=None):
+        """
+        Return ``(items, next_cursor)`` for the page after ``cursor``.
+        ``next_cursor`` is ``None`` on the last page.
+        """
+        items = list(self.page_queryset(cursor))
+        next_cursor = None
+        if len(items) > self.page_size:
+            items = items[:self.page_size]
+            next_cursor = self.encode_cursor(items[-1])
+        return items, next_cursor
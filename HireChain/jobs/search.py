@@ -0,0 +1,182 @@
+import re
+
+from django.db import connection
+
+# Columns indexed for full-text search, in the order they are stored
+SEARCH_FIELDS = ('title', 'company_name', 'location', 'description', 'requirements', 'responsibilities')
+
+# Relative weight of each column when ranking, matched to SEARCH_FIELDS
+SEARCH_WEIGHTS = (10.0, 5.0, 3.0, 1.0, 1.0, 1.0)
+
+SEARCH_TABLE = 'jobs_search'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _job_table():
+    from .models import Job
+
+    return connection.ops.quote_name(Job._meta.db_table)
+
+
+def tokenize(query):
+    """Split a user query into lowercase word tokens, dropping any operator syntax"""
+    return _TOKEN_RE.findall(query.lower())
+
+
+class BaseSearchBackend:
+    """
+    Interface for job search backends.
+    Follows Dependency Inversion Principle - views depend on this interface,
+    not on a particular database's full-text engine.
+    """
+
+    def index_job(self, job):
+        raise NotImplementedError
+
+    def remove_job(self, job_id):
+        raise NotImplementedError
+
+    def prune(self):
+        """Drop entries for jobs that are gone or no longer active"""
+        raise NotImplementedError
+
+    def search_ids(self, query, limit, offset=0):
+        """Return ids of matching jobs, best match first"""
+        raise NotImplementedError
+
+    def sync_job(self, job):
+        """Keep only active jobs in the index"""
+        if job.is_active:
+            self.index_job(job)
+        else:
+            self.remove_job(job.id)
+
+    @staticmethod
+    def _values(job):
+        return [getattr(job, field) or '' for field in SEARCH_FIELDS]
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """FTS5 virtual table keyed by job id, ranked with bm25()"""
+
+    def index_job(self, job):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [job.id])
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, {", ".join(SEARCH_FIELDS)}) '
+                f'VALUES (%s, {", ".join(["%s"] * len(SEARCH_FIELDS))})',
+                [job.id] + self._values(job)
+            )
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [job_id])
+
+    def prune(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid NOT IN '
+                f'(SELECT id FROM {_job_table()} WHERE is_active)'
+            )
+
+    def search_ids(self, query, limit, offset=0):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Every token must match; each one is quoted and prefix-matched
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s '
+                f'ORDER BY bm25({SEARCH_TABLE}, {weights}) LIMIT %s OFFSET %s',
+                [match, limit, offset]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Weighted tsvector table with a GIN index, ranked with ts_rank_cd()"""
+    # setweight() only has four classes, so the long text columns share 'D'
+    _classes = ('A', 'B', 'C', 'D', 'D', 'D')
+
+    def _document_sql(self):
+        return ' || '.join(
+            f"setweight(to_tsvector('english', %s), '{weight_class}')"
+            for weight_class in self._classes
+        )
+
+    def index_job(self, job):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (job_id, document) VALUES (%s, {self._document_sql()}) '
+                f'ON CONFLICT (job_id) DO UPDATE SET document = EXCLUDED.document',
+                [job.id] + self._values(job)
+            )
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE job_id = %s', [job_id])
+
+    def prune(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} s WHERE NOT EXISTS '
+                f'(SELECT 1 FROM {_job_table()} j WHERE j.id = s.job_id AND j.is_active)'
+            )
+
+    def search_ids(self, query, limit, offset=0):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        tsquery = ' & '.join(f'{token}:*' for token in tokens)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT job_id FROM {SEARCH_TABLE}, to_tsquery('english', %s) query "
+                f"WHERE document @@ query "
+                f"ORDER BY ts_rank_cd('{{0.1, 0.2, 0.4, 1.0}}', document, query) DESC, job_id DESC "
+                f"LIMIT %s OFFSET %s",
+                [tsquery, limit, offset]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class NullSearchBackend(BaseSearchBackend):
+    """Fallback for databases without a full-text engine; matches nothing"""
+
+    def index_job(self, job):
+        pass
+
+    def remove_job(self, job_id):
+        pass
+
+    def prune(self):
+        pass
+
+    def search_ids(self, query, limit, offset=0):
+        return []
+
+
+_BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend():
+    """Return the search backend matching the default database"""
+    return _BACKENDS.get(connection.vendor, NullSearchBackend)()
+
+
+def search_jobs(query, limit, offset=0):
+    """
+    Return active jobs matching ``query``, best match first.
+    The index only ever holds active jobs, so the ids need no further filtering
+    beyond guarding against rows changed since they were indexed.
+    """
+    from .models import Job
+
+    ids = get_search_backend().search_ids(query, limit, offset)
+    jobs = Job.objects.filter(is_active=True).in_bulk(ids)
+    return [jobs[job_id] for job_id in ids if job_id in jobs]
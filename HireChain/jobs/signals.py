@@ -0,0 +1,74 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from . import facets
+from .caching import feed_version, job_detail_cache
+from .models import Job
+from .search import get_search_backend
+
+
+@receiver(post_save, sender=Job)
+def sync_job_search_index(sender, instance, raw=False, **kwargs):
+    """Keep the full-text index in step with the saved job"""
+    if raw:
+        return
+    get_search_backend().sync_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_from_search_index(sender, instance, **kwargs):
+    """Drop a deleted job from the full-text index"""
+    get_search_backend().remove_job(instance.id)
+
+
+@receiver(post_save, sender=Job)
+def invalidate_job_detail_cache(sender, instance, raw=False, **kwargs):
+    """Move the cached detail payload on to the job's new version"""
+    if raw:
+        return
+    job_detail_cache.invalidate(instance)
+
+
+@receiver(post_delete, sender=Job)
+def invalidate_deleted_job_detail_cache(sender, instance, **kwargs):
+    """Mark a deleted job as unavailable in the detail cache"""
+    job_detail_cache.invalidate_deleted(instance.id)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def bump_feed_version(sender, **kwargs):
+    """Move the feed version on, so clients holding the old listing refetch it"""
+    feed_version.bump()
+
+
+@receiver(pre_save, sender=Job)
+def remember_facet_values(sender, instance, raw=False, **kwargs):
+    """Stash the stored facet values so post_save can move the counts"""
+    if raw or instance.pk is None or instance._state.adding:
+        instance._stored_facets = ()
+        return
+    stored = (
+        Job.objects.filter(pk=instance.pk)
+        .values_list('is_active', *facets.FACET_FIELDS).first()
+    )
+    if stored is None or not stored[0]:
+        instance._stored_facets = ()
+    else:
+        instance._stored_facets = tuple(zip(facets.FACET_FIELDS, stored[1:]))
+
+
+@receiver(post_save, sender=Job)
+def update_facet_counts(sender, instance, created=False, raw=False, **kwargs):
+    """Move the facet counts from the job's stored values to its saved ones"""
+    if raw:
+        return
+    new_values = facets.facet_values(instance)
+    facets.apply_delta(() if created else getattr(instance, '_stored_facets', ()), new_values)
+    instance._stored_facets = new_values
+
+
+@receiver(post_delete, sender=Job)
+def remove_facet_counts(sender, instance, **kwargs):
+    """Take a deleted job out of the facet counts"""
+    facets.apply_delta(facets.facet_values(instance), ())
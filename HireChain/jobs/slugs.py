@@ -0,0 +1,45 @@
+from django.db.models import Q
+from django.utils.text import slugify
+
+# Job.slug is a SlugField(max_length=50); leave room for a "-<n>" suffix
+SLUG_BASE_LENGTH = 40
+
+# Bases looked up per query, to stay well inside SQLite's expression limits
+LOOKUP_BATCH_SIZE = 100
+
+
+def slug_base(title, company_name):
+    """The slug a job gets before any collision suffix"""
+    base = slugify(f"{title}-{company_name}")[:SLUG_BASE_LENGTH].strip('-')
+    return base or 'job'
+
+
+def allocate_slugs(queryset, bases):
+    """
+    Return a unique slug for each entry of ``bases``, in order.
+    Slugs already in ``queryset`` and ones handed out earlier in the same
+    call are skipped by appending -2, -3, ...; the existing slugs are read
+    with one query per LOOKUP_BATCH_SIZE distinct bases, not one per row.
+    """
+    distinct = list(dict.fromkeys(bases))
+    taken = set()
+    for start in range(0, len(distinct), LOOKUP_BATCH_SIZE):
+        lookup = Q()
+        for base in distinct[start:start + LOOKUP_BATCH_SIZE]:
+            lookup |= Q(slug__startswith=base)
+        taken.update(queryset.filter(lookup).values_list('slug', flat=True))
+
+    # Next suffix to try per base, so repeated bases do not rescan from 2
+    next_suffix = {}
+    slugs = []
+    for base in bases:
+        slug = base
+        if slug in taken:
+            suffix = next_suffix.get(base, 2)
+            while f'{base}-{suffix}' in taken:
+                suffix += 1
+            slug = f'{base}-{suffix}'
+            next_suffix[base] = suffix + 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
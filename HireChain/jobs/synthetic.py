@@ -0,0 +1,364 @@
+import bisect
+import itertools
+import multiprocessing
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from applications.message_templates import SUBMITTED
+from applications.models import Application, Notification
+from .caching import feed_version
+from .facets import rebuild_facets
+from .models import Job
+from .slugs import slug_base
+
+SEED_PASSWORD = 'loadtest-password'
+
+# Users per unit of work; fixed so the output depends on the seed only,
+# not on how many processes share the work
+USER_CHUNK = 1000
+
+LEVELS = ['Junior', '', '', 'Senior', 'Senior', 'Staff', 'Lead']
+ROLES = [
+    'Backend Engineer', 'Frontend Developer', 'Full Stack Developer', 'Data Scientist',
+    'Data Engineer', 'DevOps Engineer', 'QA Engineer', 'Product Manager', 'Project Manager',
+    'UX Designer', 'Marketing Specialist', 'Sales Executive', 'Customer Success Manager',
+    'Security Analyst', 'Mobile Developer', 'Machine Learning Engineer',
+]
+COMPANIES = [
+    'Innovate Corp', 'Global Tech', 'Creative Solutions', 'Northwind Labs', 'Bluepeak Systems',
+    'Acme Analytics', 'Brightline Health', 'Cobalt Finance', 'Evergreen Retail', 'Helix Robotics',
+    'Lumen Media', 'Orbit Logistics', 'Quantum Ledger', 'Redwood Energy', 'Summit Education',
+]
+LOCATIONS = [
+    'Remote', 'Remote', 'Remote', 'New York, NY', 'San Francisco, CA', 'Austin, TX', 'Seattle, WA',
+    'London, UK', 'Berlin, Germany', 'Toronto, Canada', 'Karachi, Pakistan', 'Lahore, Pakistan',
+    'Dubai, UAE', 'Singapore',
+]
+JOB_TYPES = ['Full-time', 'Part-time', 'Contract', 'Internship']
+JOB_TYPE_WEIGHTS = [70, 10, 15, 5]
+FIRST_NAMES = [
+    'Ayesha', 'Ali', 'Fatima', 'Hassan', 'Sara', 'Omar', 'Zainab', 'Bilal', 'Emma', 'Liam',
+    'Olivia', 'Noah', 'Ava', 'Lucas', 'Mia', 'Ethan', 'Sofia', 'Mateo', 'Priya', 'Arjun',
+    'Chen', 'Mei', 'Yusuf', 'Amina', 'Daniel', 'Grace', 'Ivan', 'Elena', 'Kwame', 'Nia',
+]
+LAST_NAMES = [
+    'Khan', 'Ahmed', 'Malik', 'Hussain', 'Smith', 'Johnson', 'Williams', 'Brown', 'Garcia',
+    'Martinez', 'Lee', 'Wang', 'Patel', 'Sharma', 'Kim', 'Nguyen', 'Okafor', 'Mensah',
+    'Ivanova', 'Rossi', 'Muller', 'Silva', 'Cohen', 'Haddad',
+]
+SENTENCES = [
+    'We are looking for people who enjoy solving hard problems with a small, focused team.',
+    'You will own features from design through to production and on-call.',
+    'Our stack is Python, Django and PostgreSQL, deployed on Linux.',
+    'We value clear writing, thoughtful code review and steady delivery.',
+    'The role involves close work with product, design and customer support.',
+    'Experience with distributed systems and observability is a plus.',
+    'We offer flexible hours, learning budget and a generous leave policy.',
+    'You will mentor other engineers and help shape our technical roadmap.',
+]
+COVER_SENTENCES = [
+    'I have followed your company for years and admire the product.',
+    'In my last role I led a migration that cut page load times in half.',
+    'I enjoy working across teams and turning vague ideas into shipped features.',
+    'I am comfortable with Python, SQL and cloud infrastructure.',
+    'I am looking for a role where I can grow and take on more ownership.',
+    'My portfolio includes open source contributions and side projects.',
+]
+
+# Share of applications in each status; a non-'new' status also produced a
+# status-change notification
+STATUS_WEIGHTS = [
+    ('new', 50),
+    ('reviewing', 25),
+    ('interview_scheduled', 8),
+    ('rejected', 17),
+]
+
+# Jobs draw applications with Zipf-like popularity
+JOB_POPULARITY_EXPONENT = 1.1
+
+# Share of notifications older than a day that have been read
+READ_RATE = 0.8
+
+# Job rows shared with forked worker processes
+_job_rows = None
+_job_cum_weights = None
+
+
+@contextmanager
+def manual_timestamps(*models):
+    """
+    Let ``bulk_create`` keep the dates we set on auto_now/auto_now_add
+    fields instead of stamping every row with the current time.
+    """
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _random_datetime(rng, start, end):
+    return start + timedelta(seconds=rng.uniform(0, max((end - start).total_seconds(), 0)))
+
+
+def _split_counts(rng, total, slots, cap):
+    """
+    Spread ``total`` items over ``slots`` with a heavy-tailed distribution,
+    giving no slot more than ``cap``: most users send a few applications
+    and a few send many.
+    """
+    if not slots:
+        return []
+    weights = [rng.paretovariate(2.5) for _ in range(slots)]
+    scale = total / sum(weights)
+    counts = [min(cap, int(weight * scale)) for weight in weights]
+    remainder = total - sum(counts)
+    while remainder > 0:
+        open_slots = [i for i, count in enumerate(counts) if count < cap]
+        for i in rng.sample(open_slots, min(remainder, len(open_slots))):
+            counts[i] += 1
+            remainder -= 1
+    return counts
+
+
+class SyntheticDataGenerator:
+    """
+    Generates users, jobs, applications and notifications for load testing.
+    Rows are written with ``bulk_create`` in batches, so signal handlers do
+    not run; facet and unread counters are rebuilt and the feed version
+    moved on at the end.
+    The same seed and sizes always produce the same data.
+    Follows Single Responsibility Principle - only produces synthetic data.
+    """
+
+    def __init__(self, users, jobs, applications, batch_size=2000, seed=42, processes=1,
+                 days=180, prefix='seed', log=None):
+        if applications > users * jobs:
+            raise ValueError('Cannot create more applications than user/job pairs')
+        self.users = users
+        self.jobs = jobs
+        self.applications = applications
+        self.batch_size = batch_size
+        self.seed = seed
+        self.processes = processes
+        self.days = days
+        self.prefix = prefix
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.start = self.now - timedelta(days=days)
+
+    def run(self):
+        """Generate everything and return the number of rows created per model"""
+        rng = random.Random(self.seed)
+        with manual_timestamps(get_user_model(), Job, Application, Notification):
+            user_ids = self.create_users(rng)
+            self.create_jobs(rng)
+            counts = _split_counts(rng, self.applications, len(user_ids), self.jobs)
+            created = self.create_applications(user_ids, counts)
+        self.refresh_unread_counters()
+        rebuild_facets()
+        feed_version.bump()
+        return {
+            'users': len(user_ids),
+            'jobs': len(_job_rows),
+            'applications': created[0],
+            'notifications': created[1],
+        }
+
+    def create_users(self, rng):
+        User = get_user_model()
+        # Hashing is deliberately slow, so every user shares one hash
+        password = make_password(SEED_PASSWORD)
+        user_ids = []
+        for start in range(0, self.users, self.batch_size):
+            batch = []
+            for i in range(start, min(start + self.batch_size, self.users)):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                joined = _random_datetime(rng, self.start, self.now)
+                batch.append(User(
+                    username=f'{self.prefix}_user{i}',
+                    email=f'{self.prefix}.user{i}@example.com',
+                    first_name=first,
+                    last_name=last,
+                    password=password,
+                    phone=f'+1555{rng.randrange(10 ** 7):07d}',
+                    date_joined=joined,
+                    created_at=joined,
+                    updated_at=joined,
+                ))
+            with transaction.atomic():
+                user_ids += [user.id for user in User.objects.bulk_create(batch)]
+            self.log(f'Created {len(user_ids)} user(s)')
+        return user_ids
+
+    def job_slug(self, title, company, index):
+        """A slug unique to this dataset, cut to fit Job.slug"""
+        suffix = f'-{self.prefix}-{index}'
+        length = Job._meta.get_field('slug').max_length - len(suffix)
+        return slug_base(title, company)[:length].rstrip('-') + suffix
+
+    def create_jobs(self, rng):
+        global _job_rows, _job_cum_weights
+        rows = []
+        for start in range(0, self.jobs, self.batch_size):
+            batch = []
+            for i in range(start, min(start + self.batch_size, self.jobs)):
+                title = ' '.join(filter(None, [rng.choice(LEVELS), rng.choice(ROLES)]))
+                company = rng.choice(COMPANIES)
+                low = rng.randrange(40, 160) * 1000
+                posted = _random_datetime(rng, self.start, self.now)
+                batch.append(Job(
+                    title=title,
+                    company_name=company,
+                    location=rng.choice(LOCATIONS),
+                    description=' '.join(rng.sample(SENTENCES, 4)),
+                    requirements='\n'.join(rng.sample(SENTENCES, 3)),
+                    responsibilities='\n'.join(rng.sample(SENTENCES, 3)),
+                    salary_range=f'${low:,} - ${low + rng.randrange(10, 60) * 1000:,}',
+                    job_type=rng.choices(JOB_TYPES, JOB_TYPE_WEIGHTS)[0],
+                    is_active=rng.random() < 0.9,
+                    posted_date=posted,
+                    updated_date=posted,
+                    slug=self.job_slug(title, company, i),
+                ))
+            with transaction.atomic():
+                rows += [
+                    (job.id, job.posted_date)
+                    for job in Job.objects.bulk_create(batch)
+                ]
+            self.log(f'Created {len(rows)} job(s)')
+
+        # Popularity follows rank, with ranks shuffled so it is unrelated to age
+        ranks = list(range(1, len(rows) + 1))
+        rng.shuffle(ranks)
+        _job_rows = rows
+        _job_cum_weights = list(itertools.accumulate(rank ** -JOB_POPULARITY_EXPONENT for rank in ranks))
+
+    def create_applications(self, user_ids, counts):
+        """Create applications and notifications user chunk by user chunk"""
+        chunks = [
+            (self.seed, index, user_ids[start:start + USER_CHUNK], counts[start:start + USER_CHUNK],
+             self.batch_size, self.now.isoformat())
+            for index, start in enumerate(range(0, len(user_ids), USER_CHUNK))
+        ]
+        processes = self.processes
+        if processes > 1 and connection.vendor == 'sqlite':
+            self.log('SQLite allows one writer at a time; using a single process')
+            processes = 1
+
+        applications = notifications = 0
+        if processes > 1:
+            # Forked children must not share the parent's database connection
+            connections.close_all()
+            with multiprocessing.get_context('fork').Pool(processes) as pool:
+                results = pool.imap_unordered(_generate_chunk, chunks)
+                for created_applications, created_notifications in results:
+                    applications += created_applications
+                    notifications += created_notifications
+                    self.log(f'Created {applications} application(s)')
+        else:
+            for chunk in chunks:
+                created_applications, created_notifications = _generate_chunk(chunk)
+                applications += created_applications
+                notifications += created_notifications
+                self.log(f'Created {applications} application(s)')
+        return applications, notifications
+
+    def refresh_unread_counters(self):
+        """Recompute the denormalized unread counters of the generated users"""
+        unread = (
+            Notification.objects.filter(user=OuterRef('pk'), is_read=False)
+            .order_by().values('user').annotate(total=Count('id')).values('total')
+        )
+        get_user_model().objects.filter(username__startswith=f'{self.prefix}_user').update(
+            unread_notifications=Coalesce(Subquery(unread), 0)
+        )
+
+
+def _generate_chunk(args):
+    """Create the applications and notifications for one chunk of users"""
+    seed, index, user_ids, counts, batch_size, now = args
+    rng = random.Random(f'{seed}-{index}')
+    now = datetime.fromisoformat(now)
+    day_ago = now - timedelta(days=1)
+    statuses = [status for status, _ in STATUS_WEIGHTS]
+    status_weights = [weight for _, weight in STATUS_WEIGHTS]
+    total_weight = _job_cum_weights[-1]
+
+    pending = []
+    applications = notifications = 0
+    for user_id, count in zip(user_ids, counts):
+        chosen = set()
+        while len(chosen) < count:
+            position = bisect.bisect(_job_cum_weights, rng.random() * total_weight)
+            chosen.add(min(position, len(_job_rows) - 1))
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        for position in chosen:
+            job_id, posted = _job_rows[position]
+            applied = _random_datetime(rng, posted, now)
+            status = rng.choices(statuses, status_weights)[0]
+            updated = _random_datetime(rng, applied, now) if status != 'new' else applied
+            pending.append(Application(
+                user_id=user_id,
+                job_id=job_id,
+                full_name=f'{first} {last}',
+                email=f'{first}.{last}{user_id}@example.com'.lower(),
+                phone=f'+1555{rng.randrange(10 ** 7):07d}',
+                cover_letter=' '.join(rng.sample(COVER_SENTENCES, 3)),
+                status=status,
+                applied_date=applied,
+                updated_date=updated,
+            ))
+        if len(pending) >= batch_size:
+            created = _write_batch(rng, pending, day_ago)
+            applications += created[0]
+            notifications += created[1]
+            pending = []
+    if pending:
+        created = _write_batch(rng, pending, day_ago)
+        applications += created[0]
+        notifications += created[1]
+    connections.close_all()
+    return applications, notifications
+
+
+def _write_batch(rng, pending, day_ago):
+    with transaction.atomic():
+        created = Application.objects.bulk_create(pending)
+        notifications = []
+        for application in created:
+            submitted = application.applied_date
+            notifications.append(Notification(
+                user_id=application.user_id,
+                application=application,
+                code=SUBMITTED,
+                is_read=submitted < day_ago and rng.random() < READ_RATE,
+                created_at=submitted,
+            ))
+            if application.status != 'new':
+                changed = application.updated_date
+                notifications.append(Notification(
+                    user_id=application.user_id,
+                    application=application,
+                    **application.status_notification(),
+                    is_read=changed < day_ago and rng.random() < READ_RATE,
+                    created_at=changed,
+                ))
+        Notification.objects.bulk_create(notifications)
+    return len(created), len(notifications)
@@ -1,3 +1,388 @@
-from django.test import TestCase
+import io
+import json
+import tempfile
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from HireChain.cache import CACHE_BACKENDS
+
+from . import importer
+from .management.commands.rebuild_job_index import Command as RebuildJobIndex
+from .facets import rebuild_facets
+from .importer import JobImporter, read_rows
+from .models import Job, JobFacet
+from .pagination import KeysetPaginator
+from .search import get_search_backend, search_jobs
+from .slugs import allocate_slugs, slug_base
+
+
+class QueryPlanMixin:
+    """
+    Assertions over EXPLAIN output for the hot query shapes.
+    On PostgreSQL sequential scans are disabled for the check, since the
+    planner would otherwise prefer them on the tiny test tables.
+    """
+
+    def get_plan(self, queryset):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET enable_seqscan = off')
+        return queryset.explain()
+
+    def assertUsesIndex(self, queryset, index_name=None):
+        """Check the plan reads through an index, ``index_name`` if given"""
+        plan = self.get_plan(queryset)
+        if index_name:
+            self.assertIn(index_name, plan)
+        else:
+            self.assertIn('INDEX', plan.upper())
+        if connection.vendor == 'sqlite':
+            # No full table scan and no separate sort step
+            table = queryset.model._meta.db_table
+            self.assertNotRegex(plan, rf'SCAN {table}(?! USING)')
+            self.assertNotIn('USE TEMP B-TREE', plan)
+
+
+class JobQueryPlanTests(QueryPlanMixin, TestCase):
+
+    def setUp(self):
+        for i in range(3):
+            Job.objects.create(
+                title=f'Engineer {i}', company_name='Acme', location='Remote',
+                description='Build things', is_active=bool(i % 2),
+            )
+
+    def test_active_feed_uses_partial_index(self):
+        queryset = Job.objects.filter(is_active=True).order_by('-posted_date', '-id')[:20]
+        self.assertUsesIndex(queryset, 'job_active_feed_idx')
+
+    def test_feed_page_after_cursor_uses_partial_index(self):
+        paginator = KeysetPaginator(Job.objects.filter(is_active=True), 20)
+        cursor = KeysetPaginator.encode_cursor(timezone.now() - timedelta(days=1), 10)
+        self.assertUsesIndex(paginator.page_queryset(cursor), 'job_active_feed_idx')
+
+
+class HomeConditionalGetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('seeker', 'seeker@example.com', 'password')
+        Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build things')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        # The first visit issues the CSRF cookie, so it is not revalidated
+        response = self.client.get(reverse('jobs:home'))
+        self.assertNotIn('ETag', response)
+        self.etag = self.client.get(reverse('jobs:home'))['ETag']
+
+    def get_home(self):
+        return self.client.get(reverse('jobs:home'), headers={'If-None-Match': self.etag})
+
+    def test_unchanged_page_is_not_modified(self):
+        response = self.get_home()
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('Cookie', response['Vary'])
+
+    def test_new_csrf_token_changes_etag(self):
+        # As after logging out and in again, which rotates the token
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = 'x' * 32
+        self.assertEqual(self.get_home().status_code, 200)
+
+    def test_role_change_changes_etag(self):
+        CustomUser.objects.filter(id=self.user.id).update(user_type='admin')
+        self.assertEqual(self.get_home().status_code, 200)
+
+
+class FeedVersionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('reader', 'reader@example.com', 'password')
+        cls.job = Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build')
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        shared_cache = override_settings(CACHES={
+            'default': {'BACKEND': CACHE_BACKENDS['file'], 'LOCATION': cache_dir.name},
+        })
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        self.client.force_login(self.user)
+        self.etag = self.client.get(reverse('jobs:job_list_api'))['ETag']
+
+    def get_feed(self):
+        return self.client.get(reverse('jobs:job_list_api'), headers={'If-None-Match': self.etag})
+
+    def test_unchanged_feed_is_validated_without_queries(self):
+        # The feed is public, so a 304 never loads the session or user
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_feed().status_code, 304)
+
+    def test_saving_a_job_changes_etag(self):
+        self.job.save()
+        self.assertEqual(self.get_feed().status_code, 200)
+
+    def test_deleting_a_job_changes_etag(self):
+        self.job.delete()
+        self.assertEqual(self.get_feed().status_code, 200)
+
+
+class SlugAllocationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for slug in ('engineer-acme', 'engineer-acme-2', 'engineer-acme-corp'):
+            Job.objects.create(
+                title='Engineer', company_name='Acme', location='Remote', description='Build', slug=slug
+            )
+
+    def test_taken_slug_gets_next_free_suffix(self):
+        self.assertEqual(allocate_slugs(Job.objects.all(), ['engineer-acme']), ['engineer-acme-3'])
+
+    def test_repeated_bases_get_distinct_slugs(self):
+        slugs = allocate_slugs(Job.objects.all(), ['engineer-acme', 'designer-acme', 'engineer-acme', 'designer-acme'])
+        self.assertEqual(slugs, ['engineer-acme-3', 'designer-acme', 'engineer-acme-4', 'designer-acme-2'])
+
+    def test_slug_base_is_short_and_never_empty(self):
+        self.assertLessEqual(len(slug_base('Engineer ' * 10, 'Acme')), 40)
+        self.assertEqual(slug_base('!!!', '???'), 'job')
+
+
+class JobImporterTests(TestCase):
+
+    row = {'external_id': 'feed-1', 'title': 'Engineer', 'company_name': 'Acme', 'location': 'Remote',
+           'description': 'Build things', 'salary_range': '$100k'}
+
+    def import_jsonl(self, *rows):
+        lines = [row if isinstance(row, str) else json.dumps(row) for row in rows]
+        return JobImporter().run(read_rows(io.StringIO('\n'.join(lines)), 'jsonl'))
+
+    def test_error_report_names_each_bad_line(self):
+        result = self.import_jsonl(
+            self.row, '{not json', '[1, 2]',
+            {**self.row, 'external_id': ''},
+            {**self.row, 'external_id': 'feed-2', 'title': ''},
+        )
+        self.assertEqual((result.created, result.failed), (1, 4))
+        self.assertEqual([error['line'] for error in result.errors], [2, 3, 4, 5])
+        self.assertIn('external_id', result.errors[2]['errors'])
+        self.assertIn('title', result.errors[3]['errors'])
+
+    def test_csv_error_report_uses_file_lines(self):
+        feed = (
+            'external_id,title,company_name,location,description\n'
+            'feed-1,Engineer,Acme,Remote,Build\n'
+            'feed-2,,Acme,Remote,Build\n'
+        )
+        result = JobImporter().run(read_rows(io.StringIO(feed), 'csv'))
+        self.assertEqual(result.errors, [{'line': 3, 'errors': {'title': ['This field is required.']}}])
+
+    def test_error_report_is_capped(self):
+        result = self.import_jsonl(*['{not json'] * (importer.MAX_REPORTED_ERRORS + 5))
+        self.assertEqual(result.failed, importer.MAX_REPORTED_ERRORS + 5)
+        self.assertEqual(len(result.errors), importer.MAX_REPORTED_ERRORS)
+
+    def test_missing_optional_field_is_cleared_on_update(self):
+        self.import_jsonl(self.row)
+        row = dict(self.row)
+        del row['salary_range']
+        self.assertEqual(self.import_jsonl(row).updated, 1)
+        self.assertIsNone(Job.objects.get(external_id='feed-1').salary_range)
+        self.assertEqual(self.import_jsonl(row).unchanged, 1)
+
+    def test_update_keeps_search_and_facets_in_step(self):
+        self.import_jsonl(self.row)
+        self.import_jsonl({**self.row, 'title': 'Designer', 'location': 'Berlin'})
+        self.assertEqual([job.title for job in search_jobs('designer', 10)], ['Designer'])
+        self.assertEqual(search_jobs('engineer', 10), [])
+        counts = dict(JobFacet.objects.filter(facet='location').values_list('value', 'count'))
+        self.assertEqual(counts.get('Remote', 0), 0)
+        self.assertEqual(counts['Berlin'], 1)
+
+    def test_concurrent_import_of_same_title_gets_next_slug(self):
+        # Another import commits the slug after this one has looked it up
+        Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build')
+        allocate = importer.allocate_slugs
+        lookups = []
+
+        def allocate_before_other_import(queryset, bases):
+            lookups.append(bases)
+            return allocate(queryset.none() if len(lookups) == 1 else queryset, bases)
+
+        with mock.patch.object(importer, 'allocate_slugs', allocate_before_other_import):
+            result = self.import_jsonl(self.row)
+        self.assertEqual((result.created, len(lookups)), (1, 2))
+        self.assertEqual(Job.objects.get(external_id='feed-1').slug, 'engineer-acme-2')
+
+
+class JobDetailCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = Job.objects.create(title='Engineer', company_name='Acme', location='Remote', description='Build')
+
+    def setUp(self):
+        # Entries outlive the rollback of earlier tests
+        cache.clear()
+        self.url = reverse('jobs:job_detail_api', args=[self.job.id])
+        # Warm the cache
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_saved_job_is_served_at_once(self):
+        self.job.title = 'Designer'
+        self.job.save()
+        self.assertEqual(self.client.get(self.url).json()['title'], 'Designer')
+
+    def test_deactivated_job_is_gone_at_once(self):
+        self.job.is_active = False
+        self.job.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_deleted_job_is_gone_at_once(self):
+        self.job.delete()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    @override_settings(JOB_DETAIL_LOCAL_CACHE_TIMEOUT=0)
+    def test_process_local_cache_expires_changes_made_elsewhere(self):
+        cache.clear()
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        # Deactivated without signals, as a save in another process looks from here
+        Job.objects.filter(id=self.job.id).update(is_active=False)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class FacetCountTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.jobs = [
+            Job.objects.create(
+                title='Engineer', company_name=company, location=location, description='Build', job_type=job_type
+            )
+            for company, location, job_type in (
+                ('Acme', 'Remote', 'Full-time'), ('Acme', 'Berlin', 'Contract'), ('Globex', 'Remote', 'Full-time'),
+            )
+        ]
+
+    def counts(self):
+        return set(JobFacet.objects.filter(count__gt=0).values_list('facet', 'value', 'count'))
+
+    def assertMatchesRebuild(self):
+        live = self.counts()
+        rebuild_facets()
+        self.assertEqual(live, self.counts())
+
+    def test_create_matches_rebuild(self):
+        Job.objects.create(
+            title='Designer', company_name='Initech', location='Berlin', description='Draw', job_type='Part-time'
+        )
+        self.assertMatchesRebuild()
+
+    def test_edit_matches_rebuild(self):
+        job = self.jobs[0]
+        job.location, job.company_name = 'Berlin', 'Globex'
+        job.save()
+        self.assertMatchesRebuild()
+
+    def test_toggle_active_matches_rebuild(self):
+        job = self.jobs[1]
+        job.is_active = False
+        job.save()
+        self.assertMatchesRebuild()
+        job.is_active = True
+        job.save()
+        self.assertMatchesRebuild()
+
+    def test_delete_matches_rebuild(self):
+        self.jobs[2].delete()
+        self.assertMatchesRebuild()
+
+
+class ServerTimingTests(TestCase):
+
+    def get(self):
+        return self.client.get(reverse('jobs:job_list_api'))
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1.0, SERVER_TIMING_HEADER=True)
+    def test_sampled_request_has_header(self):
+        self.assertIn('db;dur=', self.get()['Server-Timing'])
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0.0, SERVER_TIMING_HEADER=True)
+    def test_unsampled_request_has_no_header(self):
+        self.assertNotIn('Server-Timing', self.get())
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1.0, SERVER_TIMING_HEADER=False)
+    def test_header_can_be_withheld_from_clients(self):
+        self.assertNotIn('Server-Timing', self.get())
+
+
+class JobSearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.engineer = Job.objects.create(
+            title='Backend Engineer', company_name='Acme', location='Zürich', description='Build services'
+        )
+        cls.designer = Job.objects.create(
+            title='Product Designer', company_name='Globex', location='Remote', description='Draw screens'
+        )
+
+    def titles(self, query):
+        return [job.title for job in search_jobs(query, 10)]
+
+    def test_prefix_matches(self):
+        self.assertEqual(self.titles('engin'), ['Backend Engineer'])
+        self.assertEqual(self.titles('prod des'), ['Product Designer'])
+
+    @skipUnless(connection.vendor == 'sqlite', 'the FTS5 tokenizer folds diacritics')
+    def test_diacritics_are_folded(self):
+        self.assertEqual(self.titles('zurich'), ['Backend Engineer'])
+        self.assertEqual(self.titles('zürich'), ['Backend Engineer'])
+
+    def test_inactive_jobs_are_excluded(self):
+        self.designer.is_active = False
+        self.designer.save()
+        self.assertEqual(self.titles('designer'), [])
+
+    def test_index_follows_save_and_delete(self):
+        self.engineer.title = 'Data Scientist'
+        self.engineer.save()
+        self.assertEqual(self.titles('scientist'), ['Data Scientist'])
+        self.assertEqual(self.titles('backend'), [])
+        self.engineer.delete()
+        self.assertEqual(self.titles('scientist'), [])
+
+    def test_rebuild_indexes_missing_and_drops_stale_entries(self):
+        # Changed without signals, so the index is out of step until rebuilt
+        Job.objects.bulk_create([
+            Job(title='Site Reliability Engineer', company_name='Initech', location='Remote',
+                description='Keep things up', slug='site-reliability-engineer')
+        ])
+        Job.objects.filter(id=self.designer.id).update(is_active=False)
+        call_command('rebuild_job_index', batch_size=1, stdout=io.StringIO())
+        self.assertCountEqual(self.titles('engineer'), ['Backend Engineer', 'Site Reliability Engineer'])
+        self.assertEqual(get_search_backend().search_ids('designer', 10), [])
+
+    def test_rebuild_keeps_every_entry_searchable(self):
+        seen = []
+        index_batch = RebuildJobIndex._index_batch
+
+        def search_then_index(command, backend, batch):
+            seen.append(self.titles('designer'))
+            return index_batch(command, backend, batch)
+
+        with mock.patch.object(RebuildJobIndex, '_index_batch', search_then_index):
+            call_command('rebuild_job_index', batch_size=1, stdout=io.StringIO())
+        self.assertEqual(seen, [['Product Designer']] * 2)
@@ -5,6 +5,10 @@ app_name = 'jobs'
 
 urlpatterns = [
     path('', views.home_view, name='home'),
+    path('api/jobs/', views.job_list_api, name='job_list_api'),
+    path('api/jobs/search/', views.job_search_api, name='job_search_api'),
+    path('api/jobs/import/', views.import_jobs_api, name='import_jobs_api'),
     path('api/job/<int:job_id>/', views.job_detail_api, name='job_detail_api'),
+    path('api/job/cache-stats/', views.job_cache_stats_api, name='job_cache_stats_api'),
     path('create/', views.create_job_view, name='create_job'),
 ]
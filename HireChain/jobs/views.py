@@ -1,40 +1,184 @@
-from django.shortcuts import render, get_object_or_404
+import io
+import os
+
+from django.conf import settings
+from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponse, Http404
+from django.utils.timesince import timesince
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_cookie
+from .caching import job_detail_cache
+from .conditional import (
+    conditional_view, feed_validators, job_version_validators, has_pending_messages, visitor_fingerprint,
+)
 from .models import Job
+from .facets import FACETS, facet_groups, get_facet_counts, selected_filters
 from .forms import JobForm
+from .importer import IMPORT_FORMATS, JobImporter, read_rows
+from .pagination import KeysetPaginator, InvalidCursor
+from .search import search_jobs
+
+
+def _get_page_size(request):
+    """Read the optional ``limit`` parameter, clamped to the configured maximum"""
+    try:
+        limit = int(request.GET.get('limit', settings.JOBS_PAGE_SIZE))
+    except ValueError:
+        limit = settings.JOBS_PAGE_SIZE
+    return max(1, min(limit, settings.JOBS_PAGE_SIZE_MAX))
+
+
+def _serialize_job_card(job):
+    """Fields needed to render a job card in the feed"""
+    return {
+        'id': job.id,
+        'title': job.title,
+        'company': job.company_name,
+        'location': job.location,
+        'job_type': job.job_type,
+        'posted_date': job.posted_date.isoformat(),
+        'posted_ago': timesince(job.posted_date),
+    }
+
+
+def _home_validators(request):
+    """
+    Feed validators, made per visitor because the page also renders the
+    CSRF token and, when logged in, the navbar and unread badge. Pages
+    carrying flash messages or issuing a new CSRF token are never revalidated.
+    """
+    if has_pending_messages(request):
+        return None
+    fingerprint = visitor_fingerprint(request)
+    if fingerprint is None:
+        return None
+    etag, last_modified = feed_validators(Job.objects.filter(is_active=True))
+    return f'{etag}-{fingerprint}', last_modified
 
 
+def _feed_api_validators(request):
+    return feed_validators(Job.objects.filter(is_active=True))
+
+
+def _job_detail_validators(request, job_id):
+    version = job_detail_cache.get_version(job_id)
+    if version is None:
+        return None
+    return job_version_validators(job_id, version)
+
+
+@vary_on_cookie
+@cache_control(private=True)
+@conditional_view(_home_validators)
 def home_view(request):
     """
-    Display all active jobs on home page.
+    Display the first page of active jobs on home page.
+    Further pages are loaded through ``job_list_api`` as the user scrolls.
+    The feed can be filtered by location, job type and company, with facet
+    counts read from the JobFacet summary table.
+    With a ``q`` parameter the best full-text matches are shown instead.
     Follows Single Responsibility Principle - only handles home page display.
     """
-    jobs = Job.objects.filter(is_active=True)
-    return render(request, 'home.html', {'jobs': jobs})
+    query = request.GET.get('q', '').strip()
+    if query:
+        jobs = search_jobs(query, settings.JOBS_SEARCH_LIMIT)
+        return render(request, 'home.html', {'jobs': jobs, 'query': query})
 
+    filters = selected_filters(request.GET)
+    paginator = KeysetPaginator(Job.objects.filter(is_active=True, **filters), settings.JOBS_PAGE_SIZE)
+    try:
+        jobs, next_cursor = paginator.get_page(request.GET.get('cursor'))
+    except InvalidCursor:
+        jobs, next_cursor = paginator.get_page()
+    return render(request, 'home.html', {
+        'jobs': jobs,
+        'next_cursor': next_cursor,
+        'filters': filters,
+        'facet_groups': facet_groups(request.GET, get_facet_counts()),
+    })
 
-def job_detail_api(request, job_id):
+
+@conditional_view(_feed_api_validators)
+def job_list_api(request):
     """
-    API endpoint to get job details for modal.
-    Follows Interface Segregation Principle - specific API for job details.
+    API endpoint returning one keyset page of active jobs for infinite scroll.
+    Accepts the same location, job_type and company filters as the home
+    page; the first page also carries the facet counts.
+    Follows Interface Segregation Principle - specific API for the job feed.
     """
-    job = get_object_or_404(Job, id=job_id, is_active=True)
+    cursor = request.GET.get('cursor')
+    paginator = KeysetPaginator(
+        Job.objects.filter(is_active=True, **selected_filters(request.GET)), _get_page_size(request)
+    )
+    try:
+        jobs, next_cursor = paginator.get_page(cursor)
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
+
     data = {
-        'id': job.id,
-        'title': job.title,
-        'company': job.company_name,
-        'location': job.location,
-        'description': job.description,
-        'requirements': job.requirements,
-        'responsibilities': job.responsibilities,
-        'salary_range': job.salary_range,
-        'job_type': job.job_type,
-        'posted_date': job.posted_date.strftime('%B %d, %Y'),
+        'jobs': [_serialize_job_card(job) for job in jobs],
+        'next_cursor': next_cursor,
     }
+    if not cursor:
+        counts = get_facet_counts()
+        data['facets'] = {
+            param: [{'value': value, 'count': count} for value, count in counts[field]]
+            for param, field, _ in FACETS
+        }
     return JsonResponse(data)
 
 
+@conditional_view(_feed_api_validators)
+def job_search_api(request):
+    """
+    API endpoint for ranked full-text search over active jobs.
+    Follows Interface Segregation Principle - specific API for job search.
+    """
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'error': 'Missing search query'}, status=400)
+
+    limit = _get_page_size(request)
+    try:
+        offset = max(0, int(request.GET.get('offset', 0)))
+    except ValueError:
+        offset = 0
+
+    # Ask for one extra row to learn whether another page exists
+    jobs = search_jobs(query, limit + 1, offset)
+    next_offset = offset + limit if len(jobs) > limit else None
+    return JsonResponse({
+        'jobs': [_serialize_job_card(job) for job in jobs[:limit]],
+        'next_offset': next_offset,
+    })
+
+
+@conditional_view(_job_detail_validators)
+def job_detail_api(request, job_id):
+    """
+    API endpoint to get job details for modal.
+    Follows Interface Segregation Principle - specific API for job details.
+    """
+    payload, hit = job_detail_cache.get(job_id)
+    if payload is None:
+        raise Http404('No active job matches the given query.')
+    response = HttpResponse(payload, content_type='application/json')
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
+
+
+@login_required
+def job_cache_stats_api(request):
+    """
+    API endpoint exposing job detail cache hit/miss counters (admin only).
+    Counters are per process.
+    """
+    if not request.user.is_admin_user():
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    return JsonResponse({'job_detail': job_detail_cache.stats.as_dict()})
+
+
 @login_required
 def create_job_view(request):
     """
@@ -47,10 +191,40 @@ def create_job_view(request):
     if request.method == 'POST':
         form = JobForm(request.POST)
         if form.is_valid():
-            form.save()
+            job = form.save()
+            job_detail_cache.warm(job)
             return JsonResponse({'success': True, 'message': 'Job posted successfully!'})
         else:
             return JsonResponse({'success': False, 'errors': form.errors}, status=400)
     
     form = JobForm()
     return render(request, 'jobs/create_job.html', {'form': form})
+
+
+@login_required
+def import_jobs_api(request):
+    """
+    Import a partner feed of job postings (admin only).
+    Expects a CSV or JSON Lines upload in ``file``; rows are upserted on
+    ``external_id`` and the response lists the counts and row errors.
+    """
+    if not request.user.is_admin_user():
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    if request.method != 'POST' or 'file' not in request.FILES:
+        return JsonResponse({'error': 'Upload a feed as "file"'}, status=400)
+    
+    upload = request.FILES['file']
+    import_format = request.POST.get('format') or os.path.splitext(upload.name)[1].lstrip('.').lower()
+    if import_format not in IMPORT_FORMATS:
+        return JsonResponse({'error': 'Format must be csv or jsonl'}, status=400)
+    
+    # Decode the upload line by line rather than reading it into memory
+    stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+    try:
+        result = JobImporter().run(read_rows(stream, import_format))
+    except UnicodeDecodeError:
+        return JsonResponse({'error': 'The feed must be UTF-8 encoded'}, status=400)
+    finally:
+        stream.detach()
+    return JsonResponse({'success': True, **result.as_dict()})
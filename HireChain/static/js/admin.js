@@ -8,13 +8,20 @@ let currentApplicationId = null;
 
 // Applicant Modal Management
 class ApplicantModalManager {
+    // Candidates after the open one whose details are fetched ahead of time
+    static PREFETCH_COUNT = 10;
+    
     constructor() {
         this.modal = document.getElementById('applicantModal');
+        this.nextBtn = document.getElementById('nextApplicantBtn');
+        this.details = new Map();
+        this.pending = new Map();
     }
     
     async openModal(applicationId) {
         currentApplicationId = applicationId;
         await this.loadApplicationDetails(applicationId);
+        this.prefetchAfter(applicationId);
     }
     
     closeModal() {
@@ -24,18 +31,61 @@ class ApplicantModalManager {
         currentApplicationId = null;
     }
     
+    visibleRowIds() {
+        return [...document.querySelectorAll('.applicant-row')]
+            .filter(row => row.style.display !== 'none')
+            .map(row => Number(row.dataset.applicationId));
+    }
+    
+    nextApplicationId(applicationId) {
+        const ids = this.visibleRowIds();
+        const index = ids.indexOf(applicationId);
+        return index >= 0 && index + 1 < ids.length ? ids[index + 1] : null;
+    }
+    
+    openNext() {
+        const nextId = this.nextApplicationId(currentApplicationId);
+        if (nextId !== null) this.openModal(nextId);
+    }
+    
+    // Fetch the details of every id not already loaded or on its way, in one request
+    prefetch(ids) {
+        const missing = ids.filter(id => !this.details.has(id) && !this.pending.has(id));
+        if (missing.length) {
+            const request = fetch(`/applications/api/applications/details/?ids=${missing.join(',')}`)
+                .then(response => {
+                    if (!response.ok) throw new Error('Failed to load application details');
+                    return response.json();
+                })
+                .then(data => {
+                    Object.values(data.applications).forEach(application => {
+                        this.details.set(application.id, application);
+                    });
+                })
+                .finally(() => missing.forEach(id => this.pending.delete(id)));
+            missing.forEach(id => this.pending.set(id, request));
+        }
+        return Promise.all(ids.map(id => this.pending.get(id)).filter(Boolean));
+    }
+    
+    prefetchAfter(applicationId) {
+        const ids = this.visibleRowIds();
+        const start = applicationId === null ? 0 : ids.indexOf(applicationId) + 1;
+        const upcoming = ids.slice(start, start + ApplicantModalManager.PREFETCH_COUNT);
+        this.prefetch(upcoming).catch(error => console.error('Error prefetching applications:', error));
+    }
+    
+    async getDetails(applicationId) {
+        if (!this.details.has(applicationId)) {
+            await this.prefetch([applicationId]);
+        }
+        if (!this.details.has(applicationId)) throw new Error('Application not found');
+        return this.details.get(applicationId);
+    }
+    
     async loadApplicationDetails(applicationId) {
         try {
-            const csrfToken = getCookie('csrftoken');
-            const response = await fetch(`/applications/api/application/${applicationId}/`, {
-                headers: {
-                    'X-CSRFToken': csrfToken
-                }
-            });
-            
-            if (!response.ok) throw new Error('Failed to load application details');
-            
-            const application = await response.json();
+            const application = await this.getDetails(applicationId);
             
             // Populate modal
             document.getElementById('detailFullName').textContent = application.full_name;
@@ -85,6 +135,10 @@ class ApplicantModalManager {
                 downloadCheckbox.parentElement.style.display = 'none';
             }
             
+            if (this.nextBtn) {
+                this.nextBtn.disabled = this.nextApplicationId(applicationId) === null;
+            }
+            
             // Show modal
             this.modal.classList.add('show');
             
@@ -121,6 +175,9 @@ class StatusUpdateManager {
             if (data.success) {
                 alert('Status updated successfully!');
                 
+                const cached = applicantModalManager.details.get(currentApplicationId);
+                if (cached) cached.status = newStatus;
+                
                 // Update status badge in table
                 const row = document.querySelector(`tr[data-application-id="${currentApplicationId}"]`);
                 if (row) {
@@ -131,7 +188,7 @@ class StatusUpdateManager {
                         // Add new status class
                         statusBadge.classList.add(`badge-${newStatus}`);
                         // Update text
-                        statusBadge.textContent = newStatus.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
+                        statusBadge.textContent = applicationsTable.statusLabel(newStatus);
                     }
                 }
                 
@@ -146,17 +203,235 @@ class StatusUpdateManager {
     }
 }
 
+// Applications Table (keyset-paginated list loaded from the API)
+class AdminApplicationsTable {
+    constructor() {
+        this.table = document.getElementById('applicantsTable');
+        this.body = document.getElementById('applicantsTableBody');
+        this.loadMoreBtn = document.getElementById('loadMoreApplicantsBtn');
+        this.shown = document.getElementById('applicantsShown');
+        this.jobChip = document.getElementById('jobFilterChip');
+        const labels = document.getElementById('statusLabels');
+        this.statusLabels = labels ? JSON.parse(labels.textContent) : {};
+        
+        const params = new URLSearchParams(window.location.search);
+        this.filters = {
+            status: params.get('status') || '',
+            search: params.get('search') || '',
+            job: this.table ? this.table.dataset.jobId : '',
+            sort: params.get('sort') || 'applied_date',
+            dir: params.get('dir') || 'desc',
+        };
+        this.nextCursor = null;
+        this.rowCount = 0;
+        this.loading = false;
+        // Each reload gets a new generation so late pages of an old query are dropped
+        this.generation = 0;
+        this.init();
+    }
+    
+    init() {
+        if (!this.table) return;
+        
+        this.table.querySelectorAll('th.sortable').forEach(th => {
+            th.addEventListener('click', () => {
+                const sort = th.dataset.sort;
+                const dir = this.filters.sort === sort && this.filters.dir === 'desc' ? 'asc' : 'desc';
+                this.update({ sort, dir });
+            });
+        });
+        
+        if (this.loadMoreBtn) {
+            this.loadMoreBtn.addEventListener('click', () => this.loadNextPage());
+            // Load the next page automatically when the button scrolls into view
+            if ('IntersectionObserver' in window) {
+                new IntersectionObserver((entries) => {
+                    if (entries.some(entry => entry.isIntersecting)) {
+                        this.loadNextPage();
+                    }
+                }, { rootMargin: '400px' }).observe(this.loadMoreBtn);
+            }
+        }
+        
+        const statusFilter = document.getElementById('statusFilter');
+        if (statusFilter) {
+            statusFilter.addEventListener('change', () => this.update({ status: statusFilter.value }));
+        }
+        
+        const clearJob = document.getElementById('clearJobFilter');
+        if (clearJob) {
+            clearJob.addEventListener('click', () => this.filterByJob('', ''));
+        }
+        
+        this.reload();
+    }
+    
+    statusLabel(status) {
+        return this.statusLabels[status] || status;
+    }
+    
+    update(changes) {
+        Object.assign(this.filters, changes);
+        
+        // Keep the URL and export links in step with the filters
+        const params = new URLSearchParams();
+        Object.entries(this.filters).forEach(([key, value]) => {
+            if (value) params.set(key, value);
+        });
+        history.replaceState(null, '', `${window.location.pathname}?${params}`);
+        document.querySelectorAll('.export-link').forEach(link => {
+            const exportParams = new URLSearchParams({
+                format: link.dataset.format,
+                status: this.filters.status,
+                search: this.filters.search,
+                job: this.filters.job,
+            });
+            link.href = `${link.pathname}?${exportParams}`;
+        });
+        
+        this.reload();
+    }
+    
+    filterByJob(jobId, title) {
+        if (this.jobChip) {
+            document.getElementById('jobFilterTitle').textContent = title;
+            this.jobChip.hidden = !jobId;
+        }
+        this.update({ job: jobId ? String(jobId) : '' });
+    }
+    
+    reload() {
+        this.generation += 1;
+        this.loading = false;
+        this.nextCursor = null;
+        this.rowCount = 0;
+        this.body.innerHTML = '';
+        
+        this.table.querySelectorAll('th.sortable').forEach(th => {
+            th.classList.toggle('sort-asc', th.dataset.sort === this.filters.sort && this.filters.dir === 'asc');
+            th.classList.toggle('sort-desc', th.dataset.sort === this.filters.sort && this.filters.dir === 'desc');
+        });
+        
+        this.loadPage(null);
+    }
+    
+    loadNextPage() {
+        if (this.nextCursor) this.loadPage(this.nextCursor);
+    }
+    
+    async loadPage(cursor) {
+        if (this.loading) return;
+        this.loading = true;
+        const generation = this.generation;
+        
+        const params = new URLSearchParams();
+        Object.entries(this.filters).forEach(([key, value]) => {
+            if (value) params.set(key, value);
+        });
+        if (cursor) params.set('cursor', cursor);
+        
+        try {
+            const response = await fetch(`${this.table.dataset.apiUrl}?${params}`);
+            if (!response.ok) throw new Error('Failed to load applications');
+            const data = await response.json();
+            if (generation !== this.generation) return;
+            
+            const column = Object.fromEntries(data.columns.map((name, index) => [name, index]));
+            data.rows.forEach(row => this.body.appendChild(this.renderRow(row, column, data.jobs)));
+            this.rowCount += data.rows.length;
+            this.nextCursor = data.next_cursor;
+            // Reviewers usually start at the top, so have those details ready
+            if (!cursor) applicantModalManager.prefetchAfter(null);
+            
+            if (this.rowCount === 0) {
+                this.body.innerHTML = '<tr><td colspan="7" class="no-data">No applications found.</td></tr>';
+            }
+            this.shown.textContent = this.rowCount ? `Showing ${this.rowCount} application${this.rowCount === 1 ? '' : 's'}` : '';
+            this.loadMoreBtn.hidden = !this.nextCursor;
+        } catch (error) {
+            console.error('Error loading applications:', error);
+        } finally {
+            if (generation === this.generation) this.loading = false;
+        }
+    }
+    
+    renderRow(row, column, jobs) {
+        const id = row[column.id];
+        const fullName = row[column.full_name];
+        const jobId = row[column.job_id];
+        const status = row[column.status];
+        
+        const tr = document.createElement('tr');
+        tr.className = 'applicant-row';
+        tr.dataset.applicationId = id;
+        tr.addEventListener('click', () => viewApplicationDetails(id));
+        
+        const cell = (content) => {
+            const td = document.createElement('td');
+            if (content instanceof Node) {
+                td.appendChild(content);
+            } else {
+                td.textContent = content;
+            }
+            tr.appendChild(td);
+            return td;
+        };
+        
+        cell(fullName);
+        
+        const jobLink = document.createElement('a');
+        jobLink.href = '#';
+        jobLink.className = 'job-link';
+        jobLink.textContent = jobs[jobId];
+        jobLink.addEventListener('click', (e) => {
+            e.preventDefault();
+            e.stopPropagation();
+            this.filterByJob(jobId, jobs[jobId]);
+        });
+        cell(jobLink);
+        
+        cell(row[column.email]);
+        cell(row[column.phone]);
+        
+        if (row[column.has_resume]) {
+            const handle = fullName.toLowerCase().replace(/ /g, '');
+            const resumeLink = document.createElement('a');
+            resumeLink.href = `/applications/api/application/${id}/resume/`;
+            resumeLink.target = '_blank';
+            resumeLink.className = 'resume-link';
+            resumeLink.textContent = `in/${handle.length > 10 ? handle.slice(0, 9) + '\u2026' : handle}`;
+            resumeLink.addEventListener('click', (e) => e.stopPropagation());
+            cell(resumeLink);
+        } else {
+            cell('-');
+        }
+        
+        const badge = document.createElement('span');
+        badge.className = `badge badge-${status}`;
+        badge.textContent = this.statusLabel(status);
+        cell(badge);
+        
+        cell(new Date(row[column.applied_date]).toLocaleDateString());
+        return tr;
+    }
+}
+
 // Search and Filter Management
 class AdminSearchManager {
     constructor() {
         this.searchInput = document.getElementById('searchInput');
-        this.filterBtn = document.getElementById('filterBtn');
         this.init();
     }
     
     init() {
         if (this.searchInput) {
             this.searchInput.addEventListener('input', () => this.filterTable());
+            // Enter runs the indexed server-side search across all applications
+            this.searchInput.addEventListener('keydown', (e) => {
+                if (e.key === 'Enter') {
+                    applicationsTable.update({ search: this.searchInput.value.trim() });
+                }
+            });
         }
     }
     
@@ -180,11 +455,16 @@ class AdminSearchManager {
 
 // Global functions for onclick handlers
 let applicantModalManager;
+let applicationsTable;
 
 function viewApplicationDetails(applicationId) {
     applicantModalManager.openModal(applicationId);
 }
 
+function openNextApplicant() {
+    applicantModalManager.openNext();
+}
+
 function closeApplicantModal() {
     applicantModalManager.closeModal();
 }
@@ -212,5 +492,6 @@ function getCookie(name) {
 // Initialize
 document.addEventListener('DOMContentLoaded', () => {
     applicantModalManager = new ApplicantModalManager();
+    applicationsTable = new AdminApplicationsTable();
     new AdminSearchManager();
 });
@@ -97,6 +97,10 @@ class ApplicationFormManager {
     constructor() {
         this.form = document.getElementById('applicationForm');
         this.submitBtn = document.getElementById('submitApplicationBtn');
+        // Sent with every attempt at one submission, so a retry after a
+        // dropped response cannot create a second application
+        this.idempotencyKey = null;
+        this.keyJobId = null;
         this.init();
     }
     
@@ -116,6 +120,10 @@ class ApplicationFormManager {
         
         const formData = new FormData(this.form);
         const csrfToken = getCookie('csrftoken');
+        if (!this.idempotencyKey || this.keyJobId !== currentJobId) {
+            this.idempotencyKey = crypto.randomUUID();
+            this.keyJobId = currentJobId;
+        }
         
         // Disable submit button
         this.submitBtn.disabled = true;
@@ -126,7 +134,8 @@ class ApplicationFormManager {
                 method: 'POST',
                 body: formData,
                 headers: {
-                    'X-CSRFToken': csrfToken
+                    'X-CSRFToken': csrfToken,
+                    'Idempotency-Key': this.idempotencyKey
                 }
             });
             
@@ -136,6 +145,7 @@ class ApplicationFormManager {
                 alert('Application submitted successfully!');
                 modalManager.closeApplicationModal();
                 this.form.reset();
+                this.idempotencyKey = null;
             } else {
                 let errorMessage = 'Failed to submit application:\n';
                 if (data.errors) {
@@ -157,6 +167,118 @@ class ApplicationFormManager {
     }
 }
 
+// Job Feed Management (keyset-paginated infinite scroll)
+class JobFeedManager {
+    constructor() {
+        this.grid = document.getElementById('jobsGrid');
+        this.moreContainer = document.getElementById('jobsFeedMore');
+        this.nextCursor = this.grid ? this.grid.dataset.nextCursor : '';
+        this.loading = false;
+        this.init();
+    }
+    
+    init() {
+        if (!this.grid || !this.moreContainer) return;
+        
+        const loadMoreBtn = document.getElementById('loadMoreJobsBtn');
+        if (loadMoreBtn) {
+            loadMoreBtn.addEventListener('click', (e) => {
+                e.preventDefault();
+                this.loadNextPage();
+            });
+        }
+        
+        // Load the next page automatically when the button scrolls into view
+        if ('IntersectionObserver' in window) {
+            this.observer = new IntersectionObserver((entries) => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    this.loadNextPage();
+                }
+            }, { rootMargin: '400px' });
+            this.observer.observe(this.moreContainer);
+        }
+    }
+    
+    async loadNextPage() {
+        if (this.loading || !this.nextCursor) return;
+        this.loading = true;
+        
+        try {
+            // Keep the active facet filters; search results are not paginated
+            const params = new URLSearchParams(window.location.search);
+            params.delete('q');
+            params.set('cursor', this.nextCursor);
+            const response = await fetch(`/api/jobs/?${params}`);
+            if (!response.ok) throw new Error('Failed to load jobs');
+            
+            const data = await response.json();
+            data.jobs.forEach(job => this.grid.appendChild(this.renderJobCard(job)));
+            this.nextCursor = data.next_cursor;
+            
+            if (!this.nextCursor) {
+                if (this.observer) this.observer.disconnect();
+                this.moreContainer.remove();
+            }
+        } catch (error) {
+            console.error('Error loading jobs:', error);
+        } finally {
+            this.loading = false;
+        }
+    }
+    
+    renderJobCard(job) {
+        const card = document.createElement('div');
+        card.className = 'job-card';
+        card.dataset.jobId = job.id;
+        card.innerHTML = `
+            <div class="job-card-header">
+                <div class="company-icon">${this.companyIcon(job.company)}</div>
+                <div class="job-info">
+                    <h3 class="job-title"></h3>
+                    <p class="company-name"></p>
+                </div>
+            </div>
+            <div class="job-card-body">
+                <div class="job-location">
+                    <svg width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
+                        <path d="M8 0a6 6 0 00-6 6c0 4.5 6 10 6 10s6-5.5 6-10a6 6 0 00-6-6zm0 8a2 2 0 110-4 2 2 0 010 4z"/>
+                    </svg>
+                    <span class="job-location-text"></span>
+                </div>
+                <p class="job-posted"></p>
+            </div>
+            <button class="btn btn-primary btn-block view-details-btn">View Details</button>
+        `;
+        
+        // Use textContent for user-supplied values
+        card.querySelector('.job-title').textContent = job.title;
+        card.querySelector('.company-name').textContent = job.company;
+        card.querySelector('.job-location-text').textContent = job.location;
+        card.querySelector('.job-posted').textContent = `Posted ${job.posted_ago} ago`;
+        card.querySelector('.view-details-btn').addEventListener('click', () => viewJobDetails(job.id));
+        return card;
+    }
+    
+    companyIcon(company) {
+        if (company === 'Innovate Corp') {
+            return `<svg width="40" height="40" viewBox="0 0 40 40" fill="none">
+                <rect width="40" height="40" rx="8" fill="#4F46E5"/>
+                <path d="M12 28V12H16V28H12ZM20 28V12H24V28H20Z" fill="white"/>
+            </svg>`;
+        }
+        if (company === 'Global Tech') {
+            return `<svg width="40" height="40" viewBox="0 0 40 40" fill="none">
+                <rect width="40" height="40" rx="8" fill="#2563EB"/>
+                <path d="M20 10L12 18H16V30H24V18H28L20 10Z" fill="white"/>
+            </svg>`;
+        }
+        return `<svg width="40" height="40" viewBox="0 0 40 40" fill="none">
+            <rect width="40" height="40" rx="8" fill="#7C3AED"/>
+            <circle cx="20" cy="20" r="8" fill="white"/>
+        </svg>`;
+    }
+}
+
 // Global functions for onclick handlers
 let modalManager;
 
@@ -196,4 +318,5 @@ function getCookie(name) {
 document.addEventListener('DOMContentLoaded', () => {
     modalManager = new JobModalManager();
     new ApplicationFormManager();
+    new JobFeedManager();
 });
@@ -8,6 +8,10 @@ class NotificationManager {
         this.notificationList = document.getElementById('notificationList');
         this.notificationBadge = document.getElementById('notificationBadge');
         this.markAllReadBtn = document.getElementById('markAllReadBtn');
+        this.notifications = [];
+        this.count = 0;
+        this.lastId = 0;
+        this.seenIds = new Set();
         
         if (this.notificationBtn) {
             this.init();
@@ -42,13 +46,8 @@ class NotificationManager {
             }
         });
         
-        // Load notifications on page load
-        this.loadNotifications();
-        
-        // Refresh notifications every 30 seconds
-        setInterval(() => {
-            this.loadNotifications();
-        }, 30000);
+        // Load notifications on page load, then listen for new ones
+        this.loadNotifications().then(() => this.subscribe());
     }
     
     async loadNotifications() {
@@ -57,13 +56,70 @@ class NotificationManager {
             if (!response.ok) throw new Error('Failed to load notifications');
             
             const data = await response.json();
-            this.updateBadge(data.count);
-            this.renderNotifications(data.notifications);
+            this.notifications = data.notifications;
+            this.count = data.count;
+            this.notifications.forEach(n => {
+                this.seenIds.add(n.id);
+                this.lastId = Math.max(this.lastId, n.id);
+            });
+            this.updateBadge(this.count);
+            this.renderNotifications(this.notifications);
         } catch (error) {
             console.error('Error loading notifications:', error);
         }
     }
     
+    subscribe() {
+        // Server-Sent Events push new notifications as they are created
+        if (window.EventSource) {
+            const source = new EventSource(`/applications/api/notifications/stream/?last_id=${this.lastId}`);
+            source.addEventListener('notification', (e) => {
+                this.addNotification(JSON.parse(e.data));
+            });
+            // The stream answers 204 when the server cannot stream (WSGI),
+            // and EventSource then closes for good instead of reconnecting
+            source.addEventListener('error', () => {
+                if (source.readyState === EventSource.CLOSED) {
+                    this.longPoll();
+                }
+            });
+        } else {
+            this.longPoll();
+        }
+    }
+    
+    async longPoll() {
+        // Fallback for browsers without EventSource or servers that cannot stream.
+        // The server says how long to wait before the next request: nothing
+        // when it long-polls, the poll interval when it answers at once
+        while (true) {
+            try {
+                const response = await fetch(`/applications/api/notifications/poll/?last_id=${this.lastId}`);
+                if (!response.ok) throw new Error('Failed to poll notifications');
+                
+                const data = await response.json();
+                data.notifications.forEach(n => this.addNotification(n));
+                if (data.retry) {
+                    await new Promise(resolve => setTimeout(resolve, data.retry));
+                }
+            } catch (error) {
+                console.error('Error polling notifications:', error);
+                await new Promise(resolve => setTimeout(resolve, 5000));
+            }
+        }
+    }
+    
+    addNotification(notification) {
+        // Ids can arrive out of order, so skip repeats rather than lower ids
+        if (this.seenIds.has(notification.id)) return;
+        this.seenIds.add(notification.id);
+        this.lastId = Math.max(this.lastId, notification.id);
+        this.notifications = [notification, ...this.notifications].slice(0, 10);
+        this.count += 1;
+        this.updateBadge(this.count);
+        this.renderNotifications(this.notifications);
+    }
+    
     updateBadge(count) {
         if (count > 0) {
             this.notificationBadge.textContent = count > 99 ? '99+' : count;
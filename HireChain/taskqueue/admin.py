@@ -0,0 +1,22 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    """
+    Task queue admin interface.
+    Follows Single Responsibility Principle.
+    """
+    list_display = ['name', 'status', 'attempts', 'max_attempts', 'run_at', 'created_at']
+    list_filter = ['status', 'name']
+    readonly_fields = ['locked_by', 'locked_until', 'last_error', 'created_at']
+    actions = ['retry_tasks']
+
+    @admin.action(description='Retry selected tasks')
+    def retry_tasks(self, request, queryset):
+        updated = queryset.exclude(status=Task.RUNNING).update(
+            status=Task.PENDING, attempts=0, run_at=timezone.now(), locked_by='', locked_until=None
+        )
+        self.message_user(request, f'{updated} task(s) queued for retry.')
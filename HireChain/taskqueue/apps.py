@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TaskqueueConfig(AppConfig):
+    name = 'taskqueue'
+
+    def ready(self):
+        # Register the handlers defined in each app's tasks.py
+        autodiscover_modules('tasks')
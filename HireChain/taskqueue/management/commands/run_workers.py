@@ -0,0 +1,55 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from taskqueue.worker import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        'Run background task workers on a thread pool. Claims are safe across '
+        'processes, so start several copies to use more CPU cores.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=settings.TASK_QUEUE_WORKERS,
+            help=f'Number of tasks run concurrently (default: {settings.TASK_QUEUE_WORKERS})'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=None,
+            help='Number of tasks claimed per query (default: twice the thread count)'
+        )
+        parser.add_argument(
+            '--visibility-timeout', type=int, default=settings.TASK_QUEUE_VISIBILITY_TIMEOUT,
+            help='Seconds a claimed task stays hidden from other workers '
+                 f'(default: {settings.TASK_QUEUE_VISIBILITY_TIMEOUT})'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit once the queue has no ready tasks instead of polling'
+        )
+
+    def handle(self, *args, **options):
+        threads = options['threads']
+        worker = Worker(
+            concurrency=threads,
+            batch_size=options['batch_size'] or threads * 2,
+            visibility_timeout=options['visibility_timeout'],
+            poll_interval=settings.TASK_QUEUE_POLL_INTERVAL,
+            retry_delay=settings.TASK_QUEUE_RETRY_DELAY,
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write('Stopping after the current batch...')
+            worker.stop()
+
+        signal.signal(signal.SIGINT, shutdown)
+        signal.signal(signal.SIGTERM, shutdown)
+
+        self.stdout.write(f'Worker {worker.worker_id} running with {threads} thread(s)')
+        worker.run(once=options['once'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {worker.processed} task(s), {worker.failed} failed'
+        ))
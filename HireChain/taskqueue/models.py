@@ -0,0 +1,49 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """
+    A unit of background work waiting in the database-backed queue.
+    Successful tasks are deleted; tasks that run out of attempts stay
+    behind with status 'failed' and their last error.
+    Follows Single Responsibility Principle - only stores queue state.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (FAILED, 'Failed'),
+    ]
+
+    name = models.CharField(max_length=200)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'task_queue'
+        ordering = ['run_at', 'id']
+        indexes = [
+            # Ready tasks, oldest first
+            models.Index(
+                fields=['run_at', 'id'], name='task_pending_idx', condition=Q(status='pending')
+            ),
+            # Claimed tasks whose visibility timeout may have expired
+            models.Index(
+                fields=['locked_until'], name='task_running_idx', condition=Q(status='running')
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
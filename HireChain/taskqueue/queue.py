@@ -0,0 +1,84 @@
+import uuid
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+
+
+class LeaseLost(Exception):
+    """Raised when a task was reclaimed by another worker while running."""
+
+
+def _claimable(now):
+    """Pending tasks that are due, and running tasks whose lease has expired"""
+    return (
+        Q(status=Task.PENDING, run_at__lte=now)
+        | Q(status=Task.RUNNING, locked_until__lt=now)
+    )
+
+
+def claim(worker_id, batch_size, visibility_timeout):
+    """
+    Lease up to ``batch_size`` tasks to ``worker_id`` for ``visibility_timeout``
+    seconds and return them. A leased task is invisible to other workers
+    until it is completed, failed, or its lease runs out, at which point it
+    is handed out again.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ready = Task.objects.filter(status=Task.PENDING, run_at__lte=now).order_by('run_at', 'id')
+        expired = Task.objects.filter(status=Task.RUNNING, locked_until__lt=now).order_by('locked_until')
+        if connection.features.has_select_for_update_skip_locked:
+            ready = ready.select_for_update(skip_locked=True)
+            expired = expired.select_for_update(skip_locked=True)
+
+        ids = list(ready.values_list('id', flat=True)[:batch_size])
+        if len(ids) < batch_size:
+            ids += expired.values_list('id', flat=True)[:batch_size - len(ids)]
+        if not ids:
+            return []
+
+        # Re-checking the condition keeps a task from being leased twice
+        # when workers race for the same rows without row locks (SQLite)
+        token = f'{worker_id}:{uuid.uuid4().hex[:12]}'
+        Task.objects.filter(_claimable(now), id__in=ids).update(
+            status=Task.RUNNING,
+            locked_by=token,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+            attempts=F('attempts') + 1,
+        )
+        return list(Task.objects.filter(locked_by=token, status=Task.RUNNING))
+
+
+def complete(task):
+    """
+    Remove a finished task from the queue. Completing it again while the
+    lease is still valid does nothing. Raises LeaseLost if the lease
+    expired and another worker may have taken the task over, so the caller
+    can roll back the work done under it.
+    """
+    deleted, _ = Task.objects.filter(id=task.id, locked_by=task.locked_by).delete()
+    if deleted:
+        return
+    # No other worker can claim the task before the lease runs out, so a
+    # row that is gone by then was completed under this lease already
+    lease_valid = task.locked_until is not None and task.locked_until > timezone.now()
+    if not lease_valid or Task.objects.filter(id=task.id).exists():
+        raise LeaseLost(task.id)
+
+
+def fail(task, error, retry_delay):
+    """
+    Record a failed attempt. The task is retried after an exponential
+    backoff based on ``retry_delay`` until it runs out of attempts.
+    """
+    fields = {'locked_by': '', 'locked_until': None, 'last_error': error}
+    if task.attempts >= task.max_attempts:
+        fields['status'] = Task.FAILED
+    else:
+        fields['status'] = Task.PENDING
+        fields['run_at'] = timezone.now() + timedelta(seconds=retry_delay * 2 ** (task.attempts - 1))
+    return Task.objects.filter(id=task.id, locked_by=task.locked_by).update(**fields)
@@ -0,0 +1,78 @@
+from django.conf import settings
+from django.db import transaction
+
+from .models import Task
+
+_registry = {}
+
+
+class UnknownTask(LookupError):
+    """Raised when a queued task names a handler that is not registered."""
+
+
+def task(name=None, max_attempts=None):
+    """
+    Register a function as a background task handler.
+    The function gains an ``enqueue(**kwargs)`` method that stores a call in
+    the queue, and ``enqueue_many(payloads)`` that stores one call per dict
+    of keyword arguments; arguments must be JSON serialisable.
+
+        @task()
+        def send_welcome_email(user_id):
+            ...
+
+        send_welcome_email.enqueue(user_id=user.id)
+    """
+    def decorator(func):
+        task_name = name or f'{func.__module__}.{func.__qualname__}'
+        _registry[task_name] = func
+        func.task_name = task_name
+        func.enqueue = lambda **kwargs: enqueue(task_name, max_attempts=max_attempts, **kwargs)
+        func.enqueue_many = lambda payloads: enqueue_many(task_name, payloads, max_attempts=max_attempts)
+        return func
+    return decorator
+
+
+def get_handler(name):
+    """Return the function registered as ``name``"""
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownTask(name) from None
+
+
+def enqueue(name, max_attempts=None, run_at=None, **kwargs):
+    """
+    Add a call to the queue and return the Task row.
+    The row is written in the caller's transaction, so the task only becomes
+    visible to workers if that transaction commits. With TASK_QUEUE_EAGER
+    the handler runs in-process once the transaction commits instead.
+    """
+    get_handler(name)
+    if settings.TASK_QUEUE_EAGER:
+        transaction.on_commit(lambda: get_handler(name)(**kwargs))
+        return None
+
+    fields = {'name': name, 'payload': kwargs}
+    fields['max_attempts'] = max_attempts or settings.TASK_QUEUE_MAX_ATTEMPTS
+    if run_at is not None:
+        fields['run_at'] = run_at
+    return Task.objects.create(**fields)
+
+
+def enqueue_many(name, payloads, max_attempts=None):
+    """
+    Add one call per dict of keyword arguments in ``payloads`` with a single
+    INSERT and return the Task rows. Behaves as ``enqueue`` otherwise.
+    """
+    handler = get_handler(name)
+    payloads = list(payloads)
+    if settings.TASK_QUEUE_EAGER:
+        for kwargs in payloads:
+            transaction.on_commit(lambda kwargs=kwargs: handler(**kwargs))
+        return []
+
+    max_attempts = max_attempts or settings.TASK_QUEUE_MAX_ATTEMPTS
+    return Task.objects.bulk_create([
+        Task(name=name, payload=kwargs, max_attempts=max_attempts) for kwargs in payloads
+    ])
@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from . import queue
+from .models import Task
+from .registry import enqueue, task
+
+calls = []
+
+
+@task(name='taskqueue.tests.record')
+def record(**kwargs):
+    calls.append(kwargs)
+
+
+class QueueTests(TestCase):
+
+    def setUp(self):
+        self.task = Task.objects.create(name=record.task_name, max_attempts=2)
+
+    def claim(self, worker_id='worker-a'):
+        return queue.claim(worker_id, batch_size=10, visibility_timeout=60)
+
+    def expire_lease(self):
+        Task.objects.filter(id=self.task.id).update(locked_until=timezone.now() - timedelta(seconds=1))
+
+    def test_leased_task_is_not_claimed_again(self):
+        self.assertEqual(self.claim(), [self.task])
+        self.assertEqual(self.claim('worker-b'), [])
+
+    def test_expired_lease_is_claimed_again(self):
+        [leased] = self.claim()
+        self.expire_lease()
+        [reclaimed] = self.claim('worker-b')
+        self.assertEqual(reclaimed.attempts, 2)
+        self.assertTrue(reclaimed.locked_by.startswith('worker-b:'))
+        with self.assertRaises(queue.LeaseLost):
+            queue.complete(leased)
+
+    def test_failed_task_is_retried_until_out_of_attempts(self):
+        [leased] = self.claim()
+        queue.fail(leased, 'boom', retry_delay=30)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, Task.PENDING)
+        self.assertGreater(self.task.run_at, timezone.now())
+        self.assertEqual(self.claim(), [])
+
+        Task.objects.filter(id=self.task.id).update(run_at=timezone.now())
+        [leased] = self.claim()
+        queue.fail(leased, 'boom again', retry_delay=30)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.last_error), (Task.FAILED, 'boom again'))
+        self.assertEqual(self.claim(), [])
+
+    def test_complete_is_idempotent(self):
+        [leased] = self.claim()
+        queue.complete(leased)
+        queue.complete(leased)
+        self.assertFalse(Task.objects.exists())
+
+    def test_complete_after_lease_expired_raises(self):
+        [leased] = self.claim()
+        leased.locked_until = timezone.now() - timedelta(seconds=1)
+        Task.objects.filter(id=self.task.id).delete()
+        with self.assertRaises(queue.LeaseLost):
+            queue.complete(leased)
+
+
+class EnqueueTests(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    @override_settings(TASK_QUEUE_EAGER=False)
+    def test_enqueue_stores_task(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            queued = enqueue(record.task_name, value=1)
+        self.assertEqual((queued.payload, queued.status), ({'value': 1}, Task.PENDING))
+        self.assertEqual(calls, [])
+
+    @override_settings(TASK_QUEUE_EAGER=True)
+    def test_eager_enqueue_runs_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertIsNone(record.enqueue(value=1))
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [{'value': 1}])
+        self.assertFalse(Task.objects.exists())
+
+    @override_settings(TASK_QUEUE_EAGER=False)
+    def test_enqueue_many_stores_one_task_per_payload(self):
+        record.enqueue_many({'value': value} for value in (1, 2))
+        self.assertEqual(
+            [task.payload for task in Task.objects.order_by('id')], [{'value': 1}, {'value': 2}]
+        )
+
+    @override_settings(TASK_QUEUE_EAGER=True)
+    def test_eager_enqueue_many_runs_each_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(record.enqueue_many([{'value': 1}, {'value': 2}]), [])
+        self.assertEqual(calls, [{'value': 1}, {'value': 2}])
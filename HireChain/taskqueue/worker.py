@@ -0,0 +1,75 @@
+import logging
+import os
+import socket
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, transaction
+
+from . import queue
+from .registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """
+    Pulls batches of tasks from the queue and runs them on a thread pool.
+    Each task runs in its own transaction together with its removal from
+    the queue, so its writes are kept only if it still holds the lease.
+    Follows Single Responsibility Principle - only schedules and runs tasks.
+    """
+
+    def __init__(self, concurrency, batch_size, visibility_timeout, poll_interval, retry_delay):
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.processed = 0
+        self.failed = 0
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Finish the current batch and exit"""
+        self._stop.set()
+
+    def run(self, once=False):
+        """
+        Process tasks until stopped. With ``once`` the worker exits as soon
+        as the queue has nothing ready instead of polling for more.
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='taskqueue') as pool:
+            while not self._stop.is_set():
+                tasks = queue.claim(self.worker_id, self.batch_size, self.visibility_timeout)
+                if not tasks:
+                    if once:
+                        break
+                    self._stop.wait(self.poll_interval)
+                    continue
+                for succeeded in pool.map(self.execute, tasks):
+                    if succeeded:
+                        self.processed += 1
+                    else:
+                        self.failed += 1
+        close_old_connections()
+
+    def execute(self, task):
+        """Run one leased task; returns True if it succeeded"""
+        close_old_connections()
+        try:
+            with transaction.atomic():
+                get_handler(task.name)(**task.payload)
+                queue.complete(task)
+            return True
+        except queue.LeaseLost:
+            logger.warning('Task %s (%s) outlived its lease; its work was rolled back', task.id, task.name)
+            return False
+        except Exception:
+            logger.exception('Task %s (%s) failed on attempt %s', task.id, task.name, task.attempts)
+            queue.fail(task, traceback.format_exc(), self.retry_delay)
+            return False
+        finally:
+            close_old_connections()